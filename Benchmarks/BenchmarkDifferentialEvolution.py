@@ -0,0 +1,83 @@
+from time import perf_counter
+import numpy as np
+
+from MetaPy import DifferentialEvolutionOptimizer , RealValueIndividuals
+
+class LegacyDifferentialEvolutionOptimizer(DifferentialEvolutionOptimizer):
+    """
+    Differential Evolution with the generation step
+    previous to the vectorized engine (Python loop
+    selection and fresh copies per generation). Used
+    as the baseline of the benchmark.
+    """
+
+    def MutationOperation(
+            self,
+        ) -> None:
+
+        self.MutatedPopulation = self.Population[np.random.randint(self.PopulationSize,size=self.PopulationSize)]
+        self.MutatedPopulation += self.ScalingFactor*(self.Population[np.random.randint(self.PopulationSize,size=self.PopulationSize)]-self.Population[np.random.randint(self.PopulationSize,size=self.PopulationSize)])
+
+    def CrossoverOperation(
+            self,
+        ) -> None:
+
+        CrossoverThreshold = np.random.random((self.PopulationSize,self.ProblemDimension)) <= self.CrossoverRate
+
+        IndexesMutated = np.random.randint(self.ProblemDimension,size=self.PopulationSize)
+        CrossoverThreshold[self.PopulationIndexes,IndexesMutated] = True
+
+        self.CrossoverPopulation = self.Population.copy()
+        self.CrossoverPopulation[CrossoverThreshold] = self.MutatedPopulation[CrossoverThreshold]
+
+    def SelectionOperation(
+            self,
+        ) -> None:
+
+        for index_individual in self.PopulationIndexes:
+            fitness_crossovered = self.FitnessCrossoverPopulation[index_individual]
+            fitness_population = self.FitnessValuesPopulation[index_individual]
+
+            if fitness_crossovered <= fitness_population:
+                crossovered_individual = self.CrossoverPopulation[index_individual]
+                self.Population[index_individual] = crossovered_individual
+                self.FitnessValuesPopulation[index_individual] = fitness_crossovered
+
+                if fitness_crossovered < self.OptimalValue:
+                    self.OptimalValue = fitness_crossovered
+                    self.OptimalIndividual = crossovered_individual
+
+def Sphere(
+        Population: np.ndarray,
+    ) -> np.ndarray:
+    """
+    Batch objective function used for the benchmark
+    """
+
+    return np.einsum('ij,ij->i',Population,Population)
+
+def GenerationsPerSecond(
+        Optimizer: DifferentialEvolutionOptimizer,
+        Iterations: int,
+        PopulationSize: int,
+    ) -> float:
+    """
+    Function for measuring the generations per
+    second of a Differential Evolution optimizer.
+    """
+
+    StartTime = perf_counter()
+    Optimizer(Iterations,PopulationSize,0.5,0.9)
+    return Iterations/(perf_counter()-StartTime)
+
+if __name__ == '__main__':
+    Iterations = 20
+    for PopulationSize , Dim in ((100,10),(1_000,100),(10_000,100)):
+        PopFunc = RealValueIndividuals(-100,100,Dim)
+
+        Legacy = LegacyDifferentialEvolutionOptimizer(Sphere,PopFunc,BatchObjective=True)
+        Vectorized = DifferentialEvolutionOptimizer(Sphere,PopFunc,BatchObjective=True)
+
+        legacy_speed = GenerationsPerSecond(Legacy,Iterations,PopulationSize)
+        vectorized_speed = GenerationsPerSecond(Vectorized,Iterations,PopulationSize)
+        print(f'{PopulationSize:>6}x{Dim:<4} legacy: {legacy_speed:10.2f} gen/s  vectorized: {vectorized_speed:10.2f} gen/s  speedup: {vectorized_speed/legacy_speed:6.2f}x')
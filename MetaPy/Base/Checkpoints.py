@@ -0,0 +1,170 @@
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+import os
+import numpy as np
+
+from typing import Any
+
+class CheckpointWriter:
+    def __init__(
+            self,
+            FileName: str,
+            Interval: int = 100,
+        ):
+        """
+        Class for writing the checkpoints of the
+        state of a search every `Interval` iterations.
+        Checkpoints are written by a background thread
+        (at most one at a time), so the search is only
+        blocked to copy its state or if the previous
+        checkpoint is still being written.
+
+        Parameters
+        ----------
+        FileName: str
+            Name of the checkpoint file (see `SaveState`)
+
+        Interval: int
+            Number of iterations between checkpoints, at least 1
+        """
+
+        if Interval < 1:
+            raise Exception(f'Interval must be at least 1, not {Interval}')
+
+        self.FileName = FileName
+        self.Interval = Interval
+
+        self.Executor = None
+        self.PendingWrite = None
+
+    def Spawn(
+            self,
+            *Key: int,
+        ) -> 'CheckpointWriter':
+        """
+        Method for deriving the writer of a copy
+        of the search identified by `Key`, so copies
+        running concurrently do not overwrite the
+        same checkpoint file. The key is appended
+        to the name of the file before its extension.
+
+        Parameters
+        ----------
+        Key: tuple[int]
+            Identifier of the copy (e.g. spawn key of its random generator)
+
+        Return
+        ------
+        ChildWriter: CheckpointWriter
+            Writer with the same interval and its own file
+        """
+
+        Root , Extension = os.path.splitext(self.FileName)
+        return CheckpointWriter(f'{Root}_{"_".join(map(str,Key))}{Extension}',self.Interval)
+
+    def Write(
+            self,
+            State: dict[str,Any],
+        ) -> None:
+        """
+        Method for writing a checkpoint in the
+        background after the previous one is written.
+
+        Parameters
+        ----------
+        State: dict[str,Any]
+            State of the search, it must not be modified after the call
+        """
+
+        self.Wait()
+        if self.Executor is None:
+            self.Executor = ThreadPoolExecutor(max_workers=1)
+
+        self.PendingWrite = self.Executor.submit(SaveState,self.FileName,State)
+
+    def Wait(
+            self,
+        ) -> None:
+        """
+        Method for waiting until the last
+        checkpoint is written.
+        """
+
+        if self.PendingWrite is not None:
+            PendingWrite , self.PendingWrite = self.PendingWrite , None
+            PendingWrite.result()
+
+    def Shutdown(
+            self,
+        ) -> None:
+        """
+        Method for waiting the last checkpoint
+        and releasing the background thread.
+        """
+
+        self.Wait()
+        if self.Executor is not None:
+            self.Executor.shutdown()
+            self.Executor = None
+
+    def __getstate__(
+            self,
+        ) -> dict:
+        State = self.__dict__.copy()
+        State['Executor'] = None
+        State['PendingWrite'] = None
+        return State
+
+def SaveState(
+        FileName: str,
+        State: dict[str,Any],
+    ) -> None:
+    """
+    Function for saving the state of a search
+    into an uncompressed `.npz` file. Arrays are
+    saved as they are and the other values are
+    pickled together. The file is written to a
+    temporary file and then renamed, so an
+    interrupted write never corrupts the last
+    checkpoint.
+
+    Parameters
+    ----------
+    FileName: str
+        Name of the checkpoint file
+
+    State: dict[str,Any]
+        State of the search
+    """
+
+    Arrays = {name: value for name , value in State.items() if isinstance(value,np.ndarray) and value.dtype != object}
+    Objects = {name: value for name , value in State.items() if name not in Arrays}
+    Arrays['__Objects__'] = np.frombuffer(pickle.dumps(Objects,protocol=pickle.HIGHEST_PROTOCOL),dtype=np.uint8)
+
+    with open(f'{FileName}.tmp','wb') as TemporaryFile:
+        np.savez(TemporaryFile,**Arrays)
+    os.replace(f'{FileName}.tmp',FileName)
+
+def LoadState(
+        FileName: str,
+    ) -> dict[str,Any]:
+    """
+    Function for loading the state of a
+    search saved by `SaveState`.
+
+    Parameters
+    ----------
+    FileName: str
+        Name of the checkpoint file
+
+    Return
+    ------
+    State: dict[str,Any]
+        State of the search
+    """
+
+    with np.load(FileName) as Arrays:
+        State = {name: Arrays[name] for name in Arrays.files if name != '__Objects__'}
+        State.update(pickle.loads(Arrays['__Objects__'].tobytes()))
+
+    return State
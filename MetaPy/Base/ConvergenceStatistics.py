@@ -0,0 +1,175 @@
+import numpy as np
+
+from .RandomGenerators import CreateRandomGenerator
+
+from typing import Sequence , TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+class ConvergenceStatistics:
+    def __init__(
+            self,
+            Iterations: int,
+            Quantiles: Sequence[float] = (0.05,0.25,0.5,0.75,0.95),
+            ReservoirSize: int = 256,
+            Targets: Sequence[float] = (),
+            RandomGenerator: np.random.Generator | int | None = None,
+        ):
+        """
+        Class for accumulating convergence statistics
+        of the snapshots of simulations as they are
+        generated, with memory independent of the
+        number of simulations:
+
+        - Mean and variance of each iteration (Welford's algorithm)
+        - Minimum and maximum of each iteration
+        - Approximate quantiles of each iteration, from a
+          uniform reservoir sample of `ReservoirSize` simulations
+        - Number of simulations reaching each target value
+          for the first time at each iteration (time-to-target)
+
+        Parameters
+        ----------
+        Iterations: int
+            `Iterations` parameter of the simulations
+
+        Quantiles: Sequence[float]
+            Quantiles (between 0 and 1) of the summary
+
+        ReservoirSize: int
+            Maximum number of simulations kept to approximate the quantiles
+
+        Targets: Sequence[float]
+            Target optimal values for the time-to-target counters
+
+        RandomGenerator: np.random.Generator | int | None
+            Random generator (or seed) of the reservoir sampling
+        """
+
+        self.Iterations = Iterations
+        self.Quantiles = tuple(Quantiles)
+        self.ReservoirSize = ReservoirSize
+        self.Targets = tuple(Targets)
+        self.RandomGenerator = CreateRandomGenerator(RandomGenerator)
+
+        self.Count = 0
+        self.Mean = np.zeros(Iterations+1)
+        self.SquaredDeviations = np.zeros(Iterations+1)
+        self.Minimum = np.full(Iterations+1,np.inf)
+        self.Maximum = np.full(Iterations+1,-np.inf)
+
+        self.Reservoir = []
+
+        self.TargetHits = np.zeros((len(self.Targets),Iterations+1),dtype=np.int64)
+
+    def Update(
+            self,
+            Snapshots: Sequence[float],
+        ) -> None:
+        """
+        Method for adding the (padded) snapshots
+        of a simulation to the statistics.
+
+        Parameters
+        ----------
+        Snapshots: Sequence[float]
+            Optimal values of the simulation at each iteration, of length `Iterations+1`
+        """
+
+        Snapshots = np.asarray(Snapshots,dtype=float)
+
+        self.Count += 1
+        Delta = Snapshots - self.Mean
+        self.Mean += Delta/self.Count
+        self.SquaredDeviations += Delta*(Snapshots-self.Mean)
+        np.minimum(self.Minimum,Snapshots,out=self.Minimum)
+        np.maximum(self.Maximum,Snapshots,out=self.Maximum)
+
+        if len(self.Reservoir) < self.ReservoirSize:
+            self.Reservoir.append(Snapshots.copy())
+        else:
+            index = self.RandomGenerator.integers(self.Count)
+            if index < self.ReservoirSize:
+                self.Reservoir[index] = Snapshots.copy()
+
+        for target_index , target in enumerate(self.Targets):
+            Reached = Snapshots <= target
+            if Reached.any():
+                self.TargetHits[target_index,Reached.argmax()] += 1
+
+    @property
+    def Variance(
+            self,
+        ) -> np.ndarray:
+        """
+        Sample variance of each iteration.
+        """
+
+        return self.SquaredDeviations/(self.Count-1) if self.Count > 1 else np.zeros(self.Iterations+1)
+
+    def SuccessRates(
+            self,
+        ) -> np.ndarray:
+        """
+        Method for getting the fraction of simulations
+        that reached each target until each iteration.
+
+        Return
+        ------
+        SuccessRates: np.ndarray
+            Success rates of shape `(Targets,Iterations+1)`
+        """
+
+        return np.cumsum(self.TargetHits,axis=1)/max(self.Count,1)
+
+    def Summary(
+            self,
+        ) -> dict[str,np.ndarray]:
+        """
+        Method for getting the summary curves
+        of the statistics by iteration.
+
+        Return
+        ------
+        Summary: dict[str,np.ndarray]
+            Curves 'Iteration', 'Mean', 'Std', 'Min', 'Max',
+            'Q<quantile>' and 'SuccessRate<target>'
+        """
+
+        Summary = {
+                'Iteration': np.arange(self.Iterations+1,dtype=np.int64),
+                'Mean': self.Mean.copy(),
+                'Std': np.sqrt(self.Variance),
+                'Min': self.Minimum.copy(),
+                'Max': self.Maximum.copy(),
+            }
+
+        if self.Reservoir:
+            QuantileCurves = np.quantile(self.Reservoir,self.Quantiles,axis=0)
+        else:
+            QuantileCurves = np.full((len(self.Quantiles),self.Iterations+1),np.nan)
+        for quantile , quantile_curve in zip(self.Quantiles,QuantileCurves):
+            Summary[f'Q{quantile}'] = quantile_curve
+
+        for target , success_rate in zip(self.Targets,self.SuccessRates()):
+            Summary[f'SuccessRate{target}'] = success_rate
+
+        return Summary
+
+    def ToTable(
+            self,
+        ) -> 'pa.Table':
+        """
+        Method for getting the summary curves
+        as a PyArrow table with a row per iteration.
+
+        Return
+        ------
+        TableSummary: pyarrow.Table
+            Table of `self.Summary`
+        """
+
+        import pyarrow as pa
+
+        return pa.table(self.Summary(),metadata={'Simulations': str(self.Count)})
@@ -0,0 +1,382 @@
+from concurrent.futures import Executor , ThreadPoolExecutor
+from contextlib import nullcontext
+from threading import Lock
+from os import cpu_count
+import numpy as np
+
+from typing import Callable , Sequence , Awaitable , Any , TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .StoppingCriteria import StoppingCriteria
+
+class SerialEvaluator:
+    """
+    Class for evaluating the fitness values of
+    several solutions/individuals serially in the
+    calling process. It is the default evaluator
+    of the Metaheuristics.
+    """
+
+    def __call__(
+            self,
+            ObjectiveFunction: Callable,
+            Solutions: Sequence[np.ndarray],
+            BatchObjective: bool = False,
+        ) -> np.ndarray:
+        """
+        Method for evaluating the fitness values
+        of a sequence of solutions/individuals.
+
+        Parameters
+        ----------
+        ObjectiveFunction: Callable
+            Function to evaluate. Takes a solution of shape `(Dim,)` or,
+            if `BatchObjective` is True, a population of shape `(Size,Dim)`
+
+        Solutions: Sequence[np.ndarray]
+            Solutions to evaluate. A list of solutions or an array of shape `(Size,Dim)`
+
+        BatchObjective: bool
+            If True, `ObjectiveFunction` is called once with all the solutions
+
+        Return
+        ------
+        FitnessValues: np.ndarray
+            Fitness values of the solutions of shape `(Size,)`
+        """
+
+        return EvaluateChunk(ObjectiveFunction,Solutions,BatchObjective)
+
+    def Shutdown(
+            self,
+        ) -> None:
+        """
+        Method for releasing the resources
+        (workers) of the evaluator.
+        """
+
+    def __enter__(
+            self,
+        ) -> 'SerialEvaluator':
+        return self
+
+    def __exit__(
+            self,
+            *ExceptionInfo,
+        ) -> None:
+        self.Shutdown()
+
+class PoolEvaluator(SerialEvaluator):
+    def __init__(
+            self,
+            NumWorkers: int | None = None,
+            ChunkSize: int | None = None,
+        ):
+        """
+        Base class for evaluating solutions/individuals
+        in a pool of workers. The pool is created at the
+        first evaluation and persists across generations
+        and calls of the Metaheuristic until `Shutdown`
+        is called. Solutions are sent to the workers in
+        chunks to amortize the communication cost.
+
+        It is required to implement `CreatePool` method.
+
+        Parameters
+        ----------
+        NumWorkers: int | None
+            Number of workers of the pool. If None, the number of CPUs is used
+
+        ChunkSize: int | None
+            Number of solutions per task. If None, the solutions are
+            split in four chunks per worker
+        """
+
+        self.NumWorkers = NumWorkers if NumWorkers is not None else (cpu_count() or 1)
+        self.ChunkSize = ChunkSize
+
+        self.Pool = None
+        self.PoolLock = Lock()
+
+    def __call__(
+            self,
+            ObjectiveFunction: Callable,
+            Solutions: Sequence[np.ndarray],
+            BatchObjective: bool = False,
+        ) -> np.ndarray:
+
+        NumSolutions = len(Solutions)
+        if NumSolutions == 0:
+            return np.empty(0,dtype=float)
+
+        ChunkSize = self.ChunkSize if self.ChunkSize is not None else -(-NumSolutions//(4*self.NumWorkers))
+        Chunks = [Solutions[index:index+ChunkSize] for index in range(0,NumSolutions,ChunkSize)]
+        if len(Chunks) == 1:
+            return EvaluateChunk(ObjectiveFunction,Chunks[0],BatchObjective)
+
+        Pool = self.GetPool()
+        FitnessChunks = Pool.map(EvaluateChunk,[ObjectiveFunction]*len(Chunks),Chunks,[BatchObjective]*len(Chunks))
+        return np.concatenate(list(FitnessChunks))
+
+    def GetPool(
+            self,
+        ) -> Executor:
+        """
+        Method for getting the persistent pool
+        of workers, creating it if it is required.
+
+        Return
+        ------
+        Pool: concurrent.futures.Executor
+            Pool of workers of the evaluator
+        """
+
+        with self.PoolLock:
+            if self.Pool is None:
+                self.Pool = self.CreatePool()
+            return self.Pool
+
+    def CreatePool(
+            self,
+        ) -> Executor:
+        """
+        Method for creating the pool of workers.
+
+        Return
+        ------
+        Pool: concurrent.futures.Executor
+            New pool of workers
+        """
+
+        raise Exception(f'CreatePool of {type(self).__name__} Not Implemented')
+
+    def Shutdown(
+            self,
+        ) -> None:
+
+        with self.PoolLock:
+            if self.Pool is not None:
+                self.Pool.shutdown()
+                self.Pool = None
+
+    def __getstate__(
+            self,
+        ) -> dict:
+        State = self.__dict__.copy()
+        State['Pool'] = None
+        del State['PoolLock']
+        return State
+
+    def __setstate__(
+            self,
+            State: dict,
+        ) -> None:
+        self.__dict__.update(State)
+        self.PoolLock = Lock()
+
+class ThreadPoolEvaluator(PoolEvaluator):
+    """
+    Class for evaluating solutions/individuals in a
+    persistent pool of threads. Suited for objective
+    functions that release the GIL (NumPy, I/O or
+    external simulations).
+    """
+
+    def CreatePool(
+            self,
+        ) -> Executor:
+        return ThreadPoolExecutor(self.NumWorkers)
+
+class ProcessPoolEvaluator(PoolEvaluator):
+    """
+    Class for evaluating solutions/individuals in a
+    persistent pool of processes. Suited for expensive
+    pure Python objective functions. `ObjectiveFunction`
+    must be picklable.
+    """
+
+    def CreatePool(
+            self,
+        ) -> Executor:
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(self.NumWorkers)
+
+class AsyncEvaluator:
+    def __init__(
+            self,
+            MaxConcurrency: int | None = None,
+            Timeout: float | None = None,
+            Penalty: float = np.inf,
+        ):
+        """
+        Class for evaluating solutions/individuals with 
+        a coroutine function (`async def`), e.g. a client 
+        of a scoring server, awaiting all the solutions of 
+        a population/neighborhood concurrently in the 
+        running event loop. It is used by `AsyncSearch` 
+        of the Metaheuristics.
+
+        An evaluation that exceeds `Timeout` gets the 
+        `Penalty` fitness value. When a stopping criterion 
+        fires during the evaluations (the `TimeLimit` ends or 
+        a fitness value reaches the `TargetFitness`), the 
+        pending evaluations are cancelled and also get the 
+        `Penalty`. Only the completed evaluations (neither 
+        timed out nor cancelled) are counted and selected 
+        by the search.
+
+        Parameters
+        ----------
+        MaxConcurrency: int | None
+            Maximum number of evaluations awaited at the same time. If None, 
+            there is no limit
+
+        Timeout: float | None
+            Maximum time (in seconds) of each evaluation. If None, there is no limit
+
+        Penalty: float
+            Fitness value of the evaluations that time out or are cancelled
+        """
+
+        self.MaxConcurrency = MaxConcurrency
+        self.Timeout = Timeout
+        self.Penalty = Penalty
+
+        self.TimedOut = 0
+        self.Cancelled = 0
+
+    async def __call__(
+            self,
+            ObjectiveFunction: Callable[[np.ndarray],Awaitable[float]],
+            Solutions: Sequence[np.ndarray],
+            Stopping: 'StoppingCriteria | None' = None,
+        ) -> tuple[np.ndarray,np.ndarray]:
+        """
+        Method for evaluating the fitness values 
+        of a sequence of solutions/individuals 
+        concurrently.
+
+        Parameters
+        ----------
+        ObjectiveFunction: Callable[[np.ndarray],Awaitable[float]]
+            Coroutine function to evaluate. Takes a solution of shape `(Dim,)`
+
+        Solutions: Sequence[np.ndarray]
+            Solutions to evaluate. A list of solutions or an array of shape `(Size,Dim)`
+
+        Stopping: StoppingCriteria | None
+            Stopping criteria of the search (after `Start`), checked while the 
+            solutions are evaluated. If None, all the solutions are awaited
+
+        Returns
+        -------
+        FitnessValues: np.ndarray
+            Fitness values of the solutions of shape `(Size,)`
+
+        Completed: np.ndarray
+            Mask of the evaluations that neither timed out nor were cancelled of shape `(Size,)`
+        """
+
+        import asyncio
+
+        FitnessValues = np.full(len(Solutions),self.Penalty,dtype=float)
+        Completed = np.zeros(len(Solutions),dtype=bool)
+        if len(Solutions) == 0:
+            return FitnessValues , Completed
+
+        Semaphore = asyncio.Semaphore(self.MaxConcurrency) if self.MaxConcurrency is not None else nullcontext()
+        Tasks = {asyncio.ensure_future(self.EvaluateSolution(ObjectiveFunction,Solutions[index],Semaphore)): index for index in range(len(Solutions))}
+        TargetFitness = Stopping.TargetFitness if Stopping is not None else None
+
+        Pending = set(Tasks)
+        try:
+            while Pending:
+                RemainingTime = Stopping.RemainingTime() if Stopping is not None else None
+                if RemainingTime == 0:
+                    break
+
+                Done , Pending = await asyncio.wait(Pending,timeout=RemainingTime,return_when=asyncio.FIRST_COMPLETED)
+                for task in Done:
+                    FitnessValues[Tasks[task]] , Completed[Tasks[task]] = task.result()
+                if TargetFitness is not None and any(Completed[Tasks[task]] and FitnessValues[Tasks[task]] <= TargetFitness for task in Done):
+                    break
+        finally:
+            for task in Pending:
+                task.cancel()
+            await asyncio.gather(*Tasks,return_exceptions=True)
+            self.Cancelled += len(Pending)
+
+        return FitnessValues , Completed
+
+    async def EvaluateSolution(
+            self,
+            ObjectiveFunction: Callable[[np.ndarray],Awaitable[float]],
+            Solution: np.ndarray,
+            Semaphore: Any,
+        ) -> tuple[float,bool]:
+        """
+        Method for evaluating a solution once the 
+        `Semaphore` of the concurrency limit is 
+        acquired, with the `Timeout` of the evaluator.
+
+        Parameters
+        ----------
+        ObjectiveFunction: Callable[[np.ndarray],Awaitable[float]]
+            Coroutine function to evaluate
+
+        Solution: np.ndarray
+            Solution of shape `(Dim,)`
+
+        Semaphore: Any
+            Async context manager that limits the concurrency
+
+        Returns
+        -------
+        FitnessValue: float
+            Fitness value of the solution, or `Penalty` if it timed out
+
+        Completed: bool
+            False if the evaluation timed out
+        """
+
+        import asyncio
+
+        async with Semaphore:
+            try:
+                return await asyncio.wait_for(ObjectiveFunction(Solution),self.Timeout) , True
+            except asyncio.TimeoutError:
+                self.TimedOut += 1
+                return self.Penalty , False
+
+def EvaluateChunk(
+        ObjectiveFunction: Callable,
+        Solutions: Sequence[np.ndarray],
+        BatchObjective: bool = False,
+    ) -> np.ndarray:
+    """
+    Function for evaluating a chunk of
+    solutions/individuals in the current
+    process or worker.
+
+    Parameters
+    ----------
+    ObjectiveFunction: Callable
+        Function to evaluate
+
+    Solutions: Sequence[np.ndarray]
+        Chunk of solutions to evaluate
+
+    BatchObjective: bool
+        If True, `ObjectiveFunction` is called once with the whole chunk
+
+    Return
+    ------
+    FitnessValues: np.ndarray
+        Fitness values of the chunk of shape `(Size,)`
+    """
+
+    if BatchObjective:
+        return np.asarray(ObjectiveFunction(Solutions),dtype=float).reshape(len(Solutions))
+
+    return np.fromiter(map(ObjectiveFunction,Solutions),dtype=float,count=len(Solutions))
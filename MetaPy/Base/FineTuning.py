@@ -1,12 +1,23 @@
 from functools import partial
+import numpy as np
 
-import optuna
+from .RandomGenerators import SpawnRandomGenerator , CopyWithRandomGenerator , SpawnKeys
+from .Simulations import PadSnapshots
+from .Checkpoints import LoadState
 
-from typing import Callable , Any
+from typing import Callable , Any , TYPE_CHECKING
 
-SuggestFloat = optuna.trial.Trial.suggest_float
-SuggestInt = optuna.trial.Trial.suggest_int
-SuggestCategorical = optuna.trial.Trial.suggest_categorical
+if TYPE_CHECKING:
+    import optuna
+    from .Evaluators import AsyncEvaluator
+
+# Optuna and joblib are imported when fine-tuning, so importing MetaPy does not load them
+
+Pruners = {
+        'median': 'MedianPruner',
+        'successive_halving': 'SuccessiveHalvingPruner',
+        'hyperband': 'HyperbandPruner',
+    }
 
 class MetaheuristicOptimizer:
     """
@@ -15,15 +26,55 @@ class MetaheuristicOptimizer:
     [Optuna](https://optuna.org/).
 
     It is required to implement `__call__` and (optionally) 
-    `FineTuningHyperparameters` methods.
+    `FineTuningHyperparameters` methods, and to have a 
+    `RandomGenerator` attribute (`np.random.Generator`) 
+    used to derive an independent random stream for 
+    each trial.
+
+    While a trial runs, the optimizers report their 
+    optimal value of each iteration through 
+    `ReportIteration`, so the trial can be pruned.
+
+    Optimizers with a `Checkpoints` writer save their 
+    state (`GetState`) through `WriteCheckpoint`, and 
+    `Resume` restores it (`SetState`) and continues the 
+    search with `Search`.
+
+    After each iteration, `NotifyIteration` records the 
+    iteration in the `Profile` of the search (if there is 
+    a `Profiler`) and calls the `Callbacks` (if any).
+
+    Optimizers with an ask/tell interface implement 
+    `Start` (initialize a search), `Ask` (candidates to 
+    evaluate), `Tell` (advance with their fitness values 
+    and set `Finished`), `EvaluateCandidates` and `Finish`, 
+    so the search can be driven by `Search`, by `AsyncSearch` 
+    (coroutine objective functions) or by any external 
+    evaluation (executor, batch system, event loop).
     """
 
+    Trial = None
+    ReportInterval = 1
+    Checkpoints = None
+    Profiler = None
+    Profile = None
+    Callbacks = None
+
     def FineTuningHyperparameters(
             self,
             Iterations: int,
             Hyperparameters: dict[str,tuple[str,tuple]],
             NumTrials: int = 10,
             NumJobs: int = 1,
+            Pruner: 'optuna.pruners.BasePruner | str | None' = None,
+            ReportInterval: int = 1,
+            Storage: 'optuna.storages.BaseStorage | str | None' = None,
+            StudyName: str = 'OptimizeHyperparameters',
+            NumProcesses: int = 1,
+            Repeats: int = 1,
+            Aggregation: str | float = 'mean',
+            RepeatJobs: int = 1,
+            Confidence: float | None = 0.95,
         ) -> dict[str,Any]:
         """
         Method for fine-tuning hyperparameters of 
@@ -45,17 +96,92 @@ class MetaheuristicOptimizer:
         NumJobs: int
             `n_jobs` parameter for `optuna.create_study`
 
+        Pruner: optuna.pruners.BasePruner | str | None
+            `pruner` parameter for `optuna.create_study`, or one of 'median', 
+            'successive_halving' and 'hyperband' for the Optuna pruner with 
+            default parameters. If None, trials are not pruned (nor reported)
+
+        ReportInterval: int
+            Number of iterations between intermediate values reported to the 
+            trial (and checks of pruning)
+
+        Storage: optuna.storages.BaseStorage | str | None
+            `storage` parameter for `optuna.create_study` (e.g. 'sqlite:///Study.db'), 
+            or the path of a journal file ending with '.log'. If the study already 
+            exists in the storage, it is resumed and only the remaining trials are 
+            run. If None, the study is kept in memory
+
+        StudyName: str
+            `study_name` parameter for `optuna.create_study`
+
+        NumProcesses: int
+            Number of local processes running the remaining trials of the study, 
+            split among them (each one with `NumJobs` threads). It requires a 
+            `Storage` shared by processes (not an `optuna.storages.InMemoryStorage`)
+
+        Repeats: int
+            Number of seeded runs of `self.__call__` of each trial. The results 
+            of the repeats are kept in the user attributes of the trials
+
+        Aggregation: str | float
+            Statistic of the repeats used as objective value: 'mean', 'median', 
+            a quantile (float between 0 and 1) or 'auc' (area under `Snapshots`)
+
+        RepeatJobs: int
+            Number of repeats of a trial run in parallel
+
+        Confidence: float | None
+            Confidence level to stop the repeats of a trial that can't beat the 
+            best trial, which is then pruned. Only used with the 'mean' and 'auc' 
+            aggregations. If None, all the repeats are run
+
         Return
         ------
         BestHyperparameters: dict[str,Any]
             A dict with the best hyperparameters for the Metaheuristic
         """
 
+        import optuna
+        from joblib import Parallel , delayed
+
+        StudyRandomGenerator , SamplerRandomGenerator = (SpawnRandomGenerator(self.RandomGenerator,SpawnKeys['FineTuning'],child) for child in range(2))
         HyperparameterSuggestFunctions = self.GetHyperparameterSuggestFunctions(Hyperparameters)
-        OptunaObjective = self.GetOptunaObjective(Iterations,HyperparameterSuggestFunctions)
 
-        study = optuna.create_study(study_name='OptimizeHyperparameters')
-        study.optimize(OptunaObjective,n_trials=NumTrials,n_jobs=NumJobs)
+        if Pruner is None:
+            Pruner , ReportInterval = optuna.pruners.NopPruner() , None
+        elif isinstance(Pruner,str):
+            Pruner = getattr(optuna.pruners,Pruners[Pruner])()
+
+        if NumProcesses > 1 and Storage is None:
+            raise Exception('A Storage is required for NumProcesses > 1')
+        if NumProcesses > 1 and isinstance(Storage,optuna.storages.InMemoryStorage):
+            raise Exception('An in-memory Storage can not be shared by NumProcesses > 1')
+
+        ArgsObjective = (Iterations,HyperparameterSuggestFunctions,StudyRandomGenerator,ReportInterval,Repeats,Aggregation,RepeatJobs,Confidence)
+
+        study = CreateStudy(StudyName,Storage,Pruner,SamplerRandomGenerator,0)
+        RemainingTrials = NumTrials - len(study.get_trials(deepcopy=False,states=FinishedStates()))
+
+        if RemainingTrials > 0 and NumProcesses == 1:
+            OptimizeStudy(self,study,NumTrials,RemainingTrials,NumJobs,*ArgsObjective)
+
+        elif RemainingTrials > 0:
+            Parallel(n_jobs=NumProcesses)(
+                    delayed(OptimizeStudyProcess)(
+                        self,
+                        StudyName,
+                        Storage,
+                        Pruner,
+                        SamplerRandomGenerator,
+                        worker,
+                        NumTrials,
+                        worker_trials,
+                        NumJobs,
+                        *ArgsObjective,
+                    )
+                    for worker , worker_trials in enumerate(SplitTrials(RemainingTrials,NumProcesses),1)
+                    if worker_trials > 0
+                )
 
         return study.best_params
     
@@ -80,18 +206,20 @@ class MetaheuristicOptimizer:
             A dict with the functions to suggest the hyperparameters for a trial
         """
 
+        import optuna
+
         HyperparameterSuggestFunctions = dict()
         for hyperparam_name , (type_suggest , params_suggest) in Hyperparameters.items():
             if type_suggest == 'float':
                 param_low , param_high = params_suggest
-                suggest_function = partial(SuggestFloat,name=hyperparam_name,low=param_low,high=param_high)
+                suggest_function = partial(optuna.trial.Trial.suggest_float,name=hyperparam_name,low=param_low,high=param_high)
 
             elif type_suggest == 'int':
                 param_low , param_high = params_suggest
-                suggest_function = partial(SuggestInt,name=hyperparam_name,low=param_low,high=param_high)
+                suggest_function = partial(optuna.trial.Trial.suggest_int,name=hyperparam_name,low=param_low,high=param_high)
 
             elif type_suggest == 'categorical':
-                suggest_function = partial(SuggestCategorical,name=hyperparam_name,choices=params_suggest)
+                suggest_function = partial(optuna.trial.Trial.suggest_categorical,name=hyperparam_name,choices=params_suggest)
 
             else:
                 raise Exception(f'{type_suggest} Not Implemented')
@@ -104,6 +232,12 @@ class MetaheuristicOptimizer:
             self,
             Iterations: int,
             HyperparameterSuggestFunctions: dict[str,Callable],
+            RandomGenerator: np.random.Generator | None = None,
+            ReportInterval: int | None = None,
+            Repeats: int = 1,
+            Aggregation: str | float = 'mean',
+            RepeatJobs: int = 1,
+            Confidence: float | None = 0.95,
         ) -> Callable:
         """
         Method for getting the `func` parameter 
@@ -118,6 +252,34 @@ class MetaheuristicOptimizer:
 
         HyperparameterSuggestFunctions: dict[str,Callable]
             Functions to suggest the hyperparameters for a trial
+
+        RandomGenerator: np.random.Generator | None
+            Parent generator of the random generators of the trials, 
+            each trial uses the child identified by its number. 
+            If None, it is spawned from `self.RandomGenerator`
+
+        ReportInterval: int | None
+            Number of iterations between intermediate values reported to 
+            the trial. If None, intermediate values are not reported. 
+            They are only reported if `Repeats` is 1
+
+        Repeats: int
+            Number of runs of `self.__call__` of each trial, each one with 
+            the child of the trial random generator identified by its number
+
+        Aggregation: str | float
+            Statistic of the repeats used as objective value: 'mean', 'median' 
+            or a quantile (float between 0 and 1) of the optimal values, or 
+            'auc' for the mean area under the `Snapshots` curves
+
+        RepeatJobs: int
+            `n_jobs` parameter for `joblib.Parallel` running the repeats
+
+        Confidence: float | None
+            Confidence level of the interval of the mean used to stop the repeats 
+            once the trial can't beat the incumbent (best trial), which is then 
+            pruned. Only used with the 'mean' and 'auc' aggregations. If None, 
+            all the repeats are run
         
         Return
         ------
@@ -125,8 +287,11 @@ class MetaheuristicOptimizer:
             Objective function for `optuna.Study`
         """
 
+        if RandomGenerator is None:
+            RandomGenerator = SpawnRandomGenerator(self.RandomGenerator,SpawnKeys['FineTuning'],0)
+
         def OptunaObjective(
-                Trial: optuna.trial.Trial,
+                Trial: 'optuna.trial.Trial',
             ) -> float:
             """
             Function used to evaluate the Metaheuristic 
@@ -140,18 +305,65 @@ class MetaheuristicOptimizer:
             Return
             ------
             OptimalVale: float
-                Optimal (best) value of `self.__call__`
+                Aggregation of the optimal (best) values of the repeats of `self.__call__`
             """
 
             SuggestedHyperparameters = self.GetSuggestedHyperparameters(Trial,HyperparameterSuggestFunctions)
-            Result = self.__call__(Iterations,**SuggestedHyperparameters)
-            return Result[1][-1]
+
+            if Repeats == 1:
+                Metaheuristic = CopyWithRandomGenerator(self,SpawnRandomGenerator(RandomGenerator,Trial.number))
+                if ReportInterval is not None:
+                    Metaheuristic.Trial = Trial
+                    Metaheuristic.ReportInterval = ReportInterval
+                OptimalValue , AreaUnderCurve = CallRepeat(Metaheuristic,Iterations,SuggestedHyperparameters)
+                return AggregateRepeats([OptimalValue],[AreaUnderCurve],Aggregation)
+
+            IncumbentValue = None
+            if Confidence is not None and Aggregation in ('mean','auc'):
+                try:
+                    IncumbentValue = Trial.study.best_value
+                except ValueError:
+                    pass
+
+            from joblib import Parallel , delayed
+
+            ResultRepeats = Parallel(n_jobs=RepeatJobs,return_as='generator')(
+                    delayed(CallRepeat)(
+                        CopyWithRandomGenerator(self,SpawnRandomGenerator(RandomGenerator,Trial.number,repeat)),
+                        Iterations,
+                        SuggestedHyperparameters,
+                    )
+                    for repeat in range(Repeats)
+                )
+
+            OptimalValues , AreasUnderCurve = [] , []
+            EarlyStopped = False
+            for optimal_value , area_under_curve in ResultRepeats:
+                OptimalValues.append(optimal_value)
+                AreasUnderCurve.append(area_under_curve)
+
+                if IncumbentValue is not None and len(OptimalValues) < Repeats:
+                    EarlyStopped = CannotImprove(AreasUnderCurve if Aggregation == 'auc' else OptimalValues,IncumbentValue,Confidence)
+                    if EarlyStopped:
+                        break
+            ResultRepeats.close()
+
+            Trial.set_user_attr('RepeatOptimalValues',OptimalValues)
+            Trial.set_user_attr('RepeatAreasUnderCurve',AreasUnderCurve)
+            Trial.set_user_attr('EarlyStopped',EarlyStopped)
+
+            if EarlyStopped:
+                import optuna
+
+                raise optuna.TrialPruned()
+
+            return AggregateRepeats(OptimalValues,AreasUnderCurve,Aggregation)
 
         return OptunaObjective
     
     def GetSuggestedHyperparameters(
             self,
-            Trial: optuna.trial.Trial,
+            Trial: 'optuna.trial.Trial',
             HyperparameterSuggestFunctions: dict[str,Callable],
         ) -> dict[str,Any]:
         """
@@ -176,4 +388,522 @@ class MetaheuristicOptimizer:
         for hyperparam_name , suggest_function in HyperparameterSuggestFunctions.items():
             SuggestedHyperparameters[hyperparam_name] = suggest_function(Trial)
 
-        return SuggestedHyperparameters
\ No newline at end of file
+        return SuggestedHyperparameters
+
+    def Search(
+            self,
+        ) -> tuple[np.ndarray,list[float]]:
+        """
+        Method for running the search from its 
+        current state until it is `Finished`, asking 
+        the candidates, evaluating them with 
+        `EvaluateCandidates` and telling their 
+        fitness values.
+
+        Returns
+        -------
+        OptimalIndividual: np.ndarray
+            Best solution/individual that was founded
+
+        Snapshots: list[float] 
+            List of the optimal values at each iteration/generation
+        """
+
+        while not self.Finished:
+            Candidates = self.Ask()
+            self.Tell(Candidates,self.EvaluateCandidates(Candidates))
+
+        return self.Finish()
+
+    async def AsyncSearch(
+            self,
+            Evaluator: 'AsyncEvaluator',
+        ) -> tuple[np.ndarray,list[float]]:
+        """
+        Method for running the search from its 
+        current state (after `Start` or `SetState`) 
+        like `Search`, but `ObjectiveFunction` is a 
+        coroutine function and the candidates of each 
+        `Ask` are awaited concurrently with `Evaluator`. 
+        The solutions are evaluated one by one, so 
+        `BatchObjective` and `MoveGain` are not used. 
+        Only the completed evaluations are counted and 
+        told, so the candidates whose evaluation was 
+        cancelled or timed out are never selected.
+
+        Parameters
+        ----------
+        Evaluator: AsyncEvaluator
+            Evaluator with the concurrency limit, timeout and penalty
+
+        Returns
+        -------
+        OptimalIndividual: np.ndarray
+            Best solution/individual that was founded
+
+        Snapshots: list[float] 
+            List of the optimal values at each iteration/generation
+        """
+
+        while not self.Finished:
+            Candidates = self.Ask()
+            FitnessValues , Completed = await Evaluator(self.ObjectiveFunction,Candidates,self.SearchStopping)
+            self.Tell(Candidates,FitnessValues,Completed)
+
+        return self.Finish()
+
+    def ReportIteration(
+            self,
+            Iteration: int,
+            OptimalValue: float,
+        ) -> None:
+        """
+        Method for reporting the optimal value of 
+        an iteration to the trial of the search 
+        (if any), every `ReportInterval` iterations. 
+        It raises `optuna.TrialPruned` if the trial 
+        should be pruned.
+
+        Parameters
+        ----------
+        Iteration: int
+            Number of the iteration (step of the intermediate value)
+
+        OptimalValue: float
+            Optimal (best) value found until the iteration
+        """
+
+        if self.Trial is None or Iteration % self.ReportInterval:
+            return
+
+        self.Trial.report(float(OptimalValue),Iteration)
+        if self.Trial.should_prune():
+            import optuna
+            raise optuna.TrialPruned()
+
+    def WriteCheckpoint(
+            self,
+            Iteration: int,
+        ) -> None:
+        """
+        Method for writing the state of the search 
+        every `Checkpoints.Interval` iterations (if 
+        there is a `Checkpoints` writer).
+
+        Parameters
+        ----------
+        Iteration: int
+            Number of iterations run
+        """
+
+        if self.Checkpoints is None or Iteration % self.Checkpoints.Interval:
+            return
+
+        self.Checkpoints.Write(self.GetState())
+
+    def WaitCheckpoints(
+            self,
+        ) -> None:
+        """
+        Method for waiting until the last checkpoint 
+        of the search is written (if any).
+        """
+
+        if self.Checkpoints is not None:
+            self.Checkpoints.Wait()
+
+    def Resume(
+            self,
+            FileName: str,
+        ) -> tuple[np.ndarray,list[float]]:
+        """
+        Method for resuming a search from a checkpoint, 
+        continuing its exact trajectory until its 
+        `Iterations` are run or a stopping criterion is met.
+
+        Parameters
+        ----------
+        FileName: str
+            Name of the checkpoint file
+
+        Returns
+        -------
+        OptimalIndividual: np.ndarray
+            Best solution/individual that was founded
+
+        Snapshots: list[float] 
+            List of the optimal values at each iteration/generation
+        """
+
+        self.SetState(LoadState(FileName))
+        self.StartProfile()
+        return self.Search()
+
+    def StartProfile(
+            self,
+        ) -> None:
+        """
+        Method for starting the `Profile` of a 
+        new search from `Profiler` (if any).
+        """
+
+        self.Profile = self.Profiler.Start() if self.Profiler is not None else None
+
+    def NotifyIteration(
+            self,
+            Iteration: int,
+            OptimalValue: float,
+            Diversity: Callable[[],float] | None = None,
+        ) -> bool:
+        """
+        Method for recording an iteration in the 
+        `Profile` (if any) and calling each of the 
+        `Callbacks` with the Metaheuristic and the 
+        number of the iteration. If a callback returns 
+        True, the search stops with `'Callback'` as 
+        `StopReason`. The time of the callbacks is 
+        added to the `'Callbacks'` phase of the `Profile`.
+
+        Parameters
+        ----------
+        Iteration: int
+            Number of the iteration
+
+        OptimalValue: float
+            Optimal (best) value found until the iteration
+
+        Diversity: Callable[[],float] | None
+            Function to compute the diversity of the population (or chains)
+
+        Return
+        ------
+        Stop: bool
+            True if a callback asked to stop the search
+        """
+
+        if self.Profile is not None:
+            self.Profile.Record(Iteration,OptimalValue,self.SearchStopping.Evaluations,Diversity)
+
+        if self.Callbacks is None:
+            return False
+
+        Stop = False
+        for callback in self.Callbacks:
+            Stop = bool(callback(self,Iteration)) or Stop
+
+        if self.Profile is not None:
+            self.Profile.Lap('Callbacks')
+
+        if Stop and self.SearchStopping.StopReason is None:
+            self.SearchStopping.StopReason = 'Callback'
+
+        return Stop
+
+    def GetState(
+            self,
+        ) -> dict[str,Any]:
+        """
+        Method for getting a copy of the state of 
+        the search, including the state of the 
+        random generator. It must be implemented by 
+        the Metaheuristic to write checkpoints.
+
+        Return
+        ------
+        State: dict[str,Any]
+            State of the search
+        """
+
+        raise Exception(f'GetState of {type(self).__name__} Not Implemented')
+
+    def SetState(
+            self,
+            State: dict[str,Any],
+        ) -> None:
+        """
+        Method for restoring the state of a search 
+        from `GetState`. It must be implemented by 
+        the Metaheuristic to resume checkpoints.
+
+        Parameters
+        ----------
+        State: dict[str,Any]
+            State of the search
+        """
+
+        raise Exception(f'SetState of {type(self).__name__} Not Implemented')
+
+def CreateStudy(
+        StudyName: str,
+        Storage: 'optuna.storages.BaseStorage | str | None',
+        Pruner: 'optuna.pruners.BasePruner',
+        SamplerRandomGenerator: np.random.Generator,
+        Worker: int,
+    ) -> 'optuna.study.Study':
+    """
+    Function for creating a study for fine-tuning, 
+    or loading it if it already exists in the storage.
+
+    Parameters
+    ----------
+    StudyName: str
+        `study_name` parameter for `optuna.create_study`
+
+    Storage: optuna.storages.BaseStorage | str | None
+        Storage of the study, or the path of a journal file ending with '.log'
+
+    Pruner: optuna.pruners.BasePruner
+        `pruner` parameter for `optuna.create_study`
+
+    SamplerRandomGenerator: np.random.Generator
+        Parent generator of the seeds of the samplers
+
+    Worker: int
+        Number of the process, used to seed its sampler
+
+    Return
+    ------
+    Study: optuna.study.Study
+        Study for fine-tuning
+    """
+
+    import optuna
+
+    if isinstance(Storage,str) and Storage.endswith('.log'):
+        Storage = optuna.storages.JournalStorage(optuna.storages.journal.JournalFileBackend(Storage))
+
+    Sampler = optuna.samplers.TPESampler(seed=int(SpawnRandomGenerator(SamplerRandomGenerator,Worker).integers(2**32)))
+
+    return optuna.create_study(study_name=StudyName,storage=Storage,sampler=Sampler,pruner=Pruner,load_if_exists=True)
+
+def OptimizeStudy(
+        Metaheuristic: MetaheuristicOptimizer,
+        Study: 'optuna.study.Study',
+        NumTrials: int,
+        RemainingTrials: int,
+        NumJobs: int,
+        *ArgsObjective,
+    ) -> None:
+    """
+    Function for running trials of a study until 
+    `RemainingTrials` are run or the study has 
+    `NumTrials` finished trials.
+
+    Parameters
+    ----------
+    Metaheuristic: MetaheuristicOptimizer
+        Metaheuristic to fine-tune
+
+    Study: optuna.study.Study
+        Study for fine-tuning
+
+    NumTrials: int
+        Total number of finished trials of the study
+
+    RemainingTrials: int
+        Maximum number of trials to run
+
+    NumJobs: int
+        `n_jobs` parameter for `optuna.study.Study.optimize`
+
+    *ArgsObjective
+        Parameters of `Metaheuristic.GetOptunaObjective`
+    """
+
+    import optuna
+
+    OptunaObjective = Metaheuristic.GetOptunaObjective(*ArgsObjective)
+    Study.optimize(
+            OptunaObjective,
+            n_trials=RemainingTrials,
+            n_jobs=NumJobs,
+            callbacks=[optuna.study.MaxTrialsCallback(NumTrials,states=FinishedStates())],
+        )
+
+def OptimizeStudyProcess(
+        Metaheuristic: MetaheuristicOptimizer,
+        StudyName: str,
+        Storage: 'optuna.storages.BaseStorage | str',
+        Pruner: 'optuna.pruners.BasePruner',
+        SamplerRandomGenerator: np.random.Generator,
+        Worker: int,
+        *Args,
+    ) -> None:
+    """
+    Function for running trials of a study from 
+    the storage in a worker process.
+
+    Parameters
+    ----------
+    Metaheuristic: MetaheuristicOptimizer
+        Metaheuristic to fine-tune
+
+    StudyName: str
+        Name of the study in the storage
+
+    Storage: optuna.storages.BaseStorage | str
+        Storage of the study, or the path of a journal file ending with '.log'
+
+    Pruner: optuna.pruners.BasePruner
+        Pruner of the study
+
+    SamplerRandomGenerator: np.random.Generator
+        Parent generator of the seeds of the samplers
+
+    Worker: int
+        Number of the process
+
+    *Args
+        Remaining parameters of `OptimizeStudy`
+    """
+
+    Study = CreateStudy(StudyName,Storage,Pruner,SamplerRandomGenerator,Worker)
+    OptimizeStudy(Metaheuristic,Study,*Args)
+
+def SplitTrials(
+        Trials: int,
+        NumProcesses: int,
+    ) -> list[int]:
+    """
+    Function for splitting trials among processes, 
+    so they run exactly `Trials` in total.
+
+    Parameters
+    ----------
+    Trials: int
+        Number of trials to run
+
+    NumProcesses: int
+        Number of processes
+
+    Return
+    ------
+    ProcessTrials: list[int]
+        Number of trials of each process
+    """
+
+    return [Trials//NumProcesses + (process < Trials%NumProcesses) for process in range(NumProcesses)]
+
+def FinishedStates() -> tuple['optuna.trial.TrialState',...]:
+    """
+    Function for getting the states of the 
+    trials counted as finished by fine-tuning.
+
+    Return
+    ------
+    States: tuple[optuna.trial.TrialState,...]
+        Complete and pruned states
+    """
+
+    import optuna
+
+    return (optuna.trial.TrialState.COMPLETE,optuna.trial.TrialState.PRUNED)
+
+def CallRepeat(
+        Metaheuristic: MetaheuristicOptimizer,
+        Iterations: int,
+        Hyperparameters: dict[str,Any],
+    ) -> tuple[float,float]:
+    """
+    Function for running a repeat of a trial.
+
+    Parameters
+    ----------
+    Metaheuristic: MetaheuristicOptimizer
+        Metaheuristic with the random generator of the repeat
+
+    Iterations: int
+        `Iterations` parameter of `Metaheuristic.__call__`
+
+    Hyperparameters: dict[str,Any]
+        Suggested hyperparameters of the trial
+
+    Return
+    ------
+    OptimalValue: float
+        Optimal (best) value of the repeat
+
+    AreaUnderCurve: float
+        Mean of the (padded) snapshots of the repeat
+    """
+
+    Snapshots = Metaheuristic(Iterations,**Hyperparameters)[1]
+    return float(Snapshots[-1]) , float(np.mean(PadSnapshots(Snapshots,Iterations)))
+
+def AggregateRepeats(
+        OptimalValues: list[float],
+        AreasUnderCurve: list[float],
+        Aggregation: str | float,
+    ) -> float:
+    """
+    Function for aggregating the results of 
+    the repeats of a trial.
+
+    Parameters
+    ----------
+    OptimalValues: list[float]
+        Optimal (best) values of the repeats
+
+    AreasUnderCurve: list[float]
+        Mean of the snapshots of the repeats
+
+    Aggregation: str | float
+        'mean', 'median', a quantile (float between 0 and 1) or 'auc'
+
+    Return
+    ------
+    AggregatedValue: float
+        Objective value of the trial
+    """
+
+    if Aggregation == 'mean':
+        return float(np.mean(OptimalValues))
+
+    elif Aggregation == 'median':
+        return float(np.median(OptimalValues))
+
+    elif Aggregation == 'auc':
+        return float(np.mean(AreasUnderCurve))
+
+    elif isinstance(Aggregation,float):
+        return float(np.quantile(OptimalValues,Aggregation))
+
+    raise Exception(f'{Aggregation} Not Implemented')
+
+def CannotImprove(
+        Values: list[float],
+        IncumbentValue: float,
+        Confidence: float,
+    ) -> bool:
+    """
+    Function for checking if the lower bound of 
+    the confidence interval (Student's t) of the 
+    mean of the values of the repeats is above the 
+    incumbent value (at least two repeats are required).
+
+    Parameters
+    ----------
+    Values: list[float]
+        Values of the repeats run
+
+    IncumbentValue: float
+        Objective value of the best trial
+
+    Confidence: float
+        Confidence level of the interval
+
+    Return
+    ------
+    CannotImprove: bool
+        True if the trial can't beat the incumbent
+    """
+
+    if len(Values) < 2:
+        return False
+
+    from scipy.stats import t
+
+    Quantile = t.ppf((1+Confidence)/2,len(Values)-1)
+    LowerBound = np.mean(Values) - Quantile*np.std(Values,ddof=1)/np.sqrt(len(Values))
+
+    return bool(LowerBound > IncumbentValue)
@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+import numpy as np
+
+from typing import Callable
+
+class FitnessCache:
+    def __init__(
+            self,
+            ObjectiveFunction: Callable[[np.ndarray],float],
+            MaxSize: int = 100_000,
+            Tolerance: float | None = None,
+        ):
+        """
+        Class for memoizing the fitness values of an
+        objective function with a bounded LRU (least
+        recently used) eviction. It is used as the
+        `ObjectiveFunction` of any Metaheuristic, useful
+        when neighborhoods overlap between iterations.
+
+        Parameters
+        ----------
+        ObjectiveFunction: Callable[[np.ndarray],float]
+            Function to memoize. Takes a solution of shape `(Dim,)` and returns its fitness value
+
+        MaxSize: int
+            Maximum number of fitness values kept in the cache
+
+        Tolerance: float | None
+            If given, real values of the solutions are quantized to multiples of
+            `Tolerance` before computing the key, so solutions closer than it share
+            the fitness value. If None, solutions are compared exactly
+        """
+
+        self.ObjectiveFunction = ObjectiveFunction
+        self.MaxSize = MaxSize
+        self.Tolerance = Tolerance
+
+        self.Cache = OrderedDict()
+        self.Hits = 0
+        self.Misses = 0
+        self.CacheLock = Lock()
+
+    def __call__(
+            self,
+            Solution: np.ndarray,
+        ) -> float:
+        """
+        Method for getting the fitness value of a
+        solution from the cache or, if it is missing,
+        from `ObjectiveFunction`.
+
+        Parameters
+        ----------
+        Solution: np.ndarray
+            Solution/individual of shape `(Dim,)`
+
+        Return
+        ------
+        FitnessValue: float
+            Fitness value of the solution
+        """
+
+        Key = self.SolutionKey(Solution)
+        with self.CacheLock:
+            FitnessValue = self.Cache.get(Key)
+            if FitnessValue is not None:
+                self.Cache.move_to_end(Key)
+                self.Hits += 1
+                return FitnessValue
+            self.Misses += 1
+
+        FitnessValue = self.ObjectiveFunction(Solution)
+
+        with self.CacheLock:
+            self.Cache[Key] = FitnessValue
+            if len(self.Cache) > self.MaxSize:
+                self.Cache.popitem(last=False)
+
+        return FitnessValue
+
+    def SolutionKey(
+            self,
+            Solution: np.ndarray,
+        ) -> bytes:
+        """
+        Method for computing the key of a solution
+        as a compact hash (digest) of its bytes.
+
+        Parameters
+        ----------
+        Solution: np.ndarray
+            Solution/individual of shape `(Dim,)`
+
+        Return
+        ------
+        Key: bytes
+            Digest of 16 bytes of the solution
+        """
+
+        Solution = np.asarray(Solution)
+        if self.Tolerance is not None:
+            Solution = np.round(Solution/self.Tolerance).astype(np.int64)
+
+        Digest = blake2b(digest_size=16)
+        Digest.update(Solution.dtype.str.encode())
+        Digest.update(np.asarray(Solution.shape,dtype=np.int64).tobytes())
+        Digest.update(np.ascontiguousarray(Solution).tobytes())
+
+        return Digest.digest()
+
+    @property
+    def HitRate(
+            self,
+        ) -> float:
+        """
+        Fraction of calls answered by the cache.
+        """
+
+        Calls = self.Hits + self.Misses
+        return self.Hits/Calls if Calls else 0.0
+
+    def Clear(
+            self,
+        ) -> None:
+        """
+        Method for removing all the fitness
+        values and resetting the counters.
+        """
+
+        with self.CacheLock:
+            self.Cache.clear()
+            self.Hits = 0
+            self.Misses = 0
+
+    def __len__(
+            self,
+        ) -> int:
+        return len(self.Cache)
+
+    def __getstate__(
+            self,
+        ) -> dict:
+        State = self.__dict__.copy()
+        del State['CacheLock']
+        return State
+
+    def __setstate__(
+            self,
+            State: dict,
+        ) -> None:
+        self.__dict__.update(State)
+        self.CacheLock = Lock()
@@ -0,0 +1,214 @@
+from time import perf_counter
+from copy import copy
+import json
+import numpy as np
+
+from typing import Callable , TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+class Profiler:
+    def __init__(
+            self,
+            Diversity: bool = False,
+        ):
+        """
+        Class for profiling the search of a Metaheuristic.
+        The time of each iteration is split into phases
+        with `Lap`, which adds the time since the previous
+        lap to a phase, so the phases partition the time of
+        the search without nesting. After each iteration,
+        `Record` saves the optimal value, the evaluations,
+        the acceptance rate and (optionally) the diversity
+        of the iteration.
+
+        The Metaheuristics only call it if they have a
+        `Profiler`, so it costs nothing when disabled.
+
+        Parameters
+        ----------
+        Diversity: bool
+            If True, the diversity of the population (or chains) is computed
+            and recorded at each iteration
+        """
+
+        self.Diversity = Diversity
+
+    def Start(
+            self,
+        ) -> 'Profiler':
+        """
+        Method for starting the profiling of a new
+        search. Returns a copy with its own state,
+        so concurrent searches do not share it.
+
+        Return
+        ------
+        Profile: Profiler
+            Copy of the profiler with the state of a new search
+        """
+
+        Profile = copy(self)
+        Profile.StartTime = perf_counter()
+        Profile.LapTime = Profile.StartTime
+        Profile.Phases = {}
+        Profile.Counters = {}
+        Profile.History = {
+                'Iteration': [],
+                'OptimalValue': [],
+                'Evaluations': [],
+                'Time': [],
+                'AcceptanceRate': [],
+                'Diversity': [],
+            }
+        Profile.RecordedAccepted , Profile.RecordedProposed = 0 , 0
+
+        return Profile
+
+    def Lap(
+            self,
+            Phase: str,
+        ) -> None:
+        """
+        Method for adding the time since the
+        previous lap to `Phase`.
+
+        Parameters
+        ----------
+        Phase: str
+            Name of the phase that just finished
+        """
+
+        LapTime = perf_counter()
+        self.Phases[Phase] = self.Phases.get(Phase,0.0) + LapTime - self.LapTime
+        self.LapTime = LapTime
+
+    def Count(
+            self,
+            Counter: str,
+            Value: int = 1,
+        ) -> None:
+        """
+        Method for increasing a counter. The
+        Metaheuristics count the `'Proposed'` and
+        `'Accepted'` solutions/moves of each iteration.
+
+        Parameters
+        ----------
+        Counter: str
+            Name of the counter
+
+        Value: int
+            Increase of the counter
+        """
+
+        self.Counters[Counter] = self.Counters.get(Counter,0) + Value
+
+    def Record(
+            self,
+            Iteration: int,
+            OptimalValue: float,
+            Evaluations: int,
+            Diversity: Callable[[],float] | None = None,
+        ) -> None:
+        """
+        Method for recording the state of the
+        search after an iteration. The time since
+        the last lap is added to the `'Bookkeeping'`
+        phase (snapshots, stopping criteria,
+        checkpoints, etc.).
+
+        Parameters
+        ----------
+        Iteration: int
+            Number of the iteration
+
+        OptimalValue: float
+            Optimal (best) value found until the iteration
+
+        Evaluations: int
+            Number of evaluations of the objective function so far
+
+        Diversity: Callable[[],float] | None
+            Function to compute the diversity of the population. It is
+            only called if `Diversity` is True
+        """
+
+        self.Lap('Bookkeeping')
+
+        Accepted , Proposed = self.Counters.get('Accepted',0) , self.Counters.get('Proposed',0)
+        IterationAccepted , IterationProposed = Accepted - self.RecordedAccepted , Proposed - self.RecordedProposed
+        self.RecordedAccepted , self.RecordedProposed = Accepted , Proposed
+
+        self.History['Iteration'].append(Iteration)
+        self.History['OptimalValue'].append(float(OptimalValue))
+        self.History['Evaluations'].append(Evaluations)
+        self.History['Time'].append(self.LapTime-self.StartTime)
+        self.History['AcceptanceRate'].append(IterationAccepted/IterationProposed if IterationProposed else np.nan)
+        self.History['Diversity'].append(Diversity() if self.Diversity and Diversity is not None else np.nan)
+
+        self.LapTime = perf_counter()
+
+    @property
+    def AcceptanceRate(
+            self,
+        ) -> float:
+        """
+        Rate of accepted solutions/moves of the
+        whole search, or NaN if nothing was proposed.
+        """
+
+        Proposed = self.Counters.get('Proposed',0)
+        return self.Counters.get('Accepted',0)/Proposed if Proposed else np.nan
+
+    def ToDict(
+            self,
+        ) -> dict:
+        """
+        Method for getting the profile of the
+        search as a dict.
+
+        Return
+        ------
+        Profile: dict
+            Dict with 'Time' (total), 'Phases' (time of each phase), 'Counters',
+            'Evaluations', 'EvaluationsPerSecond', 'AcceptanceRate' and 'History'
+            (columns of the records of each iteration)
+        """
+
+        Time = self.LapTime-self.StartTime
+        Evaluations = self.History['Evaluations'][-1] if self.History['Evaluations'] else 0
+
+        return {
+                'Time': Time,
+                'Phases': dict(self.Phases),
+                'Counters': dict(self.Counters),
+                'Evaluations': Evaluations,
+                'EvaluationsPerSecond': Evaluations/Time if Time > 0 else np.nan,
+                'AcceptanceRate': self.AcceptanceRate,
+                'History': {name: list(column) for name , column in self.History.items()},
+            }
+
+    def ToTable(
+            self,
+        ) -> 'pa.Table':
+        """
+        Method for getting the records of each
+        iteration as a PyArrow table. The time of
+        the phases and the counters are saved in the
+        schema metadata (as JSON).
+
+        Return
+        ------
+        TableProfile: pyarrow.Table
+            Table with a row per recorded iteration
+        """
+
+        import pyarrow as pa
+
+        Metadata = {
+                'Phases': json.dumps(self.Phases),
+                'Counters': json.dumps(self.Counters),
+            }
+        return pa.table(self.History,metadata=Metadata)
@@ -0,0 +1,185 @@
+from weakref import WeakKeyDictionary
+from copy import copy
+from inspect import signature
+import numpy as np
+
+from typing import Callable , Any
+
+# First key of the children derived by each use of a random generator, so their streams are never shared
+SpawnKeys = {
+        'Simulations': 0,
+        'Statistics': 1,
+        'Campaign': 2,
+        'FineTuning': 3,
+        'Benchmark': 4,
+    }
+
+def CreateRandomGenerator(
+        Seed: np.random.Generator | np.random.SeedSequence | int | None = None,
+    ) -> np.random.Generator:
+    """
+    Function for creating the random generator
+    of a Metaheuristic from a seed or an existing
+    generator.
+
+    Parameters
+    ----------
+    Seed: np.random.Generator | np.random.SeedSequence | int | None
+        Seed of the generator. If it is a `np.random.Generator`, it is used as is.
+        If None, fresh entropy is taken from the OS
+
+    Return
+    ------
+    RandomGenerator: np.random.Generator
+        Random generator based on `Seed`
+    """
+
+    return np.random.default_rng(Seed)
+
+def SpawnRandomGenerator(
+        RandomGenerator: np.random.Generator,
+        *Key: int,
+    ) -> np.random.Generator:
+    """
+    Function for deriving an independent child
+    random generator identified by `Key`. The same
+    parent and key always derive the same child, so
+    jobs scheduled in any order are reproducible.
+
+    The parent must not be spawned with
+    `np.random.Generator.spawn` method, otherwise
+    children could be shared. Each use of the
+    children starts its key with its entry of
+    `SpawnKeys`.
+
+    Parameters
+    ----------
+    RandomGenerator: np.random.Generator
+        Parent random generator
+
+    Key: tuple[int]
+        Identifier of the child (e.g. number of job or trial)
+
+    Return
+    ------
+    ChildRandomGenerator: np.random.Generator
+        Independent random generator for the job identified by `Key`
+    """
+
+    SeedSequence = RandomGenerator.bit_generator.seed_seq
+    ChildSeedSequence = np.random.SeedSequence(
+            SeedSequence.entropy,
+            spawn_key=(*SeedSequence.spawn_key,*Key),
+            pool_size=SeedSequence.pool_size,
+        )
+
+    return np.random.Generator(type(RandomGenerator.bit_generator)(ChildSeedSequence))
+
+def CopyWithRandomGenerator(
+        Metaheuristic: Any,
+        RandomGenerator: np.random.Generator,
+    ) -> Any:
+    """
+    Function for creating a shallow copy of a
+    Metaheuristic that uses its own random generator
+    and state, so several runs can be executed
+    concurrently without sharing random streams.
+    A `Checkpoints` writer is spawned with the key
+    of the random generator, so each copy writes
+    its own checkpoint file.
+
+    Parameters
+    ----------
+    Metaheuristic: Any
+        Metaheuristic to copy
+
+    RandomGenerator: np.random.Generator
+        Random generator of the copy
+
+    Return
+    ------
+    CopyMetaheuristic: Any
+        Shallow copy of the Metaheuristic with `RandomGenerator`
+    """
+
+    CopyMetaheuristic = copy(Metaheuristic)
+    CopyMetaheuristic.RandomGenerator = RandomGenerator
+    if getattr(Metaheuristic,'Checkpoints',None) is not None:
+        CopyMetaheuristic.Checkpoints = Metaheuristic.Checkpoints.Spawn(*RandomGenerator.bit_generator.seed_seq.spawn_key)
+
+    return CopyMetaheuristic
+
+# Cache of `AcceptsRandomGenerator`, which does not keep the functions alive
+RandomGeneratorParameters = WeakKeyDictionary()
+
+def AcceptsRandomGenerator(
+        Function: Callable,
+    ) -> bool:
+    """
+    Function for checking if a user function
+    (initializer, neighborhood generator, ...)
+    has an explicit `RandomGenerator` parameter.
+    The result is cached for the functions that
+    can be weakly referenced and hashed (bound
+    methods are cached by their function).
+
+    Parameters
+    ----------
+    Function: Callable
+        Function to check
+
+    Return
+    ------
+    Accepts: bool
+        True if `Function` has a `RandomGenerator` parameter
+    """
+
+    Key = getattr(Function,'__func__',Function)
+    try:
+        return RandomGeneratorParameters[Key]
+    except (KeyError,TypeError):
+        pass
+
+    try:
+        Accepts = 'RandomGenerator' in signature(Function).parameters
+    except (TypeError,ValueError):
+        Accepts = False
+
+    try:
+        RandomGeneratorParameters[Key] = Accepts
+    except TypeError:
+        pass
+
+    return Accepts
+
+def CallWithRandomGenerator(
+        Function: Callable,
+        RandomGenerator: np.random.Generator,
+        *Args,
+    ) -> Any:
+    """
+    Function for calling a user function passing
+    `RandomGenerator` only if it accepts it, so
+    functions without that parameter keep working.
+
+    Parameters
+    ----------
+    Function: Callable
+        Function to call
+
+    RandomGenerator: np.random.Generator
+        Random generator of the Metaheuristic
+
+    Args: tuple[Any]
+        Args parameters of `Function`
+
+    Return
+    ------
+    Result: Any
+        Return of `Function`
+    """
+
+    if AcceptsRandomGenerator(Function):
+        return Function(*Args,RandomGenerator=RandomGenerator)
+
+    return Function(*Args)
@@ -1,16 +1,29 @@
-from joblib import Parallel, delayed
-import pyarrow as pa
-import pyarrow.parquet as pq
-from pyarrow.dataset import dataset , Dataset
+from itertools import islice , product
+from hashlib import blake2b
+import json
+import os
+import numpy as np
 
-from typing import Iterator , Callable
+from .RandomGenerators import SpawnRandomGenerator , CopyWithRandomGenerator , SpawnKeys
+from .ConvergenceStatistics import ConvergenceStatistics
+
+from typing import Iterator , Callable , Any , TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from pyarrow.dataset import Dataset
+
+# PyArrow and joblib are imported when simulating, so importing MetaPy does not load them
 
 class MetaheuristicSimulations:
     """
     Base class for generating the results 
     of several simulations of a Metaheuristic 
     with given hyperparameters. It is not required 
-    to implement any method. 
+    to implement any method, but the Metaheuristic 
+    must have a `RandomGenerator` attribute 
+    (`np.random.Generator`) used to spawn an 
+    independent random stream for each simulation.
     """
 
     def GenerateSimulations(
@@ -20,8 +33,16 @@ class MetaheuristicSimulations:
             Simulations: int = 10,
             NumJobs: int = 1,
             FileName: str = 'Results',
+            BatchedReplicates: bool = False,
+            Format: str = 'wide',
+            Compression: str | None = 'snappy',
+            RowGroupSize: int | None = None,
+            BatchSize: int = 1_024,
+            SaveOptimal: bool = False,
+            Statistics: ConvergenceStatistics | bool = False,
+            SaveRaw: bool = True,
             **KwHyperparameters,
-        ) -> Dataset:
+        ) -> 'Dataset':
         """
         Method for simulating a Metaheuristic or 
         calling `self.__call__` method 
@@ -46,31 +67,252 @@ class MetaheuristicSimulations:
             each simulation/calling are saved. 
             `source` parameter of `pyarrow.dataset.dataset`
 
+        BatchedReplicates: bool
+            If True, all the simulations are advanced at once in 
+            the current process by `self.CallReplicates` instead 
+            of calling `self.__call__` through joblib, with the same 
+            random stream per simulation
+
+        Format: str
+            Layout of the snapshots in the file (see `self.SaveResults`): 'wide' 
+            (a column per iteration), 'list' (a fixed-size list column) or 'long' 
+            (a row per simulation and iteration)
+
+        Compression: str | None
+            `compression` parameter of `pyarrow.parquet.ParquetWriter`
+
+        RowGroupSize: int | None
+            Maximum number of rows of each row group of the file
+
+        BatchSize: int
+            Number of simulations accumulated before writing them
+
+        SaveOptimal: bool
+            If True, the optimal individual of each simulation and the 
+            hyperparameters (in the schema metadata) are saved too
+
+        Statistics: ConvergenceStatistics | bool
+            Accumulator of convergence statistics updated with each 
+            simulation as it is generated (if True, one with default 
+            parameters is used). Its summary curves are saved in the 
+            file `{FileName}_summary.parquet`. If False, no statistics 
+            are computed
+
+        SaveRaw: bool
+            If False, the snapshots of each simulation are not saved 
+            (only the summary of `Statistics`, which is then required)
+
         KwHyperparameters: dict[str,Any]
             Kwargs parameters of `self.__call__`
 
         Return
         ------
         DatasetResults: pyarrow.dataset.Dataset
-            PyArrow dataset with the snapshots of each simulation
+            PyArrow dataset with the snapshots of each simulation, or 
+            with the summary curves if `SaveRaw` is False
+        """
+
+        if not SaveRaw and not Statistics:
+            raise Exception('Statistics are required when SaveRaw is False')
+
+        from joblib import Parallel , delayed
+        import pyarrow.parquet as pq
+        from pyarrow.dataset import dataset
+
+        if BatchedReplicates:
+            ResultSimulations = zip(*self.CallReplicates(Iterations,Simulations,*Hyperparameters,**KwHyperparameters))
+        else:
+            WrappedCallMethod = self.WrapCallMethod(Iterations,*Hyperparameters,**KwHyperparameters)
+            RandomGenerators = (SpawnRandomGenerator(self.RandomGenerator,SpawnKeys['Simulations'],simulation) for simulation in range(Simulations))
+            ResultSimulations = Parallel(n_jobs=NumJobs,return_as='generator')(delayed(WrappedCallMethod)(random_generator) for random_generator in RandomGenerators)
+
+        if Statistics is True:
+            Statistics = ConvergenceStatistics(Iterations,RandomGenerator=SpawnRandomGenerator(self.RandomGenerator,SpawnKeys['Statistics']))
+        if Statistics:
+            ResultSimulations = AccumulateStatistics(ResultSimulations,Statistics)
+
+        if SaveRaw:
+            Metadata = None
+            if SaveOptimal:
+                Metadata = {'Hyperparameters': json.dumps({'Iterations': Iterations,'Args': Hyperparameters,'Kwargs': KwHyperparameters},default=str)}
+
+            self.SaveResults(
+                    ResultSimulations,
+                    Iterations,
+                    FileName,
+                    Format=Format,
+                    Compression=Compression,
+                    RowGroupSize=RowGroupSize,
+                    BatchSize=BatchSize,
+                    SaveOptimal=SaveOptimal,
+                    Metadata=Metadata,
+                )
+        else:
+            for _ in ResultSimulations:
+                pass
+
+        if Statistics:
+            pq.write_table(Statistics.ToTable(),f'{FileName}_summary.parquet',compression=Compression)
+
+        return dataset(f'{FileName}.parquet' if SaveRaw else f'{FileName}_summary.parquet')
+
+    def GenerateCampaign(
+            self,
+            Iterations: int,
+            Configurations: dict[str,list] | list[dict[str,Any]],
+            Simulations: int = 10,
+            NumJobs: int = 1,
+            Directory: str = 'Campaign',
+            Format: str = 'list',
+            Compression: str | None = 'snappy',
+            SaveOptimal: bool = False,
+        ) -> 'Dataset':
         """
+        Method for simulating a Metaheuristic with 
+        several hyperparameter configurations (a campaign). 
+        The simulations of all the configurations are 
+        scheduled on the same joblib workers.
+
+        The results are saved as a hive-partitioned dataset, 
+        the snapshots of each configuration in the file 
+        `{Directory}/Configuration={Id}/Results.parquet` 
+        (the hyperparameters are in its schema metadata), 
+        where `Id` is a digest of the configuration. Each 
+        file is written (atomically) once all the simulations 
+        of its configuration are done, and configurations 
+        with a file are skipped, so an interrupted campaign 
+        is resumed by calling the method again.
+
+        Parameters
+        ----------
+        Iterations: int
+            `Iterations` parameter of `self.__call__`
+
+        Configurations: dict[str,list] | list[dict[str,Any]]
+            Kwargs parameters of `self.__call__` of each configuration, 
+            or the values of each hyperparameter for a grid of configurations
+
+        Simulations: int
+            Number of simulations of each configuration
+
+        NumJobs: int
+            `n_jobs` parameter of [joblib](https://joblib.readthedocs.io/en/stable/)
+
+        Directory: str
+            Directory of the dataset
+
+        Format: str
+            'wide', 'list' or 'long' (see `self.SaveResults`)
+
+        Compression: str | None
+            `compression` parameter of `pyarrow.parquet.ParquetWriter`
+
+        SaveOptimal: bool
+            If True, the optimal individual of each simulation is saved too
+
+        Return
+        ------
+        DatasetResults: pyarrow.dataset.Dataset
+            PyArrow dataset with the snapshots of each simulation 
+            and the `Configuration` partition column
+        """
+
+        from joblib import Parallel , delayed
+        from pyarrow.dataset import dataset
+
+        if isinstance(Configurations,dict):
+            Configurations = [dict(zip(Configurations,values)) for values in product(*Configurations.values())]
+
+        PendingConfigurations = dict()
+        for configuration in Configurations:
+            configuration_id = GetConfigurationId(configuration)
+            if not os.path.exists(os.path.join(Directory,f'Configuration={configuration_id}','Results.parquet')):
+                PendingConfigurations[configuration_id] = configuration
+
+        ResultSimulations = Parallel(n_jobs=NumJobs,return_as='generator_unordered')(
+                delayed(CallSimulation)(
+                    CopyWithRandomGenerator(self,SpawnRandomGenerator(self.RandomGenerator,SpawnKeys['Campaign'],int(configuration_id,16),simulation)),
+                    Iterations,
+                    configuration,
+                    configuration_id,
+                    simulation,
+                )
+                for configuration_id , configuration in PendingConfigurations.items()
+                for simulation in range(Simulations)
+            )
+
+        ResultConfigurations = {configuration_id: [None]*Simulations for configuration_id in PendingConfigurations}
+        for configuration_id , simulation , result_simulation in ResultSimulations:
+            ResultConfiguration = ResultConfigurations[configuration_id]
+            ResultConfiguration[simulation] = result_simulation
+            if all(result is not None for result in ResultConfiguration):
+                PartitionDirectory = os.path.join(Directory,f'Configuration={configuration_id}')
+                os.makedirs(PartitionDirectory,exist_ok=True)
+                self.SaveResults(
+                        iter(ResultConfiguration),
+                        Iterations,
+                        os.path.join(PartitionDirectory,'.Results'),
+                        Format=Format,
+                        Compression=Compression,
+                        SaveOptimal=SaveOptimal,
+                        Metadata={'Hyperparameters': json.dumps({'Iterations': Iterations,'Kwargs': PendingConfigurations[configuration_id]},default=str)},
+                    )
+                os.replace(os.path.join(PartitionDirectory,'.Results.parquet'),os.path.join(PartitionDirectory,'Results.parquet'))
+                del ResultConfigurations[configuration_id]
+
+        return dataset(Directory,format='parquet',partitioning='hive')
+
+    def CallReplicates(
+            self,
+            Iterations: int,
+            Replicates: int,
+            *Hyperparameters,
+            **KwHyperparameters,
+        ) -> tuple[list[np.ndarray],np.ndarray]:
+        """
+        Method for calling `self.__call__` method 
+        several times (replicates) with given 
+        hyperparameters in the current process. 
+        Metaheuristics can override it to advance 
+        all the replicates at once.
+
+        Parameters
+        ----------
+        Iterations: int
+            `Iterations` parameter of `self.__call__`
+
+        Replicates: int
+            Number of independent replicates
+
+        Hyperparameters: tuple[Any]
+            Args parameters of `self.__call__`
 
-        WrappedCallMethod = self.WrapCallMethod(Iterations,*Hyperparameters,**KwHyperparameters)
-        ResultSimulations = Parallel(n_jobs=NumJobs,return_as='generator')(delayed(WrappedCallMethod)() for _ in range(Simulations))
+        KwHyperparameters: dict[str,Any]
+            Kwargs parameters of `self.__call__`
 
-        self.SaveResults(ResultSimulations,Iterations,FileName)
+        Returns
+        -------
+        OptimalIndividuals: list[np.ndarray]
+            Best solution/individual of each replicate
 
-        return dataset(f'{FileName}.parquet')
+        Snapshots: np.ndarray
+            Optimal values of each replicate at each iteration 
+            of shape `(Replicates,Iterations+1)`
+        """
+
+        Results = [self.__call__(Iterations,*Hyperparameters,**KwHyperparameters) for _ in range(Replicates)]
+        return [result[0] for result in Results] , np.array([PadSnapshots(result[1],Iterations) for result in Results],dtype=float)
 
     def WrapCallMethod(
             self,
             Iterations: int,
             *Hyperparameters,
             **KwHyperparameters,
-        ) -> Callable[[None],list[float]]: 
+        ) -> Callable[[np.random.Generator],tuple[np.ndarray,list[float]]]: 
         """
         Method for wrapping the `self.__call__` method 
-        for calling it with given parameters.
+        for calling it with given parameters on a copy 
+        of the Metaheuristic with its own random generator.
 
         Iterations: int
             `Iterations` parameter of `self.__call__`
@@ -86,34 +328,67 @@ class MetaheuristicSimulations:
             A wrapped version of `self.__call__` method
         """
 
-        def WrappedCallMethod() -> list[float]:
+        def WrappedCallMethod(
+                RandomGenerator: np.random.Generator,
+            ) -> tuple[np.ndarray,list[float]]:
             """
             Function for calling `self.__call__` method 
-            with given parameters and getting its snapshots.
+            with given parameters and getting its optimal 
+            individual and snapshots.
+
+            Parameters
+            ----------
+            RandomGenerator: np.random.Generator
+                Random generator of the simulation
+
+            Returns
+            -------
+            OptimalIndividual: np.ndarray
+                Best solution/individual return of `self.__call__`
 
-            Return
-            ------
             Snapshots: list[float]
                 `Snapshots` return of `self.__call__`
             """
 
-            return self.__call__(Iterations,*Hyperparameters,**KwHyperparameters,)[1]
+            Metaheuristic = CopyWithRandomGenerator(self,RandomGenerator)
+            Result = Metaheuristic(Iterations,*Hyperparameters,**KwHyperparameters,)
+            return Result[0] , Result[1]
         
         return WrappedCallMethod
     
     def SaveResults(
             self,
-            Results: Iterator[list[float]],
+            Results: Iterator[tuple[np.ndarray,list[float]]],
             Iterations: int,
             FileName: str,
+            Format: str = 'wide',
+            Compression: str | None = 'snappy',
+            RowGroupSize: int | None = None,
+            BatchSize: int = 1_024,
+            SaveOptimal: bool = False,
+            Metadata: dict[str,str] | None = None,
         ) -> None:
         """
         Method for saving the results of the 
-        simulations into a *.parquet file.
+        simulations into a *.parquet file. Snapshots 
+        of simulations stopped before `Iterations` 
+        are padded with their last optimal value. 
+        Simulations are accumulated in batches of 
+        `BatchSize` before writing them.
+
+        The snapshots are saved with one of the formats:
 
-        Results: Iterator[list[float]]
-            Iterator with the snapshots of each 
-            simulation
+        - 'wide': a float column for each iteration ('0','1',...)
+        - 'list': 'Simulation' and 'Snapshots' (fixed-size list of floats) columns
+        - 'long': 'Simulation', 'Iteration' and 'OptimalValue' columns
+
+        Without results, an empty file with the snapshots columns is written.
+
+        Parameters
+        ----------
+        Results: Iterator[tuple[np.ndarray,list[float]]]
+            Iterator with the optimal individual and 
+            the snapshots of each simulation
 
         Iterations: int
             `Iterations` parameter of `self.__call__`
@@ -122,11 +397,227 @@ class MetaheuristicSimulations:
             Name of the file where the snapshots 
             are saved. `where` parameter of 
             `pyarrow.parquet.ParquetWriter` 
+
+        Format: str
+            'wide', 'list' or 'long'
+
+        Compression: str | None
+            `compression` parameter of `pyarrow.parquet.ParquetWriter`
+
+        RowGroupSize: int | None
+            `row_group_size` parameter of `pyarrow.parquet.ParquetWriter.write_table`
+
+        BatchSize: int
+            Number of simulations written at once
+
+        SaveOptimal: bool
+            If True, the optimal individual of each simulation is saved 
+            in the 'OptimalIndividual' column (only for 'wide' and 'list')
+
+        Metadata: dict[str,str] | None
+            Metadata of the schema of the file
         """
 
-        SchemaFile = pa.schema((f'{iteration}',pa.float64()) for iteration in range(Iterations+1))
-        with pq.ParquetWriter(f'{FileName}.parquet',SchemaFile) as WriterFile:
-            for result_simulation in Results:
-                arrays = [pa.array([optimal_value]) for optimal_value in result_simulation]
-                batch = pa.RecordBatch.from_arrays(arrays,schema=SchemaFile)
-                WriterFile.write_batch(batch)
\ No newline at end of file
+        import pyarrow.parquet as pq
+
+        if Format not in ('wide','list','long'):
+            raise Exception(f'{Format} Not Implemented')
+        if SaveOptimal and Format == 'long':
+            raise Exception('OptimalIndividual can not be saved with long format')
+
+        WriterFile = None
+        NumSimulations = 0
+        try:
+            while Batch := list(islice(Results,BatchSize)):
+                Snapshots = np.array([PadSnapshots(result[1],Iterations) for result in Batch],dtype=float)
+                Individuals = np.array([np.ravel(result[0]) for result in Batch]) if SaveOptimal else None
+
+                TableBatch = SnapshotsTable(Snapshots,Individuals,NumSimulations,Format)
+                if WriterFile is None:
+                    SchemaFile = TableBatch.schema.with_metadata(Metadata) if Metadata else TableBatch.schema
+                    WriterFile = pq.ParquetWriter(f'{FileName}.parquet',SchemaFile,compression=Compression)
+
+                WriterFile.write_table(TableBatch.cast(SchemaFile),row_group_size=RowGroupSize)
+                NumSimulations += len(Batch)
+
+            if WriterFile is None:
+                # Without simulations the dimension of the optimal individual is unknown
+                TableEmpty = SnapshotsTable(np.empty((0,Iterations+1)),None,0,Format)
+                SchemaFile = TableEmpty.schema.with_metadata(Metadata) if Metadata else TableEmpty.schema
+                WriterFile = pq.ParquetWriter(f'{FileName}.parquet',SchemaFile,compression=Compression)
+        finally:
+            if WriterFile is not None:
+                WriterFile.close()
+
+def PadSnapshots(
+        Snapshots: list[float],
+        Iterations: int,
+    ) -> list[float]:
+    """
+    Function for padding the snapshots of a 
+    search stopped before `Iterations` with 
+    its last optimal value.
+
+    Parameters
+    ----------
+    Snapshots: list[float]
+        `Snapshots` return of `self.__call__`
+
+    Iterations: int
+        `Iterations` parameter of `self.__call__`
+
+    Return
+    ------
+    PaddedSnapshots: list[float]
+        Snapshots with `Iterations+1` optimal values
+    """
+
+    Snapshots = list(Snapshots)
+    return Snapshots + Snapshots[-1:]*(Iterations+1-len(Snapshots))
+
+def GetConfigurationId(
+        Configuration: dict[str,Any],
+    ) -> str:
+    """
+    Function for getting the identifier of a 
+    hyperparameter configuration of a campaign 
+    as a digest of its values.
+
+    Parameters
+    ----------
+    Configuration: dict[str,Any]
+        Kwargs parameters of `self.__call__`
+
+    Return
+    ------
+    Id: str
+        Hexadecimal digest of 8 bytes of the configuration
+    """
+
+    return blake2b(json.dumps(Configuration,sort_keys=True,default=str).encode(),digest_size=8).hexdigest()
+
+def CallSimulation(
+        Metaheuristic: MetaheuristicSimulations,
+        Iterations: int,
+        Configuration: dict[str,Any],
+        ConfigurationId: str,
+        Simulation: int,
+    ) -> tuple[str,int,tuple[np.ndarray,list[float]]]:
+    """
+    Function for running a simulation 
+    of a configuration of a campaign.
+
+    Parameters
+    ----------
+    Metaheuristic: MetaheuristicSimulations
+        Metaheuristic with the random generator of the simulation
+
+    Iterations: int
+        `Iterations` parameter of `Metaheuristic.__call__`
+
+    Configuration: dict[str,Any]
+        Kwargs parameters of `Metaheuristic.__call__`
+
+    ConfigurationId: str
+        Identifier of the configuration
+
+    Simulation: int
+        Number of the simulation
+
+    Returns
+    -------
+    ConfigurationId: str
+        Identifier of the configuration
+
+    Simulation: int
+        Number of the simulation
+
+    Result: tuple[np.ndarray,list[float]]
+        Optimal individual and snapshots of the simulation
+    """
+
+    Result = Metaheuristic(Iterations,**Configuration)
+    return ConfigurationId , Simulation , (Result[0],Result[1])
+
+def AccumulateStatistics(
+        Results: Iterator[tuple[np.ndarray,list[float]]],
+        Statistics: ConvergenceStatistics,
+    ) -> Iterator[tuple[np.ndarray,list[float]]]:
+    """
+    Function for updating the convergence 
+    statistics with the snapshots of each 
+    simulation as it is generated.
+
+    Parameters
+    ----------
+    Results: Iterator[tuple[np.ndarray,list[float]]]
+        Iterator with the optimal individual and 
+        the snapshots of each simulation
+
+    Statistics: ConvergenceStatistics
+        Accumulator of convergence statistics
+
+    Return
+    ------
+    Results: Iterator[tuple[np.ndarray,list[float]]]
+        The same results of the simulations
+    """
+
+    for result_simulation in Results:
+        Statistics.Update(PadSnapshots(result_simulation[1],Statistics.Iterations))
+        yield result_simulation
+
+def SnapshotsTable(
+        Snapshots: np.ndarray,
+        Individuals: np.ndarray | None,
+        FirstSimulation: int,
+        Format: str,
+    ) -> 'pa.Table':
+    """
+    Function for building the table of a 
+    batch of simulations with a format of 
+    `MetaheuristicSimulations.SaveResults`.
+
+    Parameters
+    ----------
+    Snapshots: np.ndarray
+        Padded snapshots of shape `(Simulations,Iterations+1)`
+
+    Individuals: np.ndarray | None
+        Optimal individuals of shape `(Simulations,Dim)`. If None, they are not included
+
+    FirstSimulation: int
+        Number of the first simulation of the batch
+
+    Format: str
+        'wide', 'list' or 'long'
+
+    Return
+    ------
+    TableBatch: pyarrow.Table
+        Table of the batch of simulations
+    """
+
+    import pyarrow as pa
+
+    NumSimulations , NumSnapshots = Snapshots.shape
+    SimulationIds = np.arange(FirstSimulation,FirstSimulation+NumSimulations,dtype=np.int64)
+
+    if Format == 'wide':
+        Columns = {f'{iteration}': Snapshots[:,iteration] for iteration in range(NumSnapshots)}
+    elif Format == 'list':
+        Columns = {
+                'Simulation': SimulationIds,
+                'Snapshots': pa.FixedSizeListArray.from_arrays(pa.array(Snapshots.ravel()),NumSnapshots),
+            }
+    else:
+        Columns = {
+                'Simulation': np.repeat(SimulationIds,NumSnapshots),
+                'Iteration': np.tile(np.arange(NumSnapshots,dtype=np.int64),NumSimulations),
+                'OptimalValue': Snapshots.ravel(),
+            }
+
+    if Individuals is not None:
+        Columns['OptimalIndividual'] = pa.FixedSizeListArray.from_arrays(pa.array(Individuals.ravel()),Individuals.shape[1])
+
+    return pa.table(Columns)
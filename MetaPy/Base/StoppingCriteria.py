@@ -0,0 +1,220 @@
+from time import perf_counter
+from copy import copy
+import numpy as np
+
+from typing import Callable
+
+class StoppingCriteria:
+    def __init__(
+            self,
+            MaxEvaluations: int | None = None,
+            TimeLimit: float | None = None,
+            TargetFitness: float | None = None,
+            StagnationIterations: int | None = None,
+            StagnationTolerance: float = 0.0,
+            MinDiversity: float | None = None,
+        ):
+        """
+        Class for defining the stopping criteria of a
+        Metaheuristic besides its number of iterations.
+        The criteria are checked after the initialization
+        and after each iteration, and a criterion set to
+        None is not checked.
+
+        Parameters
+        ----------
+        MaxEvaluations: int | None
+            Maximum number of evaluations of the objective function
+
+        TimeLimit: float | None
+            Maximum wall-clock time (in seconds) of the search
+
+        TargetFitness: float | None
+            The search stops when the optimal value is less or equal than it
+
+        StagnationIterations: int | None
+            The search stops after this number of iterations without improving
+            the optimal value by more than `StagnationTolerance`
+
+        StagnationTolerance: float
+            Minimum improvement of the optimal value to reset the stagnation
+
+        MinDiversity: float | None
+            The search stops when the diversity of the population (mean of the
+            standard deviation of each variable) is less than it. Only used by
+            population based Metaheuristics
+        """
+
+        self.MaxEvaluations = MaxEvaluations
+        self.TimeLimit = TimeLimit
+        self.TargetFitness = TargetFitness
+        self.StagnationIterations = StagnationIterations
+        self.StagnationTolerance = StagnationTolerance
+        self.MinDiversity = MinDiversity
+
+    def Start(
+            self,
+        ) -> 'StoppingCriteria':
+        """
+        Method for starting the checking of the
+        criteria for a new search. Returns a copy
+        with its own state, so concurrent searches
+        do not share it.
+
+        Return
+        ------
+        Stopping: StoppingCriteria
+            Copy of the criteria with the state of a new search
+        """
+
+        Stopping = copy(self)
+        Stopping.StartTime = perf_counter()
+        Stopping.Evaluations = 0
+        Stopping.Iterations = 0
+        Stopping.BestValue = np.inf
+        Stopping.StagnatedIterations = 0
+        Stopping.StopReason = None
+
+        return Stopping
+
+    def AddEvaluations(
+            self,
+            Evaluations: int,
+        ) -> None:
+        """
+        Method for counting evaluations of the
+        objective function.
+
+        Parameters
+        ----------
+        Evaluations: int
+            Number of new evaluations
+        """
+
+        self.Evaluations += Evaluations
+
+    def Update(
+            self,
+            OptimalValue: float,
+            Diversity: Callable[[],float] | None = None,
+        ) -> bool:
+        """
+        Method for updating the state after an
+        iteration and checking the criteria. The
+        reason of the stop is saved in `StopReason`.
+
+        Parameters
+        ----------
+        OptimalValue: float
+            Optimal (best) value found so far
+
+        Diversity: Callable[[],float] | None
+            Function to compute the diversity of the population.
+            It is only called if `MinDiversity` is set
+
+        Return
+        ------
+        Stop: bool
+            True if any criterion is met
+        """
+
+        self.Iterations += 1
+
+        if OptimalValue < self.BestValue - self.StagnationTolerance:
+            self.StagnatedIterations = 0
+        else:
+            self.StagnatedIterations += 1
+        self.BestValue = min(self.BestValue,OptimalValue)
+
+        return self.Check(OptimalValue,Diversity)
+
+    def Check(
+            self,
+            OptimalValue: float,
+            Diversity: Callable[[],float] | None = None,
+        ) -> bool:
+        """
+        Method for checking the criteria without 
+        counting an iteration, e.g. after the 
+        initialization of the search. The reason 
+        of the stop is saved in `StopReason`.
+
+        Parameters
+        ----------
+        OptimalValue: float
+            Optimal (best) value found so far
+
+        Diversity: Callable[[],float] | None
+            Function to compute the diversity of the population.
+            It is only called if `MinDiversity` is set
+
+        Return
+        ------
+        Stop: bool
+            True if any criterion is met
+        """
+
+        if self.TargetFitness is not None and OptimalValue <= self.TargetFitness:
+            self.StopReason = 'TargetFitness'
+        elif self.MaxEvaluations is not None and self.Evaluations >= self.MaxEvaluations:
+            self.StopReason = 'MaxEvaluations'
+        elif self.TimeLimit is not None and perf_counter()-self.StartTime >= self.TimeLimit:
+            self.StopReason = 'TimeLimit'
+        elif self.StagnationIterations is not None and self.StagnatedIterations >= self.StagnationIterations:
+            self.StopReason = 'Stagnation'
+        elif self.MinDiversity is not None and Diversity is not None and Diversity() < self.MinDiversity:
+            self.StopReason = 'Diversity'
+
+        return self.StopReason is not None
+
+    def RemainingTime(
+            self,
+        ) -> float | None:
+        """
+        Method for getting the time left before 
+        the `TimeLimit` of the search.
+
+        Return
+        ------
+        RemainingTime: float | None
+            Seconds left (0 if the limit was reached), or None if there is no `TimeLimit`
+        """
+
+        if self.TimeLimit is None:
+            return None
+
+        return max(self.TimeLimit-(perf_counter()-self.StartTime),0.0)
+
+    def Finish(
+            self,
+        ) -> str:
+        """
+        Method for getting the reason of the
+        stop at the end of a search.
+
+        Return
+        ------
+        StopReason: str
+            Criterion that stopped the search or `'Iterations'` if all the iterations were run
+        """
+
+        if self.StopReason is None:
+            self.StopReason = 'Iterations'
+
+        return self.StopReason
+
+    def __getstate__(
+            self,
+        ) -> dict:
+        State = self.__dict__.copy()
+        if 'StartTime' in State:
+            State['ElapsedTime'] = perf_counter()-State.pop('StartTime')
+        return State
+
+    def __setstate__(
+            self,
+            State: dict,
+        ) -> None:
+        if 'ElapsedTime' in State:
+            State['StartTime'] = perf_counter()-State.pop('ElapsedTime')
+        self.__dict__.update(State)
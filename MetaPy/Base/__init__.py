@@ -1,2 +1,9 @@
 from .FineTuning import *
-from .Simulations import *
\ No newline at end of file
+from .Simulations import *
+from .Evaluators import *
+from .RandomGenerators import *
+from .StoppingCriteria import *
+from .FitnessCache import *
+from .ConvergenceStatistics import *
+from .Checkpoints import *
+from .Profiling import *
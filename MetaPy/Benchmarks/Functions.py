@@ -0,0 +1,279 @@
+import numpy as np
+
+from ..Base import CreateRandomGenerator
+
+from typing import Callable
+
+def Sphere(
+        Solutions: np.ndarray,
+    ) -> np.ndarray | float:
+    """
+    Sphere function `sum(x**2)`, with minimum
+    0 at the origin.
+
+    Parameters
+    ----------
+    Solutions: np.ndarray
+        Solution of shape `(Dim,)` or solutions of shape `(Size,Dim)`
+
+    Return
+    ------
+    FitnessValues: np.ndarray | float
+        Fitness value of each solution
+    """
+
+    Solutions = np.asarray(Solutions,dtype=float)
+    return np.einsum('...i,...i->...',Solutions,Solutions)
+
+def Rosenbrock(
+        Solutions: np.ndarray,
+    ) -> np.ndarray | float:
+    """
+    Rosenbrock function
+    `sum(100*(x[i+1]-x[i]**2)**2+(1-x[i])**2)`,
+    with minimum 0 at `(1,...,1)`.
+
+    Parameters
+    ----------
+    Solutions: np.ndarray
+        Solution of shape `(Dim,)` or solutions of shape `(Size,Dim)`
+
+    Return
+    ------
+    FitnessValues: np.ndarray | float
+        Fitness value of each solution
+    """
+
+    Solutions = np.asarray(Solutions,dtype=float)
+    Current , Next = Solutions[...,:-1] , Solutions[...,1:]
+    return np.sum(100*(Next-Current**2)**2+(1-Current)**2,axis=-1)
+
+def Rastrigin(
+        Solutions: np.ndarray,
+    ) -> np.ndarray | float:
+    """
+    Rastrigin function
+    `10*Dim+sum(x**2-10*cos(2*pi*x))`, with
+    minimum 0 at the origin.
+
+    Parameters
+    ----------
+    Solutions: np.ndarray
+        Solution of shape `(Dim,)` or solutions of shape `(Size,Dim)`
+
+    Return
+    ------
+    FitnessValues: np.ndarray | float
+        Fitness value of each solution
+    """
+
+    Solutions = np.asarray(Solutions,dtype=float)
+    return 10*Solutions.shape[-1] + np.sum(Solutions**2-10*np.cos(2*np.pi*Solutions),axis=-1)
+
+def Ackley(
+        Solutions: np.ndarray,
+    ) -> np.ndarray | float:
+    """
+    Ackley function
+    `-20*exp(-0.2*sqrt(mean(x**2)))-exp(mean(cos(2*pi*x)))+20+e`,
+    with minimum 0 at the origin.
+
+    Parameters
+    ----------
+    Solutions: np.ndarray
+        Solution of shape `(Dim,)` or solutions of shape `(Size,Dim)`
+
+    Return
+    ------
+    FitnessValues: np.ndarray | float
+        Fitness value of each solution
+    """
+
+    Solutions = np.asarray(Solutions,dtype=float)
+    SquaredMean = np.mean(Solutions**2,axis=-1)
+    CosineMean = np.mean(np.cos(2*np.pi*Solutions),axis=-1)
+    return -20*np.exp(-0.2*np.sqrt(SquaredMean)) - np.exp(CosineMean) + 20 + np.e
+
+def Griewank(
+        Solutions: np.ndarray,
+    ) -> np.ndarray | float:
+    """
+    Griewank function
+    `1+sum(x**2)/4000-prod(cos(x[i]/sqrt(i+1)))`,
+    with minimum 0 at the origin.
+
+    Parameters
+    ----------
+    Solutions: np.ndarray
+        Solution of shape `(Dim,)` or solutions of shape `(Size,Dim)`
+
+    Return
+    ------
+    FitnessValues: np.ndarray | float
+        Fitness value of each solution
+    """
+
+    Solutions = np.asarray(Solutions,dtype=float)
+    Indexes = np.sqrt(np.arange(1,Solutions.shape[-1]+1))
+    return 1 + np.sum(Solutions**2,axis=-1)/4000 - np.prod(np.cos(Solutions/Indexes),axis=-1)
+
+def Schwefel(
+        Solutions: np.ndarray,
+    ) -> np.ndarray | float:
+    """
+    Schwefel function
+    `418.9829*Dim-sum(x*sin(sqrt(|x|)))`, with
+    minimum (close to) 0 at `(420.9687,...,420.9687)`.
+
+    Parameters
+    ----------
+    Solutions: np.ndarray
+        Solution of shape `(Dim,)` or solutions of shape `(Size,Dim)`
+
+    Return
+    ------
+    FitnessValues: np.ndarray | float
+        Fitness value of each solution
+    """
+
+    Solutions = np.asarray(Solutions,dtype=float)
+    return 418.9828872724338*Solutions.shape[-1] - np.sum(Solutions*np.sin(np.sqrt(np.abs(Solutions))),axis=-1)
+
+FunctionBounds = {
+        'Sphere': (-100,100),
+        'Rosenbrock': (-30,30),
+        'Rastrigin': (-5.12,5.12),
+        'Ackley': (-32.768,32.768),
+        'Griewank': (-600,600),
+        'Schwefel': (-500,500),
+    }
+
+def ShiftedRotated(
+        Function: Callable[[np.ndarray],np.ndarray],
+        Dimension: int,
+        Shift: np.ndarray | float | None = None,
+        Rotation: np.ndarray | bool = True,
+        RandomGenerator: np.random.Generator | int | None = None,
+    ) -> Callable[[np.ndarray],np.ndarray]:
+    """
+    Function for creating a CEC-style shifted and
+    rotated version of a benchmark function,
+    `Function(Rotation@(x-Shift))`, whose optimum is
+    moved from the origin to `Shift` (for functions
+    with optimum at the origin).
+
+    Parameters
+    ----------
+    Function: Callable[[np.ndarray],np.ndarray]
+        Batch-capable benchmark function
+
+    Dimension: int
+        Dimension of solutions
+
+    Shift: np.ndarray | float | None
+        Shift of the optimum. If None, it is sampled uniformly in `[-80,80]`
+
+    Rotation: np.ndarray | bool
+        Orthogonal matrix of shape `(Dim,Dim)`. If True, a random orthogonal
+        matrix is sampled and, if False, solutions are not rotated
+
+    RandomGenerator: np.random.Generator | int | None
+        Random generator (or its seed) used to sample the shift and rotation
+
+    Return
+    ------
+    ShiftedRotatedFunction: Callable[[np.ndarray],np.ndarray]
+        Batch-capable function with `Shift` and `Rotation` attributes
+    """
+
+    RandomGenerator = CreateRandomGenerator(RandomGenerator)
+
+    if Shift is None:
+        Shift = RandomGenerator.uniform(-80,80,Dimension)
+    Shift = np.broadcast_to(np.asarray(Shift,dtype=float),(Dimension,)).copy()
+
+    if Rotation is True:
+        Orthogonal , Triangular = np.linalg.qr(RandomGenerator.standard_normal((Dimension,Dimension)))
+        Rotation = Orthogonal*np.sign(np.diag(Triangular))
+    elif Rotation is False:
+        Rotation = None
+
+    def ShiftedRotatedFunction(
+            Solutions: np.ndarray,
+        ) -> np.ndarray | float:
+        """
+        Shifted and rotated benchmark function.
+
+        Parameters
+        ----------
+        Solutions: np.ndarray
+            Solution of shape `(Dim,)` or solutions of shape `(Size,Dim)`
+
+        Return
+        ------
+        FitnessValues: np.ndarray | float
+            Fitness value of each solution
+        """
+
+        Transformed = np.asarray(Solutions,dtype=float) - Shift
+        if Rotation is not None:
+            Transformed = Transformed @ Rotation.T
+
+        return Function(Transformed)
+
+    ShiftedRotatedFunction.Shift = Shift
+    ShiftedRotatedFunction.Rotation = Rotation
+
+    return ShiftedRotatedFunction
+
+def Bounded(
+        Function: Callable[[np.ndarray],np.ndarray],
+        LowerBound: float,
+        UpperBound: float,
+    ) -> Callable[[np.ndarray],np.ndarray]:
+    """
+    Function for creating a version of a benchmark
+    function that evaluates the solutions clipped into
+    the box `[LowerBound,UpperBound]`, for unconstrained
+    Metaheuristics whose search can leave the box (e.g.
+    Schwefel has no lower bound outside of it).
+
+    Parameters
+    ----------
+    Function: Callable[[np.ndarray],np.ndarray]
+        Batch-capable benchmark function
+
+    LowerBound: float
+        Lower bound of each variable
+
+    UpperBound: float
+        Upper bound of each variable
+
+    Return
+    ------
+    BoundedFunction: Callable[[np.ndarray],np.ndarray]
+        Batch-capable function with the name of `Function`
+    """
+
+    def BoundedFunction(
+            Solutions: np.ndarray,
+        ) -> np.ndarray | float:
+        """
+        Benchmark function evaluated in its box.
+
+        Parameters
+        ----------
+        Solutions: np.ndarray
+            Solution of shape `(Dim,)` or solutions of shape `(Size,Dim)`
+
+        Return
+        ------
+        FitnessValues: np.ndarray | float
+            Fitness value of each solution
+        """
+
+        return Function(np.clip(np.asarray(Solutions,dtype=float),LowerBound,UpperBound))
+
+    BoundedFunction.__name__ = Function.__name__
+
+    return BoundedFunction
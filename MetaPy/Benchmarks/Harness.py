@@ -0,0 +1,315 @@
+from time import perf_counter
+import tracemalloc
+import platform
+import numpy as np
+
+from ..Base import SpawnRandomGenerator , CopyWithRandomGenerator , SpawnKeys
+from ..DifferentialEvolution import DifferentialEvolutionOptimizer
+from ..TabuSearch import TabuSearchOptimizer
+from ..SimulatedAnnealing import SimulatedAnnealingOptimizer , GeometricSchedule
+from ..Utils import RealValueIndividuals
+from .Functions import Sphere , Rosenbrock , Rastrigin , Ackley , Griewank , Schwefel , FunctionBounds , Bounded
+from .Instances import RandomTSP , TourLength , RandomQAP , AssignmentCost , AssignmentSwapGain , SwapNeighborhood , RandomSwap , RandomPermutation
+
+from typing import Any , TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+def BenchmarkOptimizer(
+        Optimizer: Any,
+        Iterations: int,
+        Hyperparameters: dict[str,Any],
+        Target: float | None = None,
+        Repeats: int = 3,
+        MeasureMemory: bool = True,
+        Optimum: float | None = None,
+    ) -> dict[str,float]:
+    """
+    Function for measuring the performance of a
+    Metaheuristic. Each repeat runs a copy of the
+    Metaheuristic with the child of its random
+    generator identified by the number of the repeat.
+
+    The time to target is estimated from the first
+    iteration that reaches `Target`, assuming a
+    constant time per iteration. A run that ends
+    below the known `Optimum` is not a success, since
+    its optimal value is not valid. The peak memory is
+    measured (with `tracemalloc`) in an additional
+    run, so it does not slow down the timed runs.
+
+    Parameters
+    ----------
+    Optimizer: Any
+        Metaheuristic to measure, with `RandomGenerator` and `SearchStopping`
+        (evaluations counter) attributes
+
+    Iterations: int
+        `Iterations` parameter of `Optimizer.__call__`
+
+    Hyperparameters: dict[str,Any]
+        Kwargs parameters of `Optimizer.__call__`
+
+    Target: float | None
+        Target optimal value for the time to target and success rate
+
+    Repeats: int
+        Number of timed runs
+
+    MeasureMemory: bool
+        If True, the peak memory is measured
+
+    Optimum: float | None
+        Known optimal value of the case. If None, it is not checked
+
+    Return
+    ------
+    Results: dict[str,float]
+        Medians of 'Time', 'IterationsPerSecond', 'EvaluationsPerSecond',
+        'OptimalValue' and 'TimeToTarget' (of the successful runs), and
+        'SuccessRate' and 'PeakMemory' (in bytes)
+    """
+
+    Times , IterationsRun , Evaluations , OptimalValues , TimesToTarget = [] , [] , [] , [] , []
+    for repeat in range(Repeats):
+        Metaheuristic = CopyWithRandomGenerator(Optimizer,SpawnRandomGenerator(Optimizer.RandomGenerator,SpawnKeys['Benchmark'],repeat))
+
+        StartTime = perf_counter()
+        _ , Snapshots = Metaheuristic(Iterations,**Hyperparameters)
+        Times.append(perf_counter()-StartTime)
+
+        IterationsRun.append(len(Snapshots)-1)
+        Evaluations.append(Metaheuristic.SearchStopping.Evaluations)
+        OptimalValues.append(float(Snapshots[-1]))
+        Valid = Optimum is None or Snapshots[-1] >= Optimum or np.isclose(Snapshots[-1],Optimum)
+        if Target is not None and Valid and Snapshots[-1] <= Target:
+            TimesToTarget.append(Times[-1]*int(np.argmax(np.asarray(Snapshots) <= Target))/max(len(Snapshots)-1,1))
+
+    PeakMemory = np.nan
+    if MeasureMemory:
+        Metaheuristic = CopyWithRandomGenerator(Optimizer,SpawnRandomGenerator(Optimizer.RandomGenerator,SpawnKeys['Benchmark'],Repeats))
+        tracemalloc.start()
+        try:
+            Metaheuristic(Iterations,**Hyperparameters)
+            PeakMemory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    Times = np.asarray(Times)
+    return {
+            'Time': float(np.median(Times)),
+            'IterationsPerSecond': float(np.median(np.asarray(IterationsRun)/Times)),
+            'EvaluationsPerSecond': float(np.median(np.asarray(Evaluations)/Times)),
+            'OptimalValue': float(np.median(OptimalValues)),
+            'TimeToTarget': float(np.median(TimesToTarget)) if TimesToTarget else np.nan,
+            'SuccessRate': len(TimesToTarget)/Repeats if Target is not None else np.nan,
+            'PeakMemory': float(PeakMemory),
+        }
+
+def DefaultCases(
+        Dimensions: tuple[int,...] = (2,10,100,1_000),
+        Iterations: int = 100,
+        RandomGenerator: int = 0,
+    ) -> list[dict[str,Any]]:
+    """
+    Function for creating the default benchmark
+    cases for each dimension: Differential Evolution
+    on each benchmark function (evaluated in its box
+    of `FunctionBounds`), Tabu Search on a QAP instance
+    (with at most 1000 sampled swap moves per iteration)
+    and Simulated Annealing on a TSP instance.
+
+    Parameters
+    ----------
+    Dimensions: tuple[int,...]
+        Dimensions of the benchmark functions and sizes of the instances
+
+    Iterations: int
+        Number of iterations of each case
+
+    RandomGenerator: int
+        Seed of the optimizers and instances
+
+    Return
+    ------
+    Cases: list[dict[str,Any]]
+        Cases with 'Name', 'Optimizer', 'Iterations', 'Hyperparameters',
+        'Dimension', 'Target' and 'Optimum' keys, the parameters of `RunBenchmarks`
+    """
+
+    Cases = []
+    for function in (Sphere,Rosenbrock,Rastrigin,Ackley,Griewank,Schwefel):
+        LowerBound , UpperBound = FunctionBounds[function.__name__]
+        for dimension in Dimensions:
+            Cases.append({
+                    'Name': f'DifferentialEvolution/{function.__name__}/{dimension}',
+                    'Optimizer': DifferentialEvolutionOptimizer(Bounded(function,LowerBound,UpperBound),RealValueIndividuals(LowerBound,UpperBound,dimension),BatchObjective=True,RandomGenerator=RandomGenerator),
+                    'Iterations': Iterations,
+                    'Hyperparameters': {'PopulationSize': 100,'ScalingFactor': 0.5,'CrossoverRate': 0.9},
+                    'Dimension': dimension,
+                    'Target': 1e-2,
+                    'Optimum': 0.0,
+                })
+
+    for size in Dimensions:
+        Flows , Distances = RandomQAP(size,RandomGenerator)
+        Cases.append({
+                'Name': f'TabuSearch/QAP/{size}',
+                'Optimizer': TabuSearchOptimizer(
+                        AssignmentCost(Flows,Distances),
+                        RandomPermutation(size),
+                        SwapNeighborhood(size,MaxMoves=1_000),
+                        lambda PreviousSolution , CurrentSolution: None,
+                        RandomGenerator=RandomGenerator,
+                        MoveGain=AssignmentSwapGain(Flows,Distances),
+                    ),
+                'Iterations': Iterations,
+                'Hyperparameters': {'TabuTime': 10},
+                'Dimension': size,
+                'Target': None,
+                'Optimum': None,
+            })
+
+    for cities in Dimensions:
+        Cases.append({
+                'Name': f'SimulatedAnnealing/TSP/{cities}',
+                'Optimizer': SimulatedAnnealingOptimizer(
+                        TourLength(RandomTSP(cities,RandomGenerator)),
+                        RandomPermutation(cities),
+                        None,
+                        GeometricSchedule(),
+                        RandomGenerator=RandomGenerator,
+                        GenerateRandomNeighbor=RandomSwap,
+                    ),
+                'Iterations': 100*Iterations,
+                'Hyperparameters': {'InitialTemperature': 1.0,'FinalTemperature': 1e-3},
+                'Dimension': cities,
+                'Target': None,
+                'Optimum': None,
+            })
+
+    return Cases
+
+def RunBenchmarks(
+        Cases: list[dict[str,Any]] | None = None,
+        FileName: str | None = None,
+        Label: str = '',
+        Repeats: int = 3,
+        MeasureMemory: bool = True,
+    ) -> 'pa.Table':
+    """
+    Function for running benchmark cases with
+    `BenchmarkOptimizer` and (optionally) saving
+    the results into a *.parquet file, so they
+    can be compared between versions with
+    `CompareBenchmarks`.
+
+    Parameters
+    ----------
+    Cases: list[dict[str,Any]] | None
+        Cases with 'Name', 'Optimizer', 'Iterations', 'Hyperparameters' and
+        (optionally) 'Dimension', 'Target' and 'Optimum' keys. If None, `DefaultCases()` are run
+
+    FileName: str | None
+        Name of the file where the results are saved. If None, they are not saved
+
+    Label: str
+        Label of the results (e.g. the version), saved in the schema metadata
+
+    Repeats: int
+        Number of timed runs of each case
+
+    MeasureMemory: bool
+        If True, the peak memory of each case is measured
+
+    Return
+    ------
+    TableResults: pyarrow.Table
+        Table with a row per case: 'Name', 'Dimension', 'Iterations' and
+        the results of `BenchmarkOptimizer`
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if Cases is None:
+        Cases = DefaultCases()
+
+    Rows = []
+    for case in Cases:
+        Results = BenchmarkOptimizer(case['Optimizer'],case['Iterations'],case['Hyperparameters'],case.get('Target'),Repeats,MeasureMemory,case.get('Optimum'))
+        Rows.append({'Name': case['Name'],'Dimension': case.get('Dimension',0),'Iterations': case['Iterations'],**Results})
+
+    Metadata = {
+            'Label': Label,
+            'Python': platform.python_version(),
+            'NumPy': np.__version__,
+            'Platform': platform.platform(),
+        }
+    TableResults = pa.Table.from_pylist(Rows,metadata=Metadata)
+
+    if FileName is not None:
+        pq.write_table(TableResults,f'{FileName}.parquet')
+
+    return TableResults
+
+def CompareBenchmarks(
+        Baseline: 'pa.Table | str',
+        Current: 'pa.Table | str',
+        Tolerance: float = 0.1,
+    ) -> 'pa.Table':
+    """
+    Function for comparing the results of two
+    runs of `RunBenchmarks` case by case. A case
+    is marked as a regression if its evaluations
+    per second drop or its peak memory grows by
+    more than `Tolerance` (relative).
+
+    Parameters
+    ----------
+    Baseline: pa.Table | str
+        Results of the baseline, or the name of its file (without extension)
+
+    Current: pa.Table | str
+        Results to compare, or the name of its file (without extension)
+
+    Tolerance: float
+        Relative change allowed before marking a regression
+
+    Return
+    ------
+    TableComparison: pyarrow.Table
+        Table with a row per common case: 'Name', 'SpeedRatio' (current/baseline
+        evaluations per second), 'MemoryRatio', 'BaselineOptimalValue',
+        'CurrentOptimalValue' and 'Regression'
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if isinstance(Baseline,str):
+        Baseline = pq.read_table(f'{Baseline}.parquet')
+    if isinstance(Current,str):
+        Current = pq.read_table(f'{Current}.parquet')
+
+    BaselineRows = {row['Name']: row for row in Baseline.to_pylist()}
+
+    Rows = []
+    for current_row in Current.to_pylist():
+        baseline_row = BaselineRows.get(current_row['Name'])
+        if baseline_row is None:
+            continue
+
+        speed_ratio = current_row['EvaluationsPerSecond']/baseline_row['EvaluationsPerSecond']
+        memory_ratio = current_row['PeakMemory']/baseline_row['PeakMemory'] if baseline_row['PeakMemory'] else np.nan
+        Rows.append({
+                'Name': current_row['Name'],
+                'SpeedRatio': speed_ratio,
+                'MemoryRatio': memory_ratio,
+                'BaselineOptimalValue': baseline_row['OptimalValue'],
+                'CurrentOptimalValue': current_row['OptimalValue'],
+                'Regression': bool(speed_ratio < 1-Tolerance or memory_ratio > 1+Tolerance),
+            })
+
+    return pa.Table.from_pylist(Rows)
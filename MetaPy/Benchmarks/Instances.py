@@ -0,0 +1,316 @@
+import numpy as np
+
+from ..Base import CreateRandomGenerator
+from ..TabuSearch import MoveNeighborhood
+
+from typing import Callable , Any
+
+def RandomTSP(
+        Cities: int,
+        RandomGenerator: np.random.Generator | int | None = None,
+    ) -> np.ndarray:
+    """
+    Function for creating a random instance of the
+    Travelling Salesman Problem (TSP) with cities
+    sampled uniformly in the unit square.
+
+    Parameters
+    ----------
+    Cities: int
+        Number of cities
+
+    RandomGenerator: np.random.Generator | int | None
+        Random generator (or its seed) used to sample the cities
+
+    Return
+    ------
+    Distances: np.ndarray
+        Euclidean distances between the cities of shape `(Cities,Cities)`
+    """
+
+    Points = CreateRandomGenerator(RandomGenerator).random((Cities,2))
+    return np.linalg.norm(Points[:,None]-Points[None],axis=-1)
+
+def TourLength(
+        Distances: np.ndarray,
+    ) -> Callable[[np.ndarray],np.ndarray]:
+    """
+    Function for creating the objective function
+    of a TSP instance, the length of a closed tour.
+
+    Parameters
+    ----------
+    Distances: np.ndarray
+        Distances between the cities of shape `(Cities,Cities)`
+
+    Return
+    ------
+    TourLengthFunction: Callable[[np.ndarray],np.ndarray]
+        Batch-capable function that takes a tour (permutation of the cities) of shape
+        `(Cities,)` or tours of shape `(Size,Cities)` and returns their lengths
+    """
+
+    def TourLengthFunction(
+            Tours: np.ndarray,
+        ) -> np.ndarray | float:
+        Tours = np.asarray(Tours)
+        return np.sum(Distances[Tours,np.roll(Tours,-1,axis=-1)],axis=-1)
+
+    return TourLengthFunction
+
+def RandomQAP(
+        Size: int,
+        RandomGenerator: np.random.Generator | int | None = None,
+    ) -> tuple[np.ndarray,np.ndarray]:
+    """
+    Function for creating a random symmetric
+    instance of the Quadratic Assignment Problem
+    (QAP), with integer flows between facilities
+    and Manhattan distances between locations of
+    a grid.
+
+    Parameters
+    ----------
+    Size: int
+        Number of facilities and locations
+
+    RandomGenerator: np.random.Generator | int | None
+        Random generator (or its seed) used to sample the instance
+
+    Returns
+    -------
+    Flows: np.ndarray
+        Flows between the facilities of shape `(Size,Size)`
+
+    Distances: np.ndarray
+        Distances between the locations of shape `(Size,Size)`
+    """
+
+    RandomGenerator = CreateRandomGenerator(RandomGenerator)
+
+    Flows = np.triu(RandomGenerator.integers(0,10,(Size,Size)),1)
+    Flows = (Flows+Flows.T).astype(float)
+
+    Side = int(np.ceil(np.sqrt(Size)))
+    Locations = RandomGenerator.permutation(Side*Side)[:Size]
+    Points = np.stack(np.divmod(Locations,Side),axis=1)
+    Distances = np.abs(Points[:,None]-Points[None]).sum(axis=-1).astype(float)
+
+    return Flows , Distances
+
+def AssignmentCost(
+        Flows: np.ndarray,
+        Distances: np.ndarray,
+    ) -> Callable[[np.ndarray],np.ndarray]:
+    """
+    Function for creating the objective function
+    of a QAP instance, `sum(Flows[i,j]*Distances[p[i],p[j]])`.
+
+    Parameters
+    ----------
+    Flows: np.ndarray
+        Flows between the facilities of shape `(Size,Size)`
+
+    Distances: np.ndarray
+        Distances between the locations of shape `(Size,Size)`
+
+    Return
+    ------
+    AssignmentCostFunction: Callable[[np.ndarray],np.ndarray]
+        Batch-capable function that takes an assignment (permutation) of shape
+        `(Size,)` or assignments of shape `(Count,Size)` and returns their costs
+    """
+
+    def AssignmentCostFunction(
+            Assignments: np.ndarray,
+        ) -> np.ndarray | float:
+        Assignments = np.asarray(Assignments)
+        return np.sum(Flows*Distances[Assignments[...,:,None],Assignments[...,None,:]],axis=(-2,-1))
+
+    return AssignmentCostFunction
+
+def AssignmentSwapGain(
+        Flows: np.ndarray,
+        Distances: np.ndarray,
+    ) -> Callable[[np.ndarray,np.ndarray],np.ndarray]:
+    """
+    Function for creating the incremental (delta)
+    evaluation of swap moves of a symmetric QAP
+    instance with zero diagonals, to be used as
+    `MoveGain` of Tabu Search.
+
+    Parameters
+    ----------
+    Flows: np.ndarray
+        Flows between the facilities of shape `(Size,Size)`
+
+    Distances: np.ndarray
+        Distances between the locations of shape `(Size,Size)`
+
+    Return
+    ------
+    SwapGain: Callable[[np.ndarray,np.ndarray],np.ndarray]
+        Function that takes an assignment of shape `(Size,)` and swap
+        moves of shape `(Moves,2)` and returns the change of the cost
+    """
+
+    def SwapGain(
+            Assignment: np.ndarray,
+            Moves: np.ndarray,
+        ) -> np.ndarray:
+        First , Second = Moves[:,0] , Moves[:,1]
+        LocationsDistances = Distances[:,Assignment]
+        FlowsDifference = Flows[First] - Flows[Second]
+        DistancesDifference = LocationsDistances[Assignment[Second]] - LocationsDistances[Assignment[First]]
+        Correction = Flows[First,Second]*Distances[Assignment[First],Assignment[Second]]
+        return 2*(np.einsum('ij,ij->i',FlowsDifference,DistancesDifference) + 2*Correction)
+
+    return SwapGain
+
+def SwapMoves(
+        Size: int,
+    ) -> np.ndarray:
+    """
+    Function for getting all the swap moves
+    (pairs of positions) of a permutation.
+
+    Parameters
+    ----------
+    Size: int
+        Size of the permutation
+
+    Return
+    ------
+    Moves: np.ndarray
+        Pairs of positions of shape `(Size*(Size-1)/2,2)`
+    """
+
+    return np.stack(np.triu_indices(Size,1),axis=1)
+
+def SwapNeighborhood(
+        Size: int,
+        MaxMoves: int | None = None,
+    ) -> Callable[[np.ndarray,Any,np.random.Generator],MoveNeighborhood]:
+    """
+    Function for creating the neighborhood generator
+    of Tabu Search with the swap moves of a permutation.
+    For large permutations, a random sample of at most
+    `MaxMoves` moves is taken at each iteration, so the
+    neighborhood does not grow as `Size**2`.
+
+    Parameters
+    ----------
+    Size: int
+        Size of the permutations
+
+    MaxMoves: int | None
+        Maximum number of moves of each neighborhood. If None, all the moves are used
+
+    Return
+    ------
+    GenerateNeighborhood: Callable[[np.ndarray,Any,np.random.Generator],MoveNeighborhood]
+        Function that takes a permutation, the tabu list and the random
+        generator and returns its neighborhood of swap moves
+    """
+
+    Moves = SwapMoves(Size)
+    NumMoves = len(Moves) if MaxMoves is None else min(len(Moves),MaxMoves)
+
+    def GenerateNeighborhood(
+            Solution: np.ndarray,
+            TabuList: Any,
+            RandomGenerator: np.random.Generator,
+        ) -> MoveNeighborhood:
+        if NumMoves == len(Moves):
+            return MoveNeighborhood(Solution,Moves,ApplySwap)
+
+        return MoveNeighborhood(Solution,Moves[RandomGenerator.choice(len(Moves),NumMoves,replace=False)],ApplySwap)
+
+    return GenerateNeighborhood
+
+def ApplySwap(
+        Permutation: np.ndarray,
+        Move: np.ndarray,
+    ) -> np.ndarray:
+    """
+    Function for applying a swap move to a
+    permutation without modifying it.
+
+    Parameters
+    ----------
+    Permutation: np.ndarray
+        Permutation of shape `(Size,)`
+
+    Move: np.ndarray
+        Pair of positions to swap
+
+    Return
+    ------
+    Neighbor: np.ndarray
+        Permutation with the positions swapped
+    """
+
+    Neighbor = Permutation.copy()
+    Neighbor[Move[0]] , Neighbor[Move[1]] = Permutation[Move[1]] , Permutation[Move[0]]
+    return Neighbor
+
+def RandomSwap(
+        Permutations: np.ndarray,
+        RandomGenerator: np.random.Generator,
+    ) -> np.ndarray:
+    """
+    Function for getting a random swap neighbor
+    of a permutation, or of each permutation of a
+    batch (e.g. the chains of Simulated Annealing).
+
+    Parameters
+    ----------
+    Permutations: np.ndarray
+        Permutation of shape `(Size,)` or permutations of shape `(Count,Size)`
+
+    RandomGenerator: np.random.Generator
+        Random generator used to sample the swaps
+
+    Return
+    ------
+    Neighbors: np.ndarray
+        Neighbors with the same shape of `Permutations`
+    """
+
+    Neighbors = np.array(Permutations,ndmin=2)
+    Count , Size = Neighbors.shape
+
+    First = RandomGenerator.integers(Size,size=Count)
+    Second = (First+RandomGenerator.integers(1,Size,size=Count)) % Size
+    Rows = np.arange(Count)
+    Neighbors[Rows,First] , Neighbors[Rows,Second] = Neighbors[Rows,Second] , Neighbors[Rows,First]
+
+    return Neighbors.reshape(np.shape(Permutations))
+
+def RandomPermutation(
+        Size: int,
+    ) -> Callable[[np.random.Generator | None],np.ndarray]:
+    """
+    Function for creating an initializer of
+    random permutations.
+
+    Parameters
+    ----------
+    Size: int
+        Size of the permutations
+
+    Return
+    ------
+    InitSolution: Callable[[np.random.Generator | None],np.ndarray]
+        Initializer that takes an optional `RandomGenerator` and returns a permutation
+    """
+
+    def InitSolution(
+            RandomGenerator: np.random.Generator | None = None,
+        ) -> np.ndarray:
+        if RandomGenerator is None:
+            RandomGenerator = np.random.default_rng()
+
+        return RandomGenerator.permutation(Size)
+
+    return InitSolution
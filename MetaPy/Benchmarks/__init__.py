@@ -0,0 +1,3 @@
+from .Functions import Sphere , Rosenbrock , Rastrigin , Ackley , Griewank , Schwefel , FunctionBounds , ShiftedRotated , Bounded
+from .Instances import RandomTSP , TourLength , RandomQAP , AssignmentCost , AssignmentSwapGain , SwapMoves , SwapNeighborhood , ApplySwap , RandomSwap , RandomPermutation
+from .Harness import BenchmarkOptimizer , DefaultCases , RunBenchmarks , CompareBenchmarks
\ No newline at end of file
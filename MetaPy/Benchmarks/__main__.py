@@ -0,0 +1,21 @@
+from argparse import ArgumentParser
+
+from .Harness import DefaultCases , RunBenchmarks , CompareBenchmarks
+
+if __name__ == '__main__':
+    Parser = ArgumentParser(description='Run the benchmarks of MetaPy and compare them with a baseline')
+    Parser.add_argument('FileName',help='Name of the file (without extension) where the results are saved')
+    Parser.add_argument('--Baseline',default=None,help='Name of the file (without extension) of the baseline results')
+    Parser.add_argument('--Label',default='',help='Label of the results (e.g. the version)')
+    Parser.add_argument('--Dimensions',type=int,nargs='+',default=[2,10,100,1_000])
+    Parser.add_argument('--Iterations',type=int,default=100)
+    Parser.add_argument('--Repeats',type=int,default=3)
+    Arguments = Parser.parse_args()
+
+    TableResults = RunBenchmarks(DefaultCases(tuple(Arguments.Dimensions),Arguments.Iterations),Arguments.FileName,Arguments.Label,Arguments.Repeats)
+    for row in TableResults.to_pylist():
+        print(f"{row['Name']:<40} {row['EvaluationsPerSecond']:14.1f} eval/s {row['IterationsPerSecond']:12.1f} it/s {row['PeakMemory']/2**20:10.2f} MiB  optimal: {row['OptimalValue']:.6g}")
+
+    if Arguments.Baseline is not None:
+        for row in CompareBenchmarks(Arguments.Baseline,TableResults).to_pylist():
+            print(f"{row['Name']:<40} speed: {row['SpeedRatio']:6.2f}x  memory: {row['MemoryRatio']:6.2f}x{'  REGRESSION' if row['Regression'] else ''}")
@@ -1,6 +1,7 @@
+from copy import copy
 import numpy as np
 
-from ..Base import MetaheuristicOptimizer , MetaheuristicSimulations
+from ..Base import MetaheuristicOptimizer , MetaheuristicSimulations , SerialEvaluator , CreateRandomGenerator , SpawnRandomGenerator , SpawnKeys , CallWithRandomGenerator , StoppingCriteria , CheckpointWriter , Profiler as PhaseProfiler
 
 from typing import Callable , Any
 
@@ -9,6 +10,13 @@ class DifferentialEvolutionOptimizer(MetaheuristicOptimizer,MetaheuristicSimulat
             self,
             ObjectiveFunction: Callable[[np.ndarray],float],
             InitializePopulation: Callable[[int],np.ndarray],
+            BatchObjective: bool = False,
+            Evaluator: SerialEvaluator | None = None,
+            RandomGenerator: np.random.Generator | int | None = None,
+            Stopping: StoppingCriteria | None = None,
+            Checkpoints: CheckpointWriter | None = None,
+            Profiler: PhaseProfiler | None = None,
+            Callbacks: list[Callable[[Any,int],bool | None]] | None = None,
         ):
         """
         Class for implementation of Differential Evolution 
@@ -21,11 +29,49 @@ class DifferentialEvolutionOptimizer(MetaheuristicOptimizer,MetaheuristicSimulat
             Function to optimize. Takes a solution/individual of shape `(Dim,)` and returns its fitness value
 
         InitializePopulation: Callable[[int],np.ndarray]
-            Function to create a population of solutions. Return a `np.ndarray` object of shape `(Size,Dim)`
+            Function to create a population of solutions. Return a `np.ndarray` object of shape `(Size,Dim)`. 
+            It receives the `RandomGenerator` if it has a parameter with that name
+
+        BatchObjective: bool
+            If True, `ObjectiveFunction` takes a whole population of shape `(Size,Dim)` 
+            and returns its fitness values of shape `(Size,)`
+
+        Evaluator: SerialEvaluator | None
+            Evaluator used to compute the fitness values of the populations. 
+            If None, `SerialEvaluator` is used
+
+        RandomGenerator: np.random.Generator | int | None
+            Random generator (or its seed) used for all the randomness of the search
+
+        Stopping: StoppingCriteria | None
+            Stopping criteria checked after the initialization and each iteration besides `Iterations`. 
+            The criterion that stopped the last search is saved in `StopReason`
+
+        Checkpoints: CheckpointWriter | None
+            Writer of the checkpoints of the state of the search (population, 
+            optimal individual, snapshots and random generator), which can be 
+            resumed with `Resume`. If None, no checkpoints are written
+
+        Profiler: PhaseProfiler | None
+            Profiler of the search, which splits the time of each generation into 
+            the `'Mutation'`, `'Crossover'`, `'Evaluation'` and `'Selection'` phases and 
+            counts the offsprings accepted by the selection. The profile of the last 
+            search is saved in `Profile`. If None, the search is not profiled
+
+        Callbacks: list[Callable[[Any,int],bool | None]] | None
+            Functions called after each generation with the optimizer and the number 
+            of the generation. If any of them returns True, the search stops
         """
 
         self.ObjectiveFunction = ObjectiveFunction
         self.InitializePopulation = InitializePopulation
+        self.BatchObjective = BatchObjective
+        self.Evaluator = Evaluator if Evaluator is not None else SerialEvaluator()
+        self.RandomGenerator = CreateRandomGenerator(RandomGenerator)
+        self.Stopping = Stopping if Stopping is not None else StoppingCriteria()
+        self.Checkpoints = Checkpoints
+        self.Profiler = Profiler
+        self.Callbacks = Callbacks
 
     def __call__(
             self,
@@ -62,21 +108,375 @@ class DifferentialEvolutionOptimizer(MetaheuristicOptimizer,MetaheuristicSimulat
             List of the optimal values at each iteration/generation
         """
 
+        self.Start(Iterations,PopulationSize,ScalingFactor,CrossoverRate)
+        return self.Search()
+
+    def Start(
+            self,
+            Iterations: int,
+            PopulationSize: int,
+            ScalingFactor: float,
+            CrossoverRate: float,
+        ) -> None:
+        """
+        Method for starting a search driven by 
+        `Ask` and `Tell`, initializing the (not 
+        evaluated) `Population`.
+
+        Parameters
+        ----------
+        Iterations: int
+            Number of iterations/generations for the search
+
+        PopulationSize: int 
+            Parameter NP. Size of population of solutions
+
+        ScalingFactor: float
+            Parameter F. Scaling factor for difference between vector.
+
+        CrossoverRate: float
+            Parameter Cr. Crossover rate for crossover operation
+        """
+
+        self.Iterations = Iterations
         self.PopulationSize = PopulationSize
         self.ScalingFactor = ScalingFactor
         self.CrossoverRate = CrossoverRate
-        
-        self.InitializeOptimization()
-        self.OptimalIndividual , self.OptimalValue = self.BestOptimalIndividual()
-        self.ProblemDimension = self.OptimalIndividual.shape[0]
+        self.SearchStopping = self.Stopping.Start()
+        self.StartProfile()
 
+        self.Population = np.asarray(CallWithRandomGenerator(self.InitializePopulation,self.RandomGenerator,self.PopulationSize),dtype=float)
         self.Snapshots = []
+        self.Finished = False
+        if self.Profile is not None:
+            self.Profile.Lap('Initialization')
+
+    def Ask(
+            self,
+        ) -> np.ndarray:
+        """
+        Method for getting the solutions to evaluate: 
+        the initial `Population` or the offsprings of 
+        the next generation (mutation and crossover). 
+        The returned array is a buffer reused across 
+        generations.
+
+        Return
+        ------
+        Candidates: np.ndarray
+            Solutions/individuals to evaluate of shape `(PopulationSize,Dim)`
+        """
+
+        if not self.Snapshots:
+            return self.Population
+
+        self.MutationOperation()
+        if self.Profile is not None:
+            self.Profile.Lap('Mutation')
+
+        self.FitnessCrossoverPopulation = None
+        self.CrossoverOperation()
+        if self.FitnessCrossoverPopulation is not None:
+            raise Exception('CrossoverOperation must not evaluate CrossoverPopulation, its fitness values are given to Tell')
+        if self.Profile is not None:
+            self.Profile.Lap('Crossover')
+
+        return self.CrossoverPopulation
+
+    def Tell(
+            self,
+            Candidates: np.ndarray,
+            FitnessValues: np.ndarray,
+            Completed: np.ndarray | None = None,
+        ) -> bool:
+        """
+        Method for advancing the search with the 
+        fitness values of the solutions of `Ask`: 
+        the initial `Population` is set or the 
+        selection of the generation is applied, 
+        and the stopping criteria are checked.
+
+        Parameters
+        ----------
+        Candidates: np.ndarray
+            Solutions/individuals returned by `Ask`
+
+        FitnessValues: np.ndarray
+            Fitness values of the candidates of shape `(PopulationSize,)`
+
+        Completed: np.ndarray | None
+            Mask of the candidates whose evaluation completed (e.g. not cancelled or timed out 
+            in `AsyncEvaluator`). The other ones are not counted and are never selected. 
+            If None, all the evaluations completed
+
+        Return
+        ------
+        Finished: bool
+            True if the search finished
+        """
+
+        if self.Profile is not None:
+            self.Profile.Lap('Evaluation')
+        self.SearchStopping.AddEvaluations(len(FitnessValues) if Completed is None else int(np.count_nonzero(Completed)))
+
+        if not self.Snapshots:
+            self.Population = np.asarray(Candidates,dtype=float)
+            self.FitnessValuesPopulation = np.array(FitnessValues,dtype=float)
+            if Completed is not None:
+                self.FitnessValuesPopulation[~Completed] = np.inf
+            self.AllocateBuffers()
+
+            self.OptimalIndividual , self.OptimalValue = self.BestOptimalIndividual()
+            self.ProblemDimension = self.OptimalIndividual.shape[0]
+            self.WriteSnapshot()
+            if self.Profile is not None:
+                self.Profile.Lap('Initialization')
+
+            self.Finished = self.SearchStopping.Check(self.OptimalValue,self.PopulationDiversity) or self.Iterations <= 0
+            return self.Finished
+
+        if Candidates is not self.CrossoverPopulation:
+            np.copyto(self.CrossoverPopulation,Candidates)
+        self.FitnessCrossoverPopulation = np.asarray(FitnessValues,dtype=float)
+        if Completed is not None:
+            # NaN is never less or equal, so the offsprings not evaluated are never selected
+            self.FitnessCrossoverPopulation = np.where(Completed,self.FitnessCrossoverPopulation,np.nan)
+
+        self.SelectionOperation()
+        if self.Profile is not None:
+            self.Profile.Lap('Selection')
+
         self.WriteSnapshot()
+        Iteration = len(self.Snapshots)-1
+        self.ReportIteration(Iteration,self.OptimalValue)
+
+        Stop = self.SearchStopping.Update(self.OptimalValue,self.PopulationDiversity)
+        self.WriteCheckpoint(Iteration)
+        self.Finished = self.NotifyIteration(Iteration,self.OptimalValue,self.PopulationDiversity) or Stop or Iteration >= self.Iterations
+
+        return self.Finished
+
+    def EvaluateCandidates(
+            self,
+            Candidates: np.ndarray,
+        ) -> np.ndarray:
+        """
+        Method for evaluating the solutions of 
+        `Ask` using `ObjectiveFunction` through 
+        `Evaluator`, calling it once per individual 
+        or once per chunk of population if 
+        `BatchObjective` is True.
+
+        Parameters
+        ----------
+        Candidates: np.ndarray
+            Solutions/individuals of shape `(Size,Dim)`
+
+        Return
+        ------
+        FitnessValues: np.ndarray
+            Fitness values of the candidates of shape `(Size,)`
+        """
 
-        self.FindOptimal(Iterations)
+        return self.Evaluator(self.ObjectiveFunction,Candidates,self.BatchObjective)
+
+    def Finish(
+            self,
+        ) -> tuple[np.ndarray,list[float]]:
+        """
+        Method for finishing the search, saving 
+        the reason of the stop in `StopReason`.
+
+        Returns
+        -------
+        OptimalIndividual: np.ndarray
+            Best solution/individual that was founded
+
+        Snapshots: list[float] 
+            List of the optimal values at each iteration/generation
+        """
+
+        self.StopReason = self.SearchStopping.Finish()
+        self.WaitCheckpoints()
         
         return self.OptimalIndividual , self.Snapshots
+
+    def GetState(
+            self,
+        ) -> dict[str,Any]:
+        """
+        Method for getting a copy of the state of 
+        the search.
+
+        Return
+        ------
+        State: dict[str,Any]
+            Population, fitness values, optimal individual, snapshots, 
+            hyperparameters, stopping criteria and random generator state
+        """
+
+        return {
+                'Iterations': self.Iterations,
+                'PopulationSize': self.PopulationSize,
+                'ScalingFactor': self.ScalingFactor,
+                'CrossoverRate': self.CrossoverRate,
+                'Population': self.Population.copy(),
+                'FitnessValuesPopulation': self.FitnessValuesPopulation.copy(),
+                'OptimalIndividual': self.OptimalIndividual.copy(),
+                'OptimalValue': self.OptimalValue,
+                'Snapshots': np.array(self.Snapshots,dtype=float),
+                'SearchStopping': copy(self.SearchStopping),
+                'RandomState': self.RandomGenerator.bit_generator.state,
+            }
+
+    def SetState(
+            self,
+            State: dict[str,Any],
+        ) -> None:
+        """
+        Method for restoring the state of a search 
+        from `GetState`.
+
+        Parameters
+        ----------
+        State: dict[str,Any]
+            State of the search
+        """
+
+        self.Iterations = State['Iterations']
+        self.PopulationSize = State['PopulationSize']
+        self.ScalingFactor = State['ScalingFactor']
+        self.CrossoverRate = State['CrossoverRate']
+        self.Population = np.array(State['Population'])
+        self.FitnessValuesPopulation = np.array(State['FitnessValuesPopulation'])
+        self.OptimalIndividual = np.array(State['OptimalIndividual'])
+        self.OptimalValue = State['OptimalValue']
+        self.ProblemDimension = self.OptimalIndividual.shape[0]
+        self.Snapshots = State['Snapshots'].tolist()
+        self.SearchStopping = State['SearchStopping']
+        self.RandomGenerator.bit_generator.state = State['RandomState']
+        self.Finished = self.SearchStopping.StopReason is not None or len(self.Snapshots)-1 >= self.Iterations
+
+        self.AllocateBuffers()
     
+    def CallReplicates(
+            self,
+            Iterations: int,
+            Replicates: int,
+            PopulationSize: int,
+            ScalingFactor: float,
+            CrossoverRate: float,
+        ) -> tuple[np.ndarray,np.ndarray]:
+        """
+        Method for searching optimal solutions with several 
+        independent replicates of Differential Evolution 
+        advanced at once as a stacked array of shape 
+        `(Replicates,PopulationSize,Dim)`. The populations 
+        of all the replicates are evaluated together, so a 
+        `BatchObjective` is recommended. All the `Iterations` 
+        are run, `Stopping` criteria are not checked.
+
+        Each replicate draws from its own child of 
+        `RandomGenerator` (derived as in `GenerateSimulations`), 
+        in the same order as a single search, so replicate `k` 
+        follows the trajectory of simulation `k`.
+
+        Parameters
+        ----------
+        Iterations: int
+            Number of iterations/generations for the search
+
+        Replicates: int
+            Number of independent replicates (K)
+
+        PopulationSize: int 
+            Parameter NP. Size of population of solutions
+
+        ScalingFactor: float
+            Parameter F. Scaling factor for difference between vector.
+
+        CrossoverRate: float
+            Parameter Cr. Crossover rate for crossover operation
+
+        Returns
+        -------
+        OptimalIndividuals: np.ndarray
+            Best solution/individual of each replicate of shape `(Replicates,Dim)`
+
+        Snapshots: np.ndarray
+            Optimal values of each replicate at each iteration/generation 
+            of shape `(Replicates,Iterations+1)`
+        """
+
+        self.SearchStopping = self.Stopping.Start()
+
+        RandomGenerators = [SpawnRandomGenerator(self.RandomGenerator,SpawnKeys['Simulations'],replicate) for replicate in range(Replicates)]
+        Population = np.concatenate([np.asarray(CallWithRandomGenerator(self.InitializePopulation,random_generator,PopulationSize),dtype=float) for random_generator in RandomGenerators])
+        ProblemDimension = Population.shape[1]
+        FitnessValuesPopulation = self.EvaluatePopulation(Population)
+
+        FlatPopulation = Population
+        Population = Population.reshape(Replicates,PopulationSize,ProblemDimension)
+        FitnessValuesPopulation = FitnessValuesPopulation.reshape(Replicates,PopulationSize)
+
+        ReplicateOffsets = (np.arange(Replicates)*PopulationSize)[:,None]
+        ReplicateIndexes = np.arange(Replicates)
+        FlatIndexes = np.arange(Replicates*PopulationSize)
+
+        MutatedPopulation = np.empty_like(FlatPopulation)
+        DifferencePopulation = np.empty_like(FlatPopulation)
+        CrossoverPopulation = np.empty_like(FlatPopulation)
+        CrossoverRandom = np.empty((Replicates,PopulationSize,ProblemDimension),dtype=float)
+        RandomIndexes = np.empty((3,Replicates,PopulationSize),dtype=np.intp)
+        IndexesMutated = np.empty((Replicates,PopulationSize),dtype=np.intp)
+        CrossoverThreshold = np.empty(FlatPopulation.shape,dtype=bool)
+        SelectionMask = np.empty((Replicates,PopulationSize),dtype=bool)
+
+        IndexesOptimal = np.argmin(FitnessValuesPopulation,axis=1)
+        OptimalIndividuals = Population[ReplicateIndexes,IndexesOptimal].copy()
+        OptimalValues = FitnessValuesPopulation[ReplicateIndexes,IndexesOptimal].copy()
+
+        Snapshots = np.empty((Replicates,Iterations+1),dtype=float)
+        Snapshots[:,0] = OptimalValues
+
+        for iteration in range(1,Iterations+1):
+            for replicate , random_generator in enumerate(RandomGenerators):
+                for sample in range(3):
+                    RandomIndexes[sample,replicate] = random_generator.integers(PopulationSize,size=PopulationSize)
+                random_generator.random(out=CrossoverRandom[replicate])
+                IndexesMutated[replicate] = random_generator.integers(ProblemDimension,size=PopulationSize)
+
+            FlatRandomIndexes = (RandomIndexes+ReplicateOffsets).reshape(3,-1)
+            np.take(FlatPopulation,FlatRandomIndexes[0],axis=0,out=MutatedPopulation)
+            np.take(FlatPopulation,FlatRandomIndexes[1],axis=0,out=DifferencePopulation)
+            np.take(FlatPopulation,FlatRandomIndexes[2],axis=0,out=CrossoverPopulation)
+
+            np.subtract(DifferencePopulation,CrossoverPopulation,out=DifferencePopulation)
+            DifferencePopulation *= ScalingFactor
+            MutatedPopulation += DifferencePopulation
+
+            np.less_equal(CrossoverRandom.reshape(FlatPopulation.shape),CrossoverRate,out=CrossoverThreshold)
+            CrossoverThreshold[FlatIndexes,IndexesMutated.reshape(-1)] = True
+
+            np.copyto(CrossoverPopulation,FlatPopulation)
+            np.copyto(CrossoverPopulation,MutatedPopulation,where=CrossoverThreshold)
+
+            FitnessCrossoverPopulation = self.EvaluatePopulation(CrossoverPopulation).reshape(Replicates,PopulationSize)
+
+            np.less_equal(FitnessCrossoverPopulation,FitnessValuesPopulation,out=SelectionMask)
+            np.copyto(Population,CrossoverPopulation.reshape(Population.shape),where=SelectionMask[...,None])
+            np.copyto(FitnessValuesPopulation,FitnessCrossoverPopulation,where=SelectionMask)
+
+            IndexesOptimal = np.argmin(FitnessValuesPopulation,axis=1)
+            BestValues = FitnessValuesPopulation[ReplicateIndexes,IndexesOptimal]
+            Improved = BestValues < OptimalValues
+            OptimalValues[Improved] = BestValues[Improved]
+            OptimalIndividuals[Improved] = Population[ReplicateIndexes[Improved],IndexesOptimal[Improved]]
+
+            Snapshots[:,iteration] = OptimalValues
+
+        return OptimalIndividuals , Snapshots
+
     def FineTuningHyperparameters(
             self,
             Iterations: int,
@@ -87,17 +487,20 @@ class DifferentialEvolutionOptimizer(MetaheuristicOptimizer,MetaheuristicSimulat
                 },
             NumTrials: int = 10,
             NumJobs: int = 1,
+            **KwFineTuning,
         ) -> dict[str,Any]:
 
-        return super().FineTuningHyperparameters(Iterations,Hyperparameters,NumTrials,NumJobs)
-    
+        return super().FineTuningHyperparameters(Iterations,Hyperparameters,NumTrials,NumJobs,**KwFineTuning)
+
     def FindOptimal(
             self,
             Iterations: int,
         ) -> None:
         """
         Method for finding the optimal solution 
-        for the `ObjectiveFunction`.
+        for the `ObjectiveFunction` until `Iterations` 
+        are run or a stopping criterion is met, asking 
+        and telling the generations of the search.
 
         Parameter
         ---------
@@ -105,42 +508,50 @@ class DifferentialEvolutionOptimizer(MetaheuristicOptimizer,MetaheuristicSimulat
             Number of iterations/generations for the search
         """
 
-        for iteration in range(Iterations):
-            self.MutationOperation()
-            self.CrossoverOperation()
-
-            self.SelectionOperation()
-            
-            self.WriteSnapshot()
-
+        self.Iterations = Iterations
+        while not self.Finished:
+            Candidates = self.Ask()
+            self.Tell(Candidates,self.EvaluateCandidates(Candidates))
+    
     def MutationOperation(
             self,
         ) -> None:
         """
         Method for applying Differential Evolution 
-        Mutation Operation to the `Population`.
+        Mutation Operation to the `Population`. 
+        The mutated population is written into the 
+        preallocated `MutatedPopulation` buffer.
         """
 
-        self.MutatedPopulation = self.RandomSampleSolutions()
-        self.MutatedPopulation += self.ScalingFactor*(self.RandomSampleSolutions()-self.RandomSampleSolutions())
+        self.RandomSampleSolutions(self.MutatedPopulation)
+        self.RandomSampleSolutions(self.DifferencePopulation)
+        self.RandomSampleSolutions(self.CrossoverPopulation)
+
+        np.subtract(self.DifferencePopulation,self.CrossoverPopulation,out=self.DifferencePopulation)
+        self.DifferencePopulation *= self.ScalingFactor
+        self.MutatedPopulation += self.DifferencePopulation
     
     def CrossoverOperation(
             self,
         ) -> None:
         """
         Method for applying Differential Evolution 
-        Crossover Operation to the `Population`.
+        Crossover Operation to the `Population`. 
+        The offsprings are written into the 
+        preallocated `CrossoverPopulation` buffer. 
+        They are not evaluated here: `Ask` returns 
+        them and `Tell` sets `FitnessCrossoverPopulation` 
+        before `SelectionOperation`.
         """
 
-        CrossoverThreshold = np.random.random((self.PopulationSize,self.ProblemDimension)) <= self.CrossoverRate
+        self.RandomGenerator.random(out=self.CrossoverRandom)
+        np.less_equal(self.CrossoverRandom,self.CrossoverRate,out=self.CrossoverThreshold)
         
-        IndexesMutated = np.random.randint(self.ProblemDimension,size=self.PopulationSize)
-        CrossoverThreshold[self.PopulationIndexes,IndexesMutated] = True
+        IndexesMutated = self.RandomGenerator.integers(self.ProblemDimension,size=self.PopulationSize)
+        self.CrossoverThreshold[self.PopulationIndexes,IndexesMutated] = True
         
-        self.CrossoverPopulation = self.Population.copy()
-        self.CrossoverPopulation[CrossoverThreshold] = self.MutatedPopulation[CrossoverThreshold]
-
-        self.FitnessCrossoverPopulation = np.apply_along_axis(self.ObjectiveFunction,1,self.CrossoverPopulation)
+        np.copyto(self.CrossoverPopulation,self.Population)
+        np.copyto(self.CrossoverPopulation,self.MutatedPopulation,where=self.CrossoverThreshold)
 
     def SelectionOperation(
             self,
@@ -151,32 +562,92 @@ class DifferentialEvolutionOptimizer(MetaheuristicOptimizer,MetaheuristicSimulat
         and `CrossoverPopulation` (Offsprings solutions/individuals).
         """
 
-        for index_individual in self.PopulationIndexes:
-            fitness_crossovered = self.FitnessCrossoverPopulation[index_individual]
-            fitness_population = self.FitnessValuesPopulation[index_individual]
-            
-            if fitness_crossovered <= fitness_population:
-                crossovered_individual = self.CrossoverPopulation[index_individual]
-                self.Population[index_individual] = crossovered_individual
-                self.FitnessValuesPopulation[index_individual] = fitness_crossovered
+        np.less_equal(self.FitnessCrossoverPopulation,self.FitnessValuesPopulation,out=self.SelectionMask)
+        np.copyto(self.Population,self.CrossoverPopulation,where=self.SelectionMask[:,None])
+        np.copyto(self.FitnessValuesPopulation,self.FitnessCrossoverPopulation,where=self.SelectionMask)
+        if self.Profile is not None:
+            self.Profile.Count('Proposed',self.PopulationSize)
+            self.Profile.Count('Accepted',int(np.count_nonzero(self.SelectionMask)))
 
-                if fitness_crossovered < self.OptimalValue:
-                    self.OptimalValue = fitness_crossovered
-                    self.OptimalIndividual = crossovered_individual
+        BestOptimalIndividual , BestOptimalValue = self.BestOptimalIndividual()
+        if BestOptimalValue < self.OptimalValue:
+            self.OptimalValue = BestOptimalValue
+            self.OptimalIndividual = BestOptimalIndividual
 
     def InitializeOptimization(
             self,
         ) -> None:
         """
         Method for initializing `Population` and 
-        `FitnessValuesPopulation` attributes.
+        `FitnessValuesPopulation` attributes and the 
+        work buffers reused across generations of a 
+        search started with `Start`, asking and 
+        telling the initial `Population`.
         """
 
-        self.Population = self.InitializePopulation(self.PopulationSize)
-        self.FitnessValuesPopulation = np.apply_along_axis(self.ObjectiveFunction,1,self.Population)
+        if not self.Snapshots:
+            Candidates = self.Ask()
+            self.Tell(Candidates,self.EvaluateCandidates(Candidates))
+
+    def AllocateBuffers(
+            self,
+        ) -> None:
+        """
+        Method for allocating the work buffers 
+        reused across generations for the 
+        current `Population`.
+        """
 
         self.PopulationIndexes = np.arange(self.PopulationSize)
 
+        self.MutatedPopulation = np.empty_like(self.Population)
+        self.DifferencePopulation = np.empty_like(self.Population)
+        self.CrossoverPopulation = np.empty_like(self.Population)
+        self.CrossoverRandom = np.empty_like(self.Population)
+        self.CrossoverThreshold = np.empty(self.Population.shape,dtype=bool)
+        self.SelectionMask = np.empty(self.PopulationSize,dtype=bool)
+
+    def EvaluatePopulation(
+            self,
+            Population: np.ndarray,
+        ) -> np.ndarray:
+        """
+        Method for evaluating the fitness values of 
+        a population using `ObjectiveFunction` through 
+        `Evaluator`, calling it once per individual or 
+        once per chunk of population if `BatchObjective` 
+        is True.
+
+        Parameters
+        ----------
+        Population: np.ndarray
+            Population of solutions of shape `(Size,Dim)`
+
+        Return
+        ------
+        FitnessValues: np.ndarray
+            Fitness values of the population of shape `(Size,)`
+        """
+
+        self.SearchStopping.AddEvaluations(Population.shape[0])
+        return self.EvaluateCandidates(Population)
+
+    def PopulationDiversity(
+            self,
+        ) -> float:
+        """
+        Method for computing the diversity of the 
+        `Population` as the mean of the standard 
+        deviation of each variable.
+
+        Return
+        ------
+        Diversity: float
+            Diversity of the `Population`
+        """
+
+        return float(np.mean(np.std(self.Population,axis=0)))
+
     def BestOptimalIndividual(
             self,
         ) -> tuple[np.ndarray,float]:
@@ -194,7 +665,7 @@ class DifferentialEvolutionOptimizer(MetaheuristicOptimizer,MetaheuristicSimulat
         """
 
         IndexOptimalIndividual = np.argmin(self.FitnessValuesPopulation)
-        return self.Population[IndexOptimalIndividual] , self.FitnessValuesPopulation[IndexOptimalIndividual]
+        return self.Population[IndexOptimalIndividual].copy() , self.FitnessValuesPopulation[IndexOptimalIndividual]
     
     def WriteSnapshot(
             self,
@@ -208,17 +679,23 @@ class DifferentialEvolutionOptimizer(MetaheuristicOptimizer,MetaheuristicSimulat
 
     def RandomSampleSolutions(
             self,
+            RandomSample: np.ndarray,
         ) -> np.ndarray:
         """
         Method for generating a random 
         sample of solutions/individuals 
         from the `Population`.
 
+        Parameters
+        ----------
+        RandomSample: np.ndarray
+            Buffer of shape `(PopulationSize,Dim)` where the sample is written
+
         Return
         ------
         RandomSample : np.ndarray
             Random sample of solutions/individuals from the `Population`
         """
 
-        RandomIndexes =  np.random.randint(self.PopulationSize,size=self.PopulationSize)
-        return self.Population[RandomIndexes]
\ No newline at end of file
+        RandomIndexes = self.RandomGenerator.integers(self.PopulationSize,size=self.PopulationSize)
+        return np.take(self.Population,RandomIndexes,axis=0,out=RandomSample)
\ No newline at end of file
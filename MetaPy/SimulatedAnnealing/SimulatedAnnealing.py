@@ -1,17 +1,28 @@
-from random import choice
+from itertools import islice
+from inspect import signature , Parameter
+from copy import copy , deepcopy
 import numpy as np
 
-from ..Base import MetaheuristicOptimizer , MetaheuristicSimulations
+from ..Base import MetaheuristicOptimizer , MetaheuristicSimulations , SerialEvaluator , CreateRandomGenerator , CallWithRandomGenerator , StoppingCriteria , CheckpointWriter , Profiler as PhaseProfiler
 
-from typing import Callable , Any
+from typing import Callable , Iterable , Iterator , Any
 
 class SimulatedAnnealingOptimizer(MetaheuristicSimulations,MetaheuristicOptimizer):
     def __init__(
             self,
             ObjectiveFunction: Callable[[np.ndarray],float],
             InitializeSolution: Callable[[],np.ndarray],
-            GenerateNeighborhood: Callable[[np.ndarray],list[np.ndarray]],
-            TemperatureSchedule: Callable[[float,float],list[float]],
+            GenerateNeighborhood: Callable[[np.ndarray],list[np.ndarray]] | None,
+            TemperatureSchedule: Callable[[float,float,int],Iterable[float]],
+            Evaluator: SerialEvaluator | None = None,
+            RandomGenerator: np.random.Generator | int | None = None,
+            Stopping: StoppingCriteria | None = None,
+            GenerateRandomNeighbor: Callable[[np.ndarray],np.ndarray] | None = None,
+            BlockSize: int = 1024,
+            BatchObjective: bool = False,
+            Checkpoints: CheckpointWriter | None = None,
+            Profiler: PhaseProfiler | None = None,
+            Callbacks: list[Callable[[Any,int],bool | None]] | None = None,
         ):
         """
         Class for implementation of Simulated Annealing 
@@ -26,21 +37,79 @@ class SimulatedAnnealingOptimizer(MetaheuristicSimulations,MetaheuristicOptimize
         InitializeSolution: Callable[[],np.ndarray]
             Function to initialize a feasible solution/individual
 
-        GenerateNeighborhood: Callable[[np.ndarray],list[np.ndarray]]
-            Function to generate the neighborhood of a solution
+        GenerateNeighborhood: Callable[[np.ndarray],list[np.ndarray]] | None
+            Function to generate the neighborhood of a solution. Only used (and 
+            required) if `GenerateRandomNeighbor` is None
 
-        TemperatureSchedule: Callable[[float,float],list[float]],
-            Function to get the temperature in each iteration based on initial and final temperature hyperparameters
+        TemperatureSchedule: Callable[[float,float,int],Iterable[float]],
+            Function to get the temperature in each iteration based on initial and final temperature 
+            hyperparameters and the number of iterations (see `TemperatureSchedules` module). Schedules 
+            with only the two temperature parameters are also accepted and truncated to `Iterations`
+
+        Evaluator: SerialEvaluator | None
+            Evaluator used to score the solutions (the neighbor of each iteration, 
+            or the chains in multi-chain mode). If None, `SerialEvaluator` is used
+
+        RandomGenerator: np.random.Generator | int | None
+            Random generator (or its seed) used for all the randomness of the search. 
+            `InitializeSolution` and `GenerateNeighborhood` receive it if they have 
+            a parameter with that name
+
+        Stopping: StoppingCriteria | None
+            Stopping criteria checked after the initialization and each iteration besides `Iterations`. 
+            The criterion that stopped the last search is saved in `StopReason`
+
+        GenerateRandomNeighbor: Callable[[np.ndarray],np.ndarray] | None
+            Function to generate a single random neighbor of a solution, so the 
+            whole neighborhood is not built at each iteration. It receives the 
+            `RandomGenerator` if it has a parameter with that name. In multi-chain 
+            mode it receives the solutions of all the chains of shape `(Chains,Dim)` 
+            and returns a neighbor for each one
+
+        BlockSize: int
+            Number of temperatures and uniform draws of the acceptance test 
+            precomputed at once as arrays
+
+        BatchObjective: bool
+            If True, `ObjectiveFunction` takes several solutions of shape `(Size,Dim)` 
+            and returns their fitness values of shape `(Size,)`
+
+        Checkpoints: CheckpointWriter | None
+            Writer of the checkpoints of the state of the (single chain) search 
+            (current and optimal solutions, position of the temperature schedule, 
+            snapshots and random generator), which can be resumed with `Resume`. 
+            If None, no checkpoints are written
+
+        Profiler: PhaseProfiler | None
+            Profiler of the search, which splits the time of each iteration into the 
+            `'Schedule'` (temperatures and acceptance thresholds), `'Neighbor'`, 
+            `'Evaluation'` and `'Acceptance'` phases and counts the accepted neighbors. 
+            In multi-chain mode, the diversity of the chains can be recorded. The 
+            profile of the last search is saved in `Profile`. If None, the search is 
+            not profiled
+
+        Callbacks: list[Callable[[Any,int],bool | None]] | None
+            Functions called after each iteration with the optimizer and the number 
+            of the iteration. If any of them returns True, the search stops
         """
 
         self.ObjectiveFunction = ObjectiveFunction
         self.InitializeSolution = InitializeSolution
         self.GenerateNeighborhood = GenerateNeighborhood
         self.TemperatureSchedule = TemperatureSchedule
+        self.Evaluator = Evaluator if Evaluator is not None else SerialEvaluator()
+        self.RandomGenerator = CreateRandomGenerator(RandomGenerator)
+        self.Stopping = Stopping if Stopping is not None else StoppingCriteria()
+        self.GenerateRandomNeighbor = GenerateRandomNeighbor
+        self.BlockSize = BlockSize
+        self.BatchObjective = BatchObjective
+        self.Checkpoints = Checkpoints
+        self.Profiler = Profiler
+        self.Callbacks = Callbacks
 
     def __call__(
             self,
-            Iteartions: int,
+            Iterations: int,
             InitialTemperature: float,
             FinalTemperature: float,
         ) -> tuple[np.ndarray,list[float]]:
@@ -52,8 +121,8 @@ class SimulatedAnnealingOptimizer(MetaheuristicSimulations,MetaheuristicOptimize
 
         Parameters
         ----------
-        Iteartions: int
-            A dummy variable to maintain consistency in the library. It is not used during the optimization
+        Iterations: int
+            Number of iterations (temperatures) for the search
 
         InitialTemperature: float
             Initial temperature for the annealing
@@ -70,40 +139,574 @@ class SimulatedAnnealingOptimizer(MetaheuristicSimulations,MetaheuristicOptimize
             List of the optimal values at each iteration/generation
         """
 
-        CurrentSolution = self.InitializeSolution()
-        CurrentFitnessValue = self.ObjectiveFunction(CurrentSolution)
+        self.Start(Iterations,InitialTemperature,FinalTemperature)
+        return self.Search()
+
+    def Start(
+            self,
+            Iterations: int,
+            InitialTemperature: float,
+            FinalTemperature: float,
+        ) -> None:
+        """
+        Method for starting a search driven by 
+        `Ask` and `Tell`, initializing the (not 
+        evaluated) current solution and the 
+        temperature schedule.
+
+        Parameters
+        ----------
+        Iterations: int
+            Number of iterations (temperatures) for the search
+
+        InitialTemperature: float
+            Initial temperature for the annealing
+
+        FinalTemperature: float
+            Final temperature for the annealing
+        """
+
+        self.Iterations = Iterations
+        self.InitialTemperature = InitialTemperature
+        self.FinalTemperature = FinalTemperature
+        self.SearchStopping = self.Stopping.Start()
+        self.StartProfile()
+
+        self.CurrentSolution = CallWithRandomGenerator(self.InitializeSolution,self.RandomGenerator)
+
+        self.Temperatures = self.ScheduleTemperatures(InitialTemperature,FinalTemperature,Iterations)
+        self.Thresholds = self.AcceptanceThresholds(self.Temperatures)
+        self.AcceptanceThreshold = None
+
+        self.Snapshots = []
+        self.Finished = False
+        if self.Profile is not None:
+            self.Profile.Lap('Initialization')
+
+    def Ask(
+            self,
+        ) -> list[np.ndarray]:
+        """
+        Method for getting the solution to evaluate: 
+        the initial solution or a random neighbor of 
+        the current solution.
+
+        Return
+        ------
+        Candidates: list[np.ndarray]
+            Solution to evaluate
+        """
+
+        if not self.Snapshots:
+            return [self.CurrentSolution]
+
+        random_neighbor = self.RandomNeighbor(self.CurrentSolution)
+        if self.Profile is not None:
+            self.Profile.Lap('Neighbor')
+
+        return [random_neighbor]
+
+    def Tell(
+            self,
+            Candidates: list[np.ndarray],
+            FitnessValues: list[float] | np.ndarray,
+            Completed: np.ndarray | None = None,
+        ) -> bool:
+        """
+        Method for advancing the search with the 
+        fitness value of the solution of `Ask`: the 
+        neighbor is accepted with the Metropolis test 
+        at the temperature of the iteration, and the 
+        threshold of the next iteration is drawn.
+
+        Parameters
+        ----------
+        Candidates: list[np.ndarray]
+            Solution returned by `Ask`
+
+        FitnessValues: list[float] | np.ndarray
+            Fitness value of the solution
+
+        Completed: np.ndarray | None
+            Mask of the candidates whose evaluation completed (e.g. not cancelled or timed out 
+            in `AsyncEvaluator`). The other ones are not counted and are never selected. 
+            If None, all the evaluations completed
+
+        Return
+        ------
+        Finished: bool
+            True if the search finished
+        """
+
+        if self.Profile is not None:
+            self.Profile.Lap('Evaluation')
+        self.SearchStopping.AddEvaluations(len(Candidates) if Completed is None else int(np.count_nonzero(Completed)))
+        completed_neighbor = Completed is None or bool(Completed[0])
+        random_neighbor , fitness_neighbor = Candidates[0] , FitnessValues[0] if completed_neighbor else np.inf
+
+        if not self.Snapshots:
+            self.CurrentSolution = random_neighbor
+            self.CurrentFitnessValue = fitness_neighbor
+            self.OptimalSolution = self.CurrentSolution.copy()
+            self.OptimalFitnessValue = self.CurrentFitnessValue
+
+            self.Snapshots.append(self.OptimalFitnessValue)
+            if not self.SearchStopping.Check(self.OptimalFitnessValue) and self.Iterations > 0:
+                self.AcceptanceThreshold = next(self.Thresholds,None)
+            if self.Profile is not None:
+                self.Profile.Lap('Initialization')
+
+            self.Finished = self.AcceptanceThreshold is None
+            return self.Finished
+
+        improved = completed_neighbor and fitness_neighbor < self.OptimalFitnessValue
+        if completed_neighbor and fitness_neighbor <= self.OptimalFitnessValue:
+            self.OptimalSolution = random_neighbor
+            self.OptimalFitnessValue = fitness_neighbor
+
+        accepted = completed_neighbor and ((fitness_neighbor <= self.CurrentFitnessValue) or (fitness_neighbor-self.CurrentFitnessValue < self.AcceptanceThreshold))
+        if accepted:
+            self.CurrentSolution = random_neighbor
+            self.CurrentFitnessValue = fitness_neighbor
+
+        if hasattr(self.Temperatures,'Feedback'):
+            self.Temperatures.Feedback(float(accepted),improved)
+        if self.Profile is not None:
+            self.Profile.Count('Proposed')
+            self.Profile.Count('Accepted',int(accepted))
+            self.Profile.Lap('Acceptance')
+
+        self.Snapshots.append(self.OptimalFitnessValue)
+        Iteration = len(self.Snapshots)-1
+        self.ReportIteration(Iteration,self.OptimalFitnessValue)
+
+        Stop = self.SearchStopping.Update(self.OptimalFitnessValue)
+        self.AcceptanceThreshold = next(self.Thresholds,None) if not Stop and Iteration < self.Iterations else None
+        if self.Profile is not None:
+            self.Profile.Lap('Schedule')
+
+        self.WriteCheckpoint(Iteration)
+        self.Finished = self.NotifyIteration(Iteration,self.OptimalFitnessValue) or self.AcceptanceThreshold is None
+
+        return self.Finished
+
+    def EvaluateCandidates(
+            self,
+            Candidates: list[np.ndarray],
+        ) -> np.ndarray:
+        """
+        Method for evaluating the solutions of `Ask` 
+        through `Evaluator`.
+
+        Parameters
+        ----------
+        Candidates: list[np.ndarray]
+            Solutions to evaluate
+
+        Return
+        ------
+        FitnessValues: np.ndarray
+            Fitness values of the solutions of shape `(Size,)`
+        """
+
+        return self.Evaluator(self.ObjectiveFunction,np.stack(Candidates) if self.BatchObjective else Candidates,self.BatchObjective)
+
+    def Finish(
+            self,
+        ) -> tuple[np.ndarray,list[float]]:
+        """
+        Method for finishing the search, saving 
+        the reason of the stop in `StopReason`.
+
+        Returns
+        -------
+        OptimalIndividual: np.ndarray
+            Best solution/individual that was founded
+
+        Snapshots: list[float] 
+            List of the optimal values at each iteration/generation
+        """
+
+        self.StopReason = self.SearchStopping.Finish()
+        self.WaitCheckpoints()
+
+        return self.OptimalSolution , self.Snapshots
+
+    def GetState(
+            self,
+        ) -> dict[str,Any]:
+        """
+        Method for getting a copy of the state of 
+        the (single chain) search. The position of 
+        the temperature schedule is saved as the 
+        number of temperatures taken from it, or as 
+        a copy of the schedule if it is adaptive 
+        (with a `Feedback` method).
+
+        Return
+        ------
+        State: dict[str,Any]
+            Current and optimal solutions, schedule position, pending 
+            acceptance thresholds, snapshots, hyperparameters, stopping 
+            criteria and random generator state
+        """
+
+        PendingPosition = self.BlockPosition if self.AcceptanceThreshold is not None else self.BlockPosition+1
+        PendingThresholds = np.array(self.AcceptanceBlock[PendingPosition:],dtype=float)
+
+        return {
+                'Iterations': self.Iterations,
+                'InitialTemperature': self.InitialTemperature,
+                'FinalTemperature': self.FinalTemperature,
+                'CurrentSolution': np.array(self.CurrentSolution),
+                'CurrentFitnessValue': self.CurrentFitnessValue,
+                'OptimalSolution': np.array(self.OptimalSolution),
+                'OptimalFitnessValue': self.OptimalFitnessValue,
+                'Temperatures': deepcopy(self.Temperatures) if hasattr(self.Temperatures,'Feedback') else None,
+                'TemperaturesTaken': len(self.Snapshots)-1+PendingThresholds.shape[0],
+                'PendingThresholds': PendingThresholds,
+                'Snapshots': np.array(self.Snapshots,dtype=float),
+                'SearchStopping': copy(self.SearchStopping),
+                'RandomState': self.RandomGenerator.bit_generator.state,
+            }
+
+    def SetState(
+            self,
+            State: dict[str,Any],
+        ) -> None:
+        """
+        Method for restoring the state of a search 
+        from `GetState`.
+
+        Parameters
+        ----------
+        State: dict[str,Any]
+            State of the search
+        """
+
+        self.Iterations = State['Iterations']
+        self.InitialTemperature = State['InitialTemperature']
+        self.FinalTemperature = State['FinalTemperature']
+        self.CurrentSolution = np.array(State['CurrentSolution'])
+        self.CurrentFitnessValue = State['CurrentFitnessValue']
+        self.OptimalSolution = np.array(State['OptimalSolution'])
+        self.OptimalFitnessValue = State['OptimalFitnessValue']
+        self.Snapshots = State['Snapshots'].tolist()
+        self.SearchStopping = State['SearchStopping']
+        self.RandomGenerator.bit_generator.state = State['RandomState']
+
+        if State['Temperatures'] is not None:
+            self.Temperatures = State['Temperatures']
+        else:
+            Temperatures = self.ScheduleTemperatures(self.InitialTemperature,self.FinalTemperature,self.Iterations)
+            self.Temperatures = islice(Temperatures,State['TemperaturesTaken'],None)
+        self.Thresholds = self.AcceptanceThresholds(self.Temperatures,State['PendingThresholds'].tolist())
+
+        self.Finished = self.SearchStopping.StopReason is not None or len(self.Snapshots)-1 >= self.Iterations
+        self.AcceptanceThreshold = None if self.Finished else next(self.Thresholds,None)
+        self.Finished = self.AcceptanceThreshold is None
+    
+    def CallChains(
+            self,
+            Iterations: int,
+            Chains: int,
+            InitialTemperature: float,
+            FinalTemperature: float,
+            ParallelTempering: bool = False,
+            ExchangeInterval: int = 10,
+        ) -> tuple[np.ndarray,list[float]]:
+        """
+        Method to search the optimal solution with several 
+        chains of Simulated Annealing advanced in lockstep 
+        as an array of shape `(Chains,Dim)`, with a batched 
+        evaluation through `Evaluator` and a vectorized 
+        Metropolis acceptance test. A `BatchObjective` and a 
+        vectorized `GenerateRandomNeighbor` are recommended.
+
+        Without `ParallelTempering`, all the chains follow 
+        `TemperatureSchedule`. With `ParallelTempering`, each 
+        chain keeps a fixed temperature of a geometric ladder 
+        from `InitialTemperature` to `FinalTemperature` and 
+        adjacent chains exchange their solutions every 
+        `ExchangeInterval` iterations (replica exchange).
+
+        Parameters
+        ----------
+        Iterations: int
+            Number of iterations (temperatures) for the search
+
+        Chains: int
+            Number of chains (M)
+
+        InitialTemperature: float
+            Initial temperature for the annealing
+
+        FinalTemperature: float
+            Final temperature for the annealing
+
+        ParallelTempering: bool
+            If True, run parallel tempering with replica exchange
+
+        ExchangeInterval: int
+            Number of iterations between replica exchanges
+
+        Returns
+        -------
+        OptimalIndividual: np.ndarray
+            Best solution/individual that was founded by any chain
+
+        Snapshots: list[float] 
+            List of the optimal values at each iteration
+        """
+
+        self.SearchStopping = self.Stopping.Start()
+        self.StartProfile()
 
-        OptimalSolution = CurrentSolution.copy()
-        OptimalFitnessValue = CurrentFitnessValue
+        CurrentSolutions = np.stack([CallWithRandomGenerator(self.InitializeSolution,self.RandomGenerator) for _ in range(Chains)])
+        CurrentFitnessValues = self.Evaluator(self.ObjectiveFunction,CurrentSolutions,self.BatchObjective)
+        self.SearchStopping.AddEvaluations(Chains)
+
+        IndexOptimal = np.argmin(CurrentFitnessValues)
+        OptimalSolution = CurrentSolutions[IndexOptimal].copy()
+        OptimalFitnessValue = CurrentFitnessValues[IndexOptimal]
 
         Snapshots = []
         Snapshots.append(OptimalFitnessValue)
 
-        for current_temperature in self.TemperatureSchedule(InitialTemperature,FinalTemperature):
-            current_neighborhood = self.GenerateNeighborhood(CurrentSolution)
-            random_neighbor = choice(current_neighborhood)
-
-            fitness_neighbor = self.ObjectiveFunction(random_neighbor)
-            if fitness_neighbor <= OptimalFitnessValue:
-                OptimalSolution = random_neighbor
-                OptimalFitnessValue = fitness_neighbor
-            
-            if (fitness_neighbor <= CurrentFitnessValue) or (np.random.rand() < np.e**(-(fitness_neighbor-CurrentFitnessValue)/current_temperature)):
-                CurrentSolution = random_neighbor
-                CurrentFitnessValue = fitness_neighbor
-            
+        ChainIndexes = np.arange(Chains)
+        LadderTemperatures = np.geomspace(InitialTemperature,FinalTemperature,Chains)
+        Exchanges , ExchangesAccepted = 0 , 0
+
+        Diversity = lambda: float(np.mean(np.std(CurrentSolutions,axis=0)))
+
+        Temperatures = self.ScheduleTemperatures(InitialTemperature,FinalTemperature,Iterations)
+        InitialStop = self.SearchStopping.Check(OptimalFitnessValue,Diversity)
+        if self.Profile is not None:
+            self.Profile.Lap('Initialization')
+
+        for iteration , current_temperature in enumerate(() if InitialStop else Temperatures,1):
+            temperatures = LadderTemperatures if ParallelTempering else current_temperature
+            if self.Profile is not None:
+                self.Profile.Lap('Schedule')
+
+            neighbors = self.RandomNeighbors(CurrentSolutions)
+            if self.Profile is not None:
+                self.Profile.Lap('Neighbor')
+
+            fitness_neighbors = self.Evaluator(self.ObjectiveFunction,neighbors,self.BatchObjective)
+            self.SearchStopping.AddEvaluations(Chains)
+            if self.Profile is not None:
+                self.Profile.Lap('Evaluation')
+
+            increases = fitness_neighbors-CurrentFitnessValues
+            accepted = np.logical_or(increases <= 0,increases < temperatures*self.RandomGenerator.standard_exponential(Chains))
+            CurrentSolutions[accepted] = neighbors[accepted]
+            CurrentFitnessValues[accepted] = fitness_neighbors[accepted]
+
+            IndexOptimal = np.argmin(fitness_neighbors)
+            if hasattr(Temperatures,'Feedback'):
+                Temperatures.Feedback(float(np.mean(accepted)),fitness_neighbors[IndexOptimal] < OptimalFitnessValue)
+            if fitness_neighbors[IndexOptimal] <= OptimalFitnessValue:
+                OptimalSolution = neighbors[IndexOptimal].copy()
+                OptimalFitnessValue = fitness_neighbors[IndexOptimal]
+
+            if ParallelTempering and iteration % ExchangeInterval == 0 and Chains > 1:
+                pairs = ChainIndexes[(iteration//ExchangeInterval)%2:Chains-1:2]
+                exchange_log_ratio = (1/LadderTemperatures[pairs]-1/LadderTemperatures[pairs+1])*(CurrentFitnessValues[pairs]-CurrentFitnessValues[pairs+1])
+                exchanged = pairs[np.log(self.RandomGenerator.random(pairs.shape[0])) < exchange_log_ratio]
+
+                exchange_from , exchange_to = np.concatenate((exchanged,exchanged+1)) , np.concatenate((exchanged+1,exchanged))
+                CurrentSolutions[exchange_from] = CurrentSolutions[exchange_to]
+                CurrentFitnessValues[exchange_from] = CurrentFitnessValues[exchange_to]
+                Exchanges += pairs.shape[0]
+                ExchangesAccepted += exchanged.shape[0]
+
+            if self.Profile is not None:
+                self.Profile.Count('Proposed',Chains)
+                self.Profile.Count('Accepted',int(np.count_nonzero(accepted)))
+                self.Profile.Lap('Acceptance')
+
             Snapshots.append(OptimalFitnessValue)
+            self.ReportIteration(len(Snapshots)-1,OptimalFitnessValue)
+
+            stop = self.SearchStopping.Update(OptimalFitnessValue)
+            if self.NotifyIteration(len(Snapshots)-1,OptimalFitnessValue,Diversity) or stop:
+                break
+
+        self.StopReason = self.SearchStopping.Finish()
+        self.ExchangeAcceptanceRate = ExchangesAccepted/Exchanges if Exchanges else 0.0
 
         return OptimalSolution , Snapshots
-    
+
+    def RandomNeighbors(
+            self,
+            CurrentSolutions: np.ndarray,
+        ) -> np.ndarray:
+        """
+        Method to get a random neighbor of the solution 
+        of each chain, with a single call of 
+        `GenerateRandomNeighbor` or, if it is None, 
+        choosing one from `GenerateNeighborhood` per chain.
+
+        Parameters
+        ----------
+        CurrentSolutions: np.ndarray
+            Solutions of the chains of shape `(Chains,Dim)`
+
+        Return
+        ------
+        RandomNeighbors: np.ndarray
+            Random neighbors of shape `(Chains,Dim)`
+        """
+
+        if self.GenerateRandomNeighbor is not None:
+            return np.asarray(CallWithRandomGenerator(self.GenerateRandomNeighbor,self.RandomGenerator,CurrentSolutions))
+
+        return np.stack([self.RandomNeighbor(solution) for solution in CurrentSolutions])
+
+    def RandomNeighbor(
+            self,
+            CurrentSolution: np.ndarray,
+        ) -> np.ndarray:
+        """
+        Method to get a random neighbor of a solution 
+        using `GenerateRandomNeighbor` or, if it is None, 
+        choosing one from `GenerateNeighborhood`.
+
+        Parameters
+        ----------
+        CurrentSolution: np.ndarray
+            Solution to get its neighbor
+
+        Return
+        ------
+        RandomNeighbor: np.ndarray
+            Random neighbor of `CurrentSolution`
+        """
+
+        if self.GenerateRandomNeighbor is not None:
+            return CallWithRandomGenerator(self.GenerateRandomNeighbor,self.RandomGenerator,CurrentSolution)
+
+        current_neighborhood = CallWithRandomGenerator(self.GenerateNeighborhood,self.RandomGenerator,CurrentSolution)
+        return current_neighborhood[self.RandomGenerator.integers(len(current_neighborhood))]
+
+    def AcceptanceThresholds(
+            self,
+            Temperatures: Iterable[float],
+            PendingThresholds: list[float] | None = None,
+        ) -> Iterator[float]:
+        """
+        Method to get the threshold of the Metropolis 
+        acceptance test at each iteration. A worse 
+        neighbor is accepted if its fitness increase is 
+        less than the threshold `-T*log(U)`, equivalent 
+        to `U < exp(-increase/T)`. Temperatures and draws 
+        are computed in blocks of `BlockSize` as arrays, 
+        or one by one for adaptive schedules (with a 
+        `Feedback` method). The current block and the 
+        position in it are kept in `AcceptanceBlock` and 
+        `BlockPosition`.
+
+        Parameters
+        ----------
+        Temperatures: Iterable[float]
+            Temperature of each iteration
+
+        PendingThresholds: list[float] | None
+            Thresholds (already drawn) yielded before the temperatures. If None, there are not
+
+        Return
+        ------
+        AcceptanceThresholds: Iterator[float]
+            Threshold of each iteration
+        """
+
+        BlockSize = 1 if hasattr(Temperatures,'Feedback') else self.BlockSize
+        Temperatures = iter(Temperatures)
+
+        self.AcceptanceBlock , self.BlockPosition = list(PendingThresholds or ()) , -1
+        for self.BlockPosition , acceptance_threshold in enumerate(self.AcceptanceBlock):
+            yield acceptance_threshold
+
+        while True:
+            temperatures_block = np.fromiter(islice(Temperatures,BlockSize),dtype=float)
+            if temperatures_block.size == 0:
+                return
+
+            temperatures_block *= self.RandomGenerator.standard_exponential(temperatures_block.size)
+            self.AcceptanceBlock = temperatures_block.tolist()
+            for self.BlockPosition , acceptance_threshold in enumerate(self.AcceptanceBlock):
+                yield acceptance_threshold
+
+    def ScheduleTemperatures(
+            self,
+            InitialTemperature: float,
+            FinalTemperature: float,
+            Iterations: int,
+        ) -> Iterable[float]:
+        """
+        Method to get the lazy sequence of `Iterations` 
+        temperatures from `TemperatureSchedule`.
+
+        Parameters
+        ----------
+        InitialTemperature: float
+            Initial temperature for the annealing
+
+        FinalTemperature: float
+            Final temperature for the annealing
+
+        Iterations: int
+            Number of iterations (temperatures)
+
+        Return
+        ------
+        Temperatures: Iterable[float]
+            Temperature of each iteration
+        """
+
+        if AcceptsIterations(self.TemperatureSchedule):
+            return self.TemperatureSchedule(InitialTemperature,FinalTemperature,Iterations)
+
+        return islice(self.TemperatureSchedule(InitialTemperature,FinalTemperature),Iterations)
+
     def FineTuningHyperparameters(
             self,
+            Iterations: int,
             Hyperparameters: dict[str,tuple[str,tuple]] = {
                     'InitialTemperature': ('float',(50,100)),
                     'FinalTemperature': ('float',(0.001,10)),
                 },
             NumTrials: int = 10,
             NumJobs: int = 1,
+            **KwFineTuning,
         ) -> dict[str,Any]:
 
-        return super().FineTuningHyperparameters(0,Hyperparameters,NumTrials,NumJobs)
\ No newline at end of file
+        return super().FineTuningHyperparameters(Iterations,Hyperparameters,NumTrials,NumJobs,**KwFineTuning)
+
+def AcceptsIterations(
+        TemperatureSchedule: Callable,
+    ) -> bool:
+    """
+    Function for checking if a temperature 
+    schedule takes the number of iterations 
+    as third parameter.
+
+    Parameters
+    ----------
+    TemperatureSchedule: Callable
+        Temperature schedule to check
+
+    Return
+    ------
+    Accepts: bool
+        True if the schedule takes at least three positional parameters
+    """
+
+    try:
+        Parameters = signature(TemperatureSchedule).parameters.values()
+    except (TypeError,ValueError):
+        return False
+
+    PositionalKinds = (Parameter.POSITIONAL_ONLY,Parameter.POSITIONAL_OR_KEYWORD)
+    return any(parameter.kind == Parameter.VAR_POSITIONAL for parameter in Parameters) or sum(parameter.kind in PositionalKinds for parameter in Parameters) >= 3
\ No newline at end of file
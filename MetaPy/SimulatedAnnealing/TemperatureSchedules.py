@@ -0,0 +1,250 @@
+from math import log
+
+from typing import Callable , Iterator
+
+def GeometricSchedule() -> Callable[[float,float,int],Iterator[float]]:
+    """
+    Function for creating a geometric (exponential)
+    temperature schedule `T_k = T_0*alpha**k`, with
+    `alpha` such that the last temperature is the
+    final temperature.
+
+    Return
+    ------
+    Schedule: Callable[[float,float,int],Iterator[float]]
+        Schedule that takes the initial and final temperatures and
+        the number of iterations and lazily yields the temperatures
+    """
+
+    def Schedule(
+            InitialTemperature: float,
+            FinalTemperature: float,
+            Iterations: int,
+        ) -> Iterator[float]:
+        CoolingRate = (FinalTemperature/InitialTemperature)**(1/max(Iterations-1,1))
+        Temperature = InitialTemperature
+        for _ in range(Iterations):
+            yield Temperature
+            Temperature *= CoolingRate
+
+    return Schedule
+
+def LinearSchedule() -> Callable[[float,float,int],Iterator[float]]:
+    """
+    Function for creating a linear temperature
+    schedule from the initial to the final
+    temperature.
+
+    Return
+    ------
+    Schedule: Callable[[float,float,int],Iterator[float]]
+        Schedule that takes the initial and final temperatures and
+        the number of iterations and lazily yields the temperatures
+    """
+
+    def Schedule(
+            InitialTemperature: float,
+            FinalTemperature: float,
+            Iterations: int,
+        ) -> Iterator[float]:
+        Step = (FinalTemperature-InitialTemperature)/max(Iterations-1,1)
+        for iteration in range(Iterations):
+            yield InitialTemperature + Step*iteration
+
+    return Schedule
+
+def LogarithmicSchedule() -> Callable[[float,float,int],Iterator[float]]:
+    """
+    Function for creating a logarithmic temperature
+    schedule `T_k = T_0/(1+a*log(1+k))`, with `a` such
+    that the last temperature is the final temperature.
+
+    Return
+    ------
+    Schedule: Callable[[float,float,int],Iterator[float]]
+        Schedule that takes the initial and final temperatures and
+        the number of iterations and lazily yields the temperatures
+    """
+
+    def Schedule(
+            InitialTemperature: float,
+            FinalTemperature: float,
+            Iterations: int,
+        ) -> Iterator[float]:
+        Scale = (InitialTemperature/FinalTemperature-1)/log(max(Iterations,2))
+        for iteration in range(Iterations):
+            yield InitialTemperature/(1+Scale*log(1+iteration))
+
+    return Schedule
+
+def LundyMeesSchedule() -> Callable[[float,float,int],Iterator[float]]:
+    """
+    Function for creating a Lundy-Mees temperature
+    schedule `T_{k+1} = T_k/(1+beta*T_k)`, with `beta`
+    such that the last temperature is the final
+    temperature.
+
+    Return
+    ------
+    Schedule: Callable[[float,float,int],Iterator[float]]
+        Schedule that takes the initial and final temperatures and
+        the number of iterations and lazily yields the temperatures
+    """
+
+    def Schedule(
+            InitialTemperature: float,
+            FinalTemperature: float,
+            Iterations: int,
+        ) -> Iterator[float]:
+        Beta = (InitialTemperature-FinalTemperature)/(max(Iterations-1,1)*InitialTemperature*FinalTemperature)
+        Temperature = InitialTemperature
+        for _ in range(Iterations):
+            yield Temperature
+            Temperature /= 1+Beta*Temperature
+
+    return Schedule
+
+class AdaptiveSchedule:
+    def __init__(
+            self,
+            TargetAcceptance: float = 0.44,
+            Window: int = 100,
+            AdaptationRate: float = 0.1,
+            ReheatAfter: int | None = 1_000,
+            ReheatFactor: float = 10.0,
+        ):
+        """
+        Class for creating an adaptive temperature
+        schedule. The temperature cools geometrically
+        from the initial to the final temperature and,
+        every `Window` iterations, it is decreased if
+        the acceptance rate is above `TargetAcceptance`
+        and increased if it is below. After `ReheatAfter`
+        iterations without improving, the temperature is
+        reheated (up to the initial temperature).
+
+        The Simulated Annealing gives the feedback of each
+        iteration through the `Feedback` method of the
+        yielded temperatures.
+
+        Parameters
+        ----------
+        TargetAcceptance: float
+            Target rate of accepted neighbors
+
+        Window: int
+            Number of iterations between adaptations
+
+        AdaptationRate: float
+            Relative change of the temperature at each adaptation
+
+        ReheatAfter: int | None
+            Number of iterations without improving to reheat. If None, there is no reheating
+
+        ReheatFactor: float
+            Factor multiplying the temperature at a reheating
+        """
+
+        self.TargetAcceptance = TargetAcceptance
+        self.Window = Window
+        self.AdaptationRate = AdaptationRate
+        self.ReheatAfter = ReheatAfter
+        self.ReheatFactor = ReheatFactor
+
+    def __call__(
+            self,
+            InitialTemperature: float,
+            FinalTemperature: float,
+            Iterations: int,
+        ) -> 'AdaptiveTemperatures':
+        return AdaptiveTemperatures(self,InitialTemperature,FinalTemperature,Iterations)
+
+class AdaptiveTemperatures:
+    def __init__(
+            self,
+            Schedule: AdaptiveSchedule,
+            InitialTemperature: float,
+            FinalTemperature: float,
+            Iterations: int,
+        ):
+        """
+        Class for the lazy sequence of temperatures
+        of an `AdaptiveSchedule` for a search.
+
+        Parameters
+        ----------
+        Schedule: AdaptiveSchedule
+            Parameters of the adaptation
+
+        InitialTemperature: float
+            Initial temperature for the annealing
+
+        FinalTemperature: float
+            Final temperature for the annealing
+
+        Iterations: int
+            Number of temperatures to yield
+        """
+
+        self.Schedule = Schedule
+        self.InitialTemperature = InitialTemperature
+        self.RemainingIterations = Iterations
+
+        self.CoolingRate = (FinalTemperature/InitialTemperature)**(1/max(Iterations-1,1))
+        self.Temperature = InitialTemperature
+
+        self.WindowAcceptance = 0.0
+        self.WindowIterations = 0
+        self.StagnatedIterations = 0
+        self.Reheatings = 0
+
+    def __iter__(
+            self,
+        ) -> 'AdaptiveTemperatures':
+        return self
+
+    def __next__(
+            self,
+        ) -> float:
+        if self.RemainingIterations <= 0:
+            raise StopIteration
+
+        self.RemainingIterations -= 1
+        Temperature = self.Temperature
+        self.Temperature *= self.CoolingRate
+
+        return Temperature
+
+    def Feedback(
+            self,
+            AcceptanceRate: float,
+            Improved: bool,
+        ) -> None:
+        """
+        Method for adapting the temperature with
+        the result of the last iteration.
+
+        Parameters
+        ----------
+        AcceptanceRate: float
+            Rate of accepted neighbors in the iteration (1 or 0 for a single chain)
+
+        Improved: bool
+            True if the optimal value was improved in the iteration
+        """
+
+        self.WindowAcceptance += AcceptanceRate
+        self.WindowIterations += 1
+        if self.WindowIterations >= self.Schedule.Window:
+            if self.WindowAcceptance/self.WindowIterations > self.Schedule.TargetAcceptance:
+                self.Temperature *= 1-self.Schedule.AdaptationRate
+            else:
+                self.Temperature *= 1+self.Schedule.AdaptationRate
+            self.Temperature = min(self.Temperature,self.InitialTemperature)
+            self.WindowAcceptance , self.WindowIterations = 0.0 , 0
+
+        self.StagnatedIterations = 0 if Improved else self.StagnatedIterations+1
+        if self.Schedule.ReheatAfter is not None and self.StagnatedIterations >= self.Schedule.ReheatAfter:
+            self.Temperature = min(self.Temperature*self.Schedule.ReheatFactor,self.InitialTemperature)
+            self.StagnatedIterations = 0
+            self.Reheatings += 1
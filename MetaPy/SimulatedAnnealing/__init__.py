@@ -1 +1,2 @@
-from .SimulatedAnnealing import SimulatedAnnealingOptimizer
\ No newline at end of file
+from .SimulatedAnnealing import SimulatedAnnealingOptimizer
+from .TemperatureSchedules import GeometricSchedule , LinearSchedule , LogarithmicSchedule , LundyMeesSchedule , AdaptiveSchedule
@@ -0,0 +1,108 @@
+import numpy as np
+
+from typing import Callable
+
+class MoveNeighborhood:
+    def __init__(
+            self,
+            Solution: np.ndarray,
+            Moves: np.ndarray,
+            ApplyMove: Callable[[np.ndarray,np.ndarray],np.ndarray],
+        ):
+        """
+        Class for describing a neighborhood as a base
+        solution and a matrix of moves (one move per row,
+        e.g. pairs of indexes to swap) instead of the
+        materialized neighbors. Neighbors are only built
+        when they are required.
+
+        Parameters
+        ----------
+        Solution: np.ndarray
+            Base solution of shape `(Dim,)`
+
+        Moves: np.ndarray
+            Moves of shape `(Size,MoveDim)`
+
+        ApplyMove: Callable[[np.ndarray,np.ndarray],np.ndarray]
+            Function that takes the base solution and a move and returns the
+            neighbor (without modifying the base solution)
+        """
+
+        self.Solution = Solution
+        self.Moves = np.asarray(Moves)
+        self.ApplyMove = ApplyMove
+
+    def __len__(
+            self,
+        ) -> int:
+        return self.Moves.shape[0]
+
+    def __getitem__(
+            self,
+            Index: int,
+        ) -> np.ndarray:
+        return self.ApplyMove(self.Solution,self.Moves[Index])
+
+    def Select(
+            self,
+            Mask: np.ndarray,
+        ) -> 'MoveNeighborhood':
+        """
+        Method for selecting a subset of the moves.
+
+        Parameters
+        ----------
+        Mask: np.ndarray
+            Boolean mask or indexes of the moves to select
+
+        Return
+        ------
+        SelectedNeighborhood: MoveNeighborhood
+            Neighborhood with the selected moves
+        """
+
+        return MoveNeighborhood(self.Solution,self.Moves[Mask],self.ApplyMove)
+
+    def Materialize(
+            self,
+        ) -> np.ndarray:
+        """
+        Method for building all the neighbors.
+
+        Return
+        ------
+        Neighbors: np.ndarray
+            Neighbors of shape `(Size,Dim)`
+        """
+
+        if len(self) == 0:
+            return np.empty((0,)+np.shape(self.Solution),dtype=np.asarray(self.Solution).dtype)
+
+        return np.stack([self.ApplyMove(self.Solution,move) for move in self.Moves])
+
+def RowKeys(
+        Solutions: np.ndarray,
+    ) -> list[bytes]:
+    """
+    Function for getting the bytes of each row
+    of a 2-D array in bulk, equal to the bytes
+    of each row as a solution.
+
+    Parameters
+    ----------
+    Solutions: np.ndarray
+        Array of shape `(Size,Dim)`
+
+    Return
+    ------
+    Keys: list[bytes]
+        Bytes of each row
+    """
+
+    Solutions = np.ascontiguousarray(Solutions)
+    if Solutions.shape[0] == 0:
+        return []
+
+    RowType = np.dtype((np.void,Solutions.dtype.itemsize*int(np.prod(Solutions.shape[1:]))))
+    return Solutions.reshape(Solutions.shape[0],-1).view(RowType).ravel().tolist()
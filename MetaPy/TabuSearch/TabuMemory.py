@@ -0,0 +1,110 @@
+from collections import deque
+import numpy as np
+
+from typing import Any , Hashable , Iterator
+
+class TabuMemory:
+    def __init__(
+            self,
+            TabuTime: int,
+        ):
+        """
+        Class for implementation of the tabu list of
+        Tabu Search as a hash index (`dict`) of tabu keys
+        and their expiry iteration, plus a ring buffer
+        (`deque`) ordered by expiry. Checking if a key is
+        tabu costs O(1) and aging the memory costs
+        O(expired keys).
+
+        Iterating the memory yields the active entries
+        as `[TabuRepresentation,Solution,RemainingTime]`.
+
+        Parameters
+        ----------
+        TabuTime: int
+            Number of iterations to mark a key as tabu
+        """
+
+        self.TabuTime = TabuTime
+        self.Iteration = 0
+
+        self.Index = dict()
+        self.Ring = deque()
+
+    def __contains__(
+            self,
+            Key: Hashable,
+        ) -> bool:
+        return self.Index.get(Key,0) > self.Iteration
+
+    def __len__(
+            self,
+        ) -> int:
+        return len(self.Index)
+
+    def __iter__(
+            self,
+        ) -> Iterator[list]:
+        for expiry , key , representation , solution in self.Ring:
+            if self.Index.get(key) == expiry:
+                yield [representation,solution,expiry-self.Iteration]
+
+    def Add(
+            self,
+            Key: Hashable,
+            Representation: Any = None,
+            Solution: np.ndarray | None = None,
+        ) -> None:
+        """
+        Method for marking a key as tabu
+        during the next `TabuTime` iterations.
+
+        Parameters
+        ----------
+        Key: Hashable
+            Tabu key (digest of a solution or tabu representation)
+
+        Representation: Any
+            Tabu representation of the move, kept for inspection
+
+        Solution: np.ndarray | None
+            Tabu solution, kept for inspection
+        """
+
+        Expiry = self.Iteration + self.TabuTime + 1
+        self.Index[Key] = Expiry
+        self.Ring.append((Expiry,Key,Representation,Solution))
+
+    def Step(
+            self,
+        ) -> None:
+        """
+        Method for advancing an iteration and
+        removing the expired keys.
+        """
+
+        self.Iteration += 1
+        while self.Ring and self.Ring[0][0] <= self.Iteration:
+            expiry , key , _ , _ = self.Ring.popleft()
+            if self.Index.get(key) == expiry:
+                del self.Index[key]
+
+def SolutionKey(
+        Solution: np.ndarray,
+    ) -> bytes:
+    """
+    Function for getting the tabu key of a
+    solution from its bytes.
+
+    Parameters
+    ----------
+    Solution: np.ndarray
+        Solution of shape `(Dim,)`
+
+    Return
+    ------
+    Key: bytes
+        Bytes of the solution
+    """
+
+    return np.ascontiguousarray(Solution).tobytes()
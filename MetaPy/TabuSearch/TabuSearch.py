@@ -1,8 +1,14 @@
 import numpy as np
 
-from ..Base import MetaheuristicOptimizer , MetaheuristicSimulations
+from itertools import islice
+from copy import copy , deepcopy
 
-from typing import Callable , Any
+from .TabuMemory import TabuMemory , SolutionKey
+from .Neighborhoods import MoveNeighborhood , RowKeys
+
+from ..Base import MetaheuristicOptimizer , MetaheuristicSimulations , SerialEvaluator , CreateRandomGenerator , CallWithRandomGenerator , StoppingCriteria , CheckpointWriter , Profiler as PhaseProfiler
+
+from typing import Callable , Iterator , Any
 
 class TabuSearchOptimizer(MetaheuristicOptimizer,MetaheuristicSimulations):
     def __init__(
@@ -11,6 +17,15 @@ class TabuSearchOptimizer(MetaheuristicOptimizer,MetaheuristicSimulations):
             InitializeSolution: Callable[[],np.ndarray],
             GenerateNeighborhood: Callable[[np.ndarray,list],list[np.ndarray]],
             TabuRepresentation: Callable[[np.ndarray,np.ndarray],Any],
+            Evaluator: SerialEvaluator | None = None,
+            RandomGenerator: np.random.Generator | int | None = None,
+            Stopping: StoppingCriteria | None = None,
+            TabuKey: str = 'Solution',
+            Aspiration: bool = False,
+            MoveGain: Callable[[np.ndarray,np.ndarray],np.ndarray] | None = None,
+            Checkpoints: CheckpointWriter | None = None,
+            Profiler: PhaseProfiler | None = None,
+            Callbacks: list[Callable[[Any,int],bool | None]] | None = None,
         ):
         """
         Class for implementation of Tabu Search based 
@@ -26,21 +41,83 @@ class TabuSearchOptimizer(MetaheuristicOptimizer,MetaheuristicSimulations):
             Function to initialize a feasible solution/individual
 
         GenerateNeighborhood: Callable[[np.ndarray,list],list[np.ndarray]]
-            Function to generate the neighborhood of a solution
+            Function to generate the neighborhood of a solution. It also 
+            receives the `TabuMemory` of the search. The neighborhood can be a 
+            list of solutions, an array of shape `(Size,Dim)` or a `MoveNeighborhood`. 
+            For a `MoveNeighborhood`, the applied moves (by their bytes) are marked 
+            as tabu instead of the solutions
 
         TabuRepresentation: Callable[[np.ndarray,np.ndarray],Any]
             Function to get the tabu representation of a solution
+
+        Evaluator: SerialEvaluator | None
+            Evaluator used to compute the fitness values of the neighborhoods. 
+            If None, `SerialEvaluator` is used
+
+        RandomGenerator: np.random.Generator | int | None
+            Random generator (or its seed) used for all the randomness of the search. 
+            `InitializeSolution` and `GenerateNeighborhood` receive it if they have 
+            a parameter with that name
+
+        Stopping: StoppingCriteria | None
+            Stopping criteria checked after the initialization and each iteration besides `Iterations`. 
+            The criterion that stopped the last search is saved in `StopReason`
+
+        TabuKey: str
+            Key used to mark moves as tabu. `'Solution'` marks the visited 
+            solutions (by their bytes) and `'Representation'` marks the value of 
+            `TabuRepresentation` (must be hashable), a neighbor is tabu if 
+            `TabuRepresentation(CurrentSolution,Neighbor)` is marked
+
+        Aspiration: bool
+            If True, a tabu neighbor is allowed when it improves the optimal 
+            value found so far (aspiration by objective). It requires to evaluate 
+            the tabu neighbors
+
+        MoveGain: Callable[[np.ndarray,np.ndarray],np.ndarray] | None
+            Function for incremental (delta) evaluation of a `MoveNeighborhood`. 
+            Takes the base solution and the moves of shape `(Size,MoveDim)` and 
+            returns the change of the fitness value of each move of shape `(Size,)`. 
+            If None, the neighbors are materialized and evaluated
+
+        Checkpoints: CheckpointWriter | None
+            Writer of the checkpoints of the state of the search (current and 
+            optimal solutions, tabu list, snapshots and random generator), which 
+            can be resumed with `Resume`. If None, no checkpoints are written
+
+        Profiler: PhaseProfiler | None
+            Profiler of the search, which splits the time of each iteration into the 
+            `'Neighborhood'`, `'TabuFilter'`, `'Evaluation'` and `'Update'` phases (lazy 
+            neighborhoods are consumed in the `'CandidateList'` phase) and counts the 
+            candidates admitted by the tabu filter. The profile of the last search is 
+            saved in `Profile`. If None, the search is not profiled
+
+        Callbacks: list[Callable[[Any,int],bool | None]] | None
+            Functions called after each iteration with the optimizer and the number 
+            of the iteration. If any of them returns True, the search stops
         """
 
         self.ObjectiveFunction = ObjectiveFunction
         self.InitializeSolution = InitializeSolution
         self.GenerateNeighborhood = GenerateNeighborhood
         self.TabuRepresentation = TabuRepresentation
+        self.Evaluator = Evaluator if Evaluator is not None else SerialEvaluator()
+        self.RandomGenerator = CreateRandomGenerator(RandomGenerator)
+        self.Stopping = Stopping if Stopping is not None else StoppingCriteria()
+        self.TabuKey = TabuKey
+        self.Aspiration = Aspiration
+        self.MoveGain = MoveGain
+        self.Checkpoints = Checkpoints
+        self.Profiler = Profiler
+        self.Callbacks = Callbacks
 
     def __call__(
             self,
             Iterations: int,
             TabuTime: int,
+            CandidateListSize: int | None = None,
+            MaxCandidateListSize: int | None = None,
+            FirstImprovement: bool = False,
         ) -> tuple[np.ndarray,list[float]]:
         """
         Method to search the closest optimal solution from a 
@@ -56,6 +133,24 @@ class TabuSearchOptimizer(MetaheuristicOptimizer,MetaheuristicSimulations):
         TabuTime: int
             Number of iterations to mark a solution as tabu
 
+        CandidateListSize: int | None
+            If given, only this number of candidates of each neighborhood 
+            are evaluated (candidate list strategy). A random sample is taken 
+            from list, array and move neighborhoods; neighborhoods returned as 
+            iterators (e.g. generators) are consumed lazily in the order they 
+            are yielded, so they can be prioritized. If None, the whole 
+            neighborhood is evaluated
+
+        MaxCandidateListSize: int | None
+            If given, the candidate list size is doubled after each iteration 
+            without improving the optimal value up to this size, and reset 
+            to `CandidateListSize` when it improves
+
+        FirstImprovement: bool
+            If True, the neighbors (of the candidate list, if `CandidateListSize` is 
+            given) are evaluated one at a time until the first one that improves 
+            the current solution
+
         Returns
         -------
         OptimalIndividual: np.ndarray
@@ -65,37 +160,332 @@ class TabuSearchOptimizer(MetaheuristicOptimizer,MetaheuristicSimulations):
             List of the optimal values at each iteration/generation
         """
 
-        CurrentSolution = self.InitializeSolution()
-        CurrentFitnessValue = self.ObjectiveFunction(CurrentSolution)
+        self.Start(Iterations,TabuTime,CandidateListSize,MaxCandidateListSize,FirstImprovement)
+        return self.Search()
+
+    def Start(
+            self,
+            Iterations: int,
+            TabuTime: int,
+            CandidateListSize: int | None = None,
+            MaxCandidateListSize: int | None = None,
+            FirstImprovement: bool = False,
+        ) -> None:
+        """
+        Method for starting a search driven by 
+        `Ask` and `Tell`, initializing the (not 
+        evaluated) current solution and the tabu list.
+
+        Parameters
+        ----------
+        Iterations: int
+            Number of iterations/generations for the search
+
+        TabuTime: int
+            Number of iterations to mark a solution as tabu
+
+        CandidateListSize: int | None
+            Number of candidates of each neighborhood (see `__call__`)
+
+        MaxCandidateListSize: int | None
+            Maximum size of the adaptive candidate list (see `__call__`)
+
+        FirstImprovement: bool
+            If True, the neighbors (of the candidate list, if `CandidateListSize` is 
+            given) are evaluated one at a time until the first one that improves 
+            the current solution
+        """
+
+        self.Iterations = Iterations
+        self.TabuTime = TabuTime
+        self.CandidateListSize = CandidateListSize
+        self.MaxCandidateListSize = MaxCandidateListSize
+        self.FirstImprovement = FirstImprovement
+        self.SearchStopping = self.Stopping.Start()
+        self.StartProfile()
+
+        self.CurrentSolution = CallWithRandomGenerator(self.InitializeSolution,self.RandomGenerator)
+        self.CurrentFitnessValue = None
+
+        self.TabuList = TabuMemory(TabuTime)
+        self.CurrentCandidateListSize = CandidateListSize
+
+        self.Snapshots = []
+        self.Finished = False
+        self.PendingNeighborhood = None
+        self.TabuNeighbors = None
+        if self.Profile is not None:
+            self.Profile.Lap('Initialization')
+
+    def Ask(
+            self,
+        ) -> list[np.ndarray] | np.ndarray | MoveNeighborhood:
+        """
+        Method for getting the neighbors to evaluate: 
+        the initial solution or the candidates of the 
+        neighborhood of the current solution. Tabu 
+        neighbors are removed, unless `Aspiration` is 
+        True. With `FirstImprovement`, the neighborhood 
+        is asked one candidate at a time, and an empty 
+        batch is returned when it is exhausted.
+
+        Return
+        ------
+        Candidates: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Neighbors to evaluate (a `MoveNeighborhood` can be materialized)
+        """
+
+        if not self.Snapshots:
+            return [self.CurrentSolution]
+
+        if self.PendingNeighborhood is not None:
+            return self.NextCandidate()
+
+        current_neighborhood = CallWithRandomGenerator(self.GenerateNeighborhood,self.RandomGenerator,self.CurrentSolution,self.TabuList)
+        if self.Profile is not None:
+            self.Profile.Lap('Neighborhood')
+
+        if self.FirstImprovement:
+            if self.CurrentCandidateListSize is not None and hasattr(current_neighborhood,'__len__'):
+                current_neighborhood = self.SampleNeighborhood(current_neighborhood,self.CurrentCandidateListSize)
+            if isinstance(current_neighborhood,MoveNeighborhood):
+                self.PendingNeighborhood = (current_neighborhood.Select([index]) for index in range(len(current_neighborhood)))
+            else:
+                self.PendingNeighborhood = ([neighbor] for neighbor in current_neighborhood)
+            self.CandidateList , self.CandidateFitnessValues = [] , []
+            return self.NextCandidate()
+
+        if self.CurrentCandidateListSize is not None and not hasattr(current_neighborhood,'__len__'):
+            current_neighborhood = self.CandidateListOperation(self.TabuList,self.CurrentSolution,current_neighborhood,self.CurrentCandidateListSize)
+        elif not hasattr(current_neighborhood,'__len__'):
+            current_neighborhood = list(current_neighborhood)
+        elif self.CurrentCandidateListSize is not None:
+            current_neighborhood = self.SampleNeighborhood(current_neighborhood,self.CurrentCandidateListSize)
+        if self.Profile is not None:
+            self.Profile.Lap('CandidateList')
+
+        return self.AdmissibleNeighborhood(self.TabuList,self.CurrentSolution,current_neighborhood)
+
+    def Tell(
+            self,
+            Candidates: list[np.ndarray] | np.ndarray | MoveNeighborhood,
+            FitnessValues: np.ndarray,
+            Completed: np.ndarray | None = None,
+        ) -> bool:
+        """
+        Method for advancing the search with the 
+        fitness values of the neighbors of `Ask`: 
+        the current solution moves to the best 
+        admissible neighbor (with `Aspiration`, tabu 
+        neighbors better than the optimal value are 
+        admissible), the tabu list is updated and the 
+        stopping criteria are checked.
+
+        Parameters
+        ----------
+        Candidates: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Neighbors returned by `Ask`
+
+        FitnessValues: np.ndarray
+            Fitness values of the candidates of shape `(Size,)`
+
+        Completed: np.ndarray | None
+            Mask of the candidates whose evaluation completed (e.g. not cancelled or timed out 
+            in `AsyncEvaluator`). The other ones are not counted and are never selected. 
+            If None, all the evaluations completed
+
+        Return
+        ------
+        Finished: bool
+            True if the search finished
+        """
+
+        if self.Profile is not None:
+            self.Profile.Lap('Evaluation')
+        self.SearchStopping.AddEvaluations(len(Candidates) if Completed is None else int(np.count_nonzero(Completed)))
+        FitnessValues = np.asarray(FitnessValues,dtype=float)
+
+        if not self.Snapshots:
+            self.CurrentSolution = Candidates[0]
+            self.CurrentFitnessValue = FitnessValues[0] if Completed is None or Completed[0] else np.inf
+            self.OptimalIndividual = self.CurrentSolution.copy()
+            self.OptimalFitnessValue = self.CurrentFitnessValue
+
+            self.Snapshots.append(self.OptimalFitnessValue)
+            if self.Profile is not None:
+                self.Profile.Lap('Initialization')
+
+            self.Finished = self.SearchStopping.Check(self.OptimalFitnessValue) or self.Iterations <= 0
+            return self.Finished
+
+        Exhausted = len(Candidates) == 0
+        if Completed is not None:
+            Completed = np.asarray(Completed,dtype=bool)
+            Candidates , FitnessValues = SelectNeighbors(Candidates,Completed) , FitnessValues[Completed]
+            if self.TabuNeighbors is not None:
+                self.TabuNeighbors = self.TabuNeighbors[Completed]
+
+        if self.TabuNeighbors is not None:
+            admissible_neighbors = np.logical_or(~self.TabuNeighbors,FitnessValues < self.OptimalFitnessValue)
+            Candidates , FitnessValues = SelectNeighbors(Candidates,admissible_neighbors) , FitnessValues[admissible_neighbors]
+            self.TabuNeighbors = None
+            if self.Profile is not None:
+                self.Profile.Count('Accepted',len(Candidates))
+                self.Profile.Lap('TabuFilter')
+
+        if self.PendingNeighborhood is not None:
+            Improvement = False
+            if len(Candidates) > 0:
+                self.CandidateList.append(Candidates)
+                self.CandidateFitnessValues.append(FitnessValues[0])
+                Improvement = FitnessValues[0] < self.CurrentFitnessValue or (self.CurrentCandidateListSize is not None and len(self.CandidateList) >= self.CurrentCandidateListSize)
+            if not (Exhausted or Improvement):
+                return self.Finished
+
+            Candidates , FitnessValues = JoinNeighborhoods(self.CandidateList) , np.array(self.CandidateFitnessValues,dtype=float)
+            self.PendingNeighborhood = None
+
+        PreviousOptimalFitnessValue = self.OptimalFitnessValue
+        if len(Candidates) > 0:
+            index_best_neighbor = np.argmin(FitnessValues)
+
+            PreviousSolution = self.CurrentSolution.copy()
+            self.CurrentSolution = Candidates[index_best_neighbor]
+            self.CurrentFitnessValue = FitnessValues[index_best_neighbor]
+
+            if self.CurrentFitnessValue < self.OptimalFitnessValue:
+                self.OptimalIndividual = self.CurrentSolution.copy()
+                self.OptimalFitnessValue = self.CurrentFitnessValue
+
+            if isinstance(Candidates,MoveNeighborhood):
+                self.UpdateTabuList(self.TabuList,self.TabuTime,PreviousSolution,self.CurrentSolution,Candidates.Moves[index_best_neighbor])
+            else:
+                self.UpdateTabuList(self.TabuList,self.TabuTime,PreviousSolution,self.CurrentSolution)
+        self.TabuList.Step()
+        if self.Profile is not None:
+            self.Profile.Lap('Update')
+
+        if self.CurrentCandidateListSize is not None and self.MaxCandidateListSize is not None:
+            if self.OptimalFitnessValue < PreviousOptimalFitnessValue:
+                self.CurrentCandidateListSize = self.CandidateListSize
+            else:
+                self.CurrentCandidateListSize = min(2*self.CurrentCandidateListSize,self.MaxCandidateListSize)
+
+        self.Snapshots.append(self.OptimalFitnessValue)
+        Iteration = len(self.Snapshots)-1
+        self.ReportIteration(Iteration,self.OptimalFitnessValue)
+
+        Stop = self.SearchStopping.Update(self.OptimalFitnessValue)
+        self.WriteCheckpoint(Iteration)
+        self.Finished = self.NotifyIteration(Iteration,self.OptimalFitnessValue) or Stop or Iteration >= self.Iterations
+
+        return self.Finished
+
+    def EvaluateCandidates(
+            self,
+            Candidates: list[np.ndarray] | np.ndarray | MoveNeighborhood,
+        ) -> np.ndarray:
+        """
+        Method for evaluating the neighbors of `Ask` 
+        (see `EvaluateNeighborhood`).
+
+        Parameters
+        ----------
+        Candidates: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Neighbors to evaluate
+
+        Return
+        ------
+        FitnessValues: np.ndarray
+            Fitness values of the candidates of shape `(Size,)`
+        """
+
+        return self.EvaluateNeighborhood(self.CurrentSolution,self.CurrentFitnessValue,Candidates)
 
-        OptimalIndividual = CurrentSolution.copy()
-        OptimalFitnessValue = CurrentFitnessValue
+    def Finish(
+            self,
+        ) -> tuple[np.ndarray,list[float]]:
+        """
+        Method for finishing the search, saving 
+        the reason of the stop in `StopReason`.
 
-        TabuList = []
+        Returns
+        -------
+        OptimalIndividual: np.ndarray
+            Best solution/individual that was founded
 
-        Snapshots = []
-        Snapshots.append(OptimalFitnessValue)
+        Snapshots: list[float] 
+            List of the optimal values at each iteration/generation
+        """
 
-        for iteration in range(Iterations):
-            current_neighborhood = self.GenerateNeighborhood(CurrentSolution,TabuList)
-            reduced_neighborhood = self.ReduceNeighborhoodOperation(TabuList,current_neighborhood)
+        self.StopReason = self.SearchStopping.Finish()
+        self.WaitCheckpoints()
 
-            fitness_values = list(map(self.ObjectiveFunction,reduced_neighborhood))
-            index_best_neighbor = np.argmin(fitness_values)
+        return self.OptimalIndividual , self.Snapshots
 
-            PreviousSolution = CurrentSolution.copy()
-            CurrentSolution = reduced_neighborhood[index_best_neighbor]
-            CurrentFitnessValue = fitness_values[index_best_neighbor]
+    def GetState(
+            self,
+        ) -> dict[str,Any]:
+        """
+        Method for getting a copy of the state of 
+        the search between iterations.
 
-            if CurrentFitnessValue < OptimalFitnessValue:
-                OptimalIndividual = CurrentSolution.copy()
-                OptimalFitnessValue = CurrentFitnessValue
+        Return
+        ------
+        State: dict[str,Any]
+            Current and optimal solutions, tabu list, snapshots, 
+            hyperparameters, stopping criteria and random generator state
+        """
 
-            Snapshots.append(OptimalFitnessValue)
+        return {
+                'Iterations': self.Iterations,
+                'TabuTime': self.TabuTime,
+                'CandidateListSize': self.CandidateListSize,
+                'MaxCandidateListSize': self.MaxCandidateListSize,
+                'FirstImprovement': self.FirstImprovement,
+                'CurrentCandidateListSize': self.CurrentCandidateListSize,
+                'CurrentSolution': np.array(self.CurrentSolution),
+                'CurrentFitnessValue': self.CurrentFitnessValue,
+                'OptimalIndividual': np.array(self.OptimalIndividual),
+                'OptimalFitnessValue': self.OptimalFitnessValue,
+                'TabuList': deepcopy(self.TabuList),
+                'Snapshots': np.array(self.Snapshots,dtype=float),
+                'SearchStopping': copy(self.SearchStopping),
+                'RandomState': self.RandomGenerator.bit_generator.state,
+            }
+
+    def SetState(
+            self,
+            State: dict[str,Any],
+        ) -> None:
+        """
+        Method for restoring the state of a search 
+        from `GetState`.
 
-            self.UpdateTabuList(TabuList,TabuTime,PreviousSolution,CurrentSolution)
+        Parameters
+        ----------
+        State: dict[str,Any]
+            State of the search
+        """
 
-        return OptimalIndividual , Snapshots
+        self.Iterations = State['Iterations']
+        self.TabuTime = State['TabuTime']
+        self.CandidateListSize = State['CandidateListSize']
+        self.MaxCandidateListSize = State['MaxCandidateListSize']
+        self.FirstImprovement = State['FirstImprovement']
+        self.CurrentCandidateListSize = State['CurrentCandidateListSize']
+        self.CurrentSolution = np.array(State['CurrentSolution'])
+        self.CurrentFitnessValue = State['CurrentFitnessValue']
+        self.OptimalIndividual = np.array(State['OptimalIndividual'])
+        self.OptimalFitnessValue = State['OptimalFitnessValue']
+        self.TabuList = State['TabuList']
+        self.Snapshots = State['Snapshots'].tolist()
+        self.SearchStopping = State['SearchStopping']
+        self.RandomGenerator.bit_generator.state = State['RandomState']
+
+        self.Finished = self.SearchStopping.StopReason is not None or len(self.Snapshots)-1 >= self.Iterations
+        self.PendingNeighborhood = None
+        self.TabuNeighbors = None
 
     def FineTuningHyperparameters(
             self,
@@ -105,56 +495,280 @@ class TabuSearchOptimizer(MetaheuristicOptimizer,MetaheuristicSimulations):
                 },
             NumTrials: int = 10,
             NumJobs: int = 1,
+            **KwFineTuning,
         ) -> dict[str,Any]:
 
-        return super().FineTuningHyperparameters(Iterations,Hyperparameters,NumTrials,NumJobs)
+        return super().FineTuningHyperparameters(Iterations,Hyperparameters,NumTrials,NumJobs,**KwFineTuning)
 
-    def ReduceNeighborhoodOperation(
+    def AdmissibleNeighborhood(
+            self,
+            TabuList: TabuMemory,
+            CurrentSolution: np.ndarray,
+            CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood,
+        ) -> list[np.ndarray] | np.ndarray | MoveNeighborhood:
+        """
+        Method to get the neighbors to evaluate: the 
+        neighbors that are not tabu or, if `Aspiration` 
+        is True, all the neighbors (their tabu status 
+        is kept in `TabuNeighbors` for `Tell`).
+
+        Parameters
+        ----------
+        TabuList: TabuMemory
+            Memory with the tabu keys and their expiry
+
+        CurrentSolution: np.ndarray
+            Solution used to generate the neighborhood
+
+        CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Neighborhood of `CurrentSolution`
+
+        Return
+        ------
+        Candidates: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Neighbors to evaluate
+        """
+
+        if self.Profile is not None:
+            self.Profile.Count('Proposed',len(CurrentNeighborhood))
+
+        if self.Aspiration:
+            self.TabuNeighbors = self.TabuStatus(TabuList,CurrentSolution,CurrentNeighborhood)
+            if self.Profile is not None:
+                self.Profile.Lap('TabuFilter')
+            return CurrentNeighborhood
+
+        reduced_neighborhood = self.ReduceNeighborhoodOperation(TabuList,CurrentNeighborhood)
+        if self.Profile is not None:
+            self.Profile.Count('Accepted',len(reduced_neighborhood))
+            self.Profile.Lap('TabuFilter')
+
+        return reduced_neighborhood
+
+    def CandidateListOperation(
             self,
-            TabuList: list[np.ndarray],
-            CurrentNeighborhood: list[np.ndarray],
+            TabuList: TabuMemory,
+            CurrentSolution: np.ndarray,
+            CurrentNeighborhood: Iterator[np.ndarray],
+            CandidateListSize: int,
         ) -> list[np.ndarray]:
         """
+        Method to build the candidate list from a 
+        lazy neighborhood (iterator), consuming it 
+        until `CandidateListSize` candidates (not 
+        tabu, unless `Aspiration` is True) are found.
+
+        Parameters
+        ----------
+        TabuList: TabuMemory
+            Memory with the tabu keys and their expiry
+
+        CurrentSolution: np.ndarray
+            Solution used to generate the neighborhood
+
+        CurrentNeighborhood: Iterator[np.ndarray]
+            Lazy neighborhood of `CurrentSolution`
+
+        CandidateListSize: int
+            Maximum number of candidates
+
+        Return
+        ------
+        CandidateList: list[np.ndarray]
+            Candidates
+        """
+
+        if self.Aspiration:
+            return list(islice(CurrentNeighborhood,CandidateListSize))
+
+        return list(islice((neighbor for neighbor in CurrentNeighborhood if not self.TabuStatus(TabuList,CurrentSolution,[neighbor])[0]),CandidateListSize))
+
+    def NextCandidate(
+            self,
+        ) -> list[np.ndarray] | MoveNeighborhood:
+        """
+        Method to get the next candidate (not tabu, 
+        unless `Aspiration` is True) of the 
+        neighborhood of a `FirstImprovement` iteration.
+
+        Return
+        ------
+        Candidates: list[np.ndarray] | MoveNeighborhood
+            Neighborhood with the next candidate, or an empty list if the neighborhood is exhausted
+        """
+
+        for neighbors in self.PendingNeighborhood:
+            tabu_neighbor = self.TabuStatus(self.TabuList,self.CurrentSolution,neighbors)[0]
+            if self.Profile is not None:
+                self.Profile.Count('Proposed')
+            if tabu_neighbor and not self.Aspiration:
+                continue
+
+            self.TabuNeighbors = np.array([tabu_neighbor])
+            if self.Profile is not None:
+                self.Profile.Lap('CandidateList')
+            return neighbors
+
+        if self.Profile is not None:
+            self.Profile.Lap('CandidateList')
+        return []
+
+    def SampleNeighborhood(
+            self,
+            CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood,
+            CandidateListSize: int,
+        ) -> list[np.ndarray] | np.ndarray | MoveNeighborhood:
+        """
+        Method to take a random sample of a 
+        neighborhood as candidate list.
+
+        Parameters
+        ----------
+        CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Neighborhood to sample
+
+        CandidateListSize: int
+            Size of the sample
+
+        Return
+        ------
+        CandidateList: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Random sample of the neighborhood, of the same type of `CurrentNeighborhood`
+        """
+
+        NeighborhoodSize = len(CurrentNeighborhood)
+        if NeighborhoodSize <= CandidateListSize:
+            return CurrentNeighborhood
+
+        SampleMask = np.zeros(NeighborhoodSize,dtype=bool)
+        SampleMask[self.RandomGenerator.choice(NeighborhoodSize,CandidateListSize,replace=False)] = True
+        return SelectNeighbors(CurrentNeighborhood,SampleMask)
+
+    def EvaluateNeighborhood(
+            self,
+            CurrentSolution: np.ndarray,
+            CurrentFitnessValue: float,
+            CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood,
+        ) -> np.ndarray:
+        """
+        Method to compute the fitness values of a 
+        neighborhood in bulk using `Evaluator`, or 
+        incrementally using `MoveGain` for a 
+        `MoveNeighborhood`.
+
+        Parameters
+        ----------
+        CurrentSolution: np.ndarray
+            Solution used to generate the neighborhood
+
+        CurrentFitnessValue: float
+            Fitness value of `CurrentSolution`
+
+        CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Neighborhood to evaluate
+
+        Return
+        ------
+        FitnessValues: np.ndarray
+            Fitness values of the neighborhood of shape `(Size,)`
+        """
+
+        if isinstance(CurrentNeighborhood,MoveNeighborhood):
+            if self.MoveGain is not None:
+                if len(CurrentNeighborhood) == 0:
+                    return np.empty(0,dtype=float)
+                return CurrentFitnessValue + np.asarray(self.MoveGain(CurrentNeighborhood.Solution,CurrentNeighborhood.Moves),dtype=float)
+            CurrentNeighborhood = CurrentNeighborhood.Materialize()
+
+        return self.Evaluator(self.ObjectiveFunction,CurrentNeighborhood)
+
+    def ReduceNeighborhoodOperation(
+            self,
+            TabuList: TabuMemory,
+            CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood,
+            CurrentSolution: np.ndarray | None = None,
+        ) -> list[np.ndarray] | np.ndarray | MoveNeighborhood:
+        """
         Method to reduce the current neighborhood 
         based on the tabu list to remove invalid/tabu solutions.
 
         Parameters
         ----------
-        TabuList: list[np.ndarray]
-            A list with the tabu solutions and their representations and times
+        TabuList: TabuMemory
+            Memory with the tabu keys and their expiry
 
-        CurrentNeighborhood: list[np.ndarray]
-            A list with the neighborhood to reduce by the tabu list
+        CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            The neighborhood to reduce by the tabu list
+
+        CurrentSolution: np.ndarray | None
+            Solution used to generate the neighborhood. If None, `self.CurrentSolution` is used
 
         Return
         ------
-        ReducedNeighborhood: list[np.ndarray]
-            A list with the valid neighborhood based on the tabu list
+        ReducedNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            The valid neighborhood based on the tabu list, of the same type of `CurrentNeighborhood`
         """
 
-        reduced_neighborhood = []
-        tabu_solutions = list(map(lambda tabu: tabu[1],TabuList))
-        for neighborhood_solution in CurrentNeighborhood:
-            if all((np.any(neighborhood_solution != tabu) for tabu in tabu_solutions)):
-                reduced_neighborhood.append(neighborhood_solution)
+        if CurrentSolution is None:
+            CurrentSolution = self.CurrentSolution
 
-        return reduced_neighborhood
+        tabu_neighbors = self.TabuStatus(TabuList,CurrentSolution,CurrentNeighborhood)
+        return SelectNeighbors(CurrentNeighborhood,~tabu_neighbors)
+
+    def TabuStatus(
+            self,
+            TabuList: TabuMemory,
+            CurrentSolution: np.ndarray,
+            CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood,
+        ) -> np.ndarray:
+        """
+        Method to check which neighbors of the 
+        current neighborhood are tabu.
+
+        Parameters
+        ----------
+        TabuList: TabuMemory
+            Memory with the tabu keys and their expiry
+
+        CurrentSolution: np.ndarray
+            Solution used to generate the neighborhood
+
+        CurrentNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood
+            Neighborhood to check
+
+        Return
+        ------
+        TabuNeighbors: np.ndarray
+            Boolean mask of shape `(Size,)`, True for tabu neighbors
+        """
+
+        if isinstance(CurrentNeighborhood,MoveNeighborhood):
+            tabu_keys = RowKeys(CurrentNeighborhood.Moves)
+        elif self.TabuKey == 'Representation':
+            tabu_keys = (self.TabuRepresentation(CurrentSolution,neighbor) for neighbor in CurrentNeighborhood)
+        elif isinstance(CurrentNeighborhood,np.ndarray):
+            tabu_keys = RowKeys(CurrentNeighborhood)
+        else:
+            tabu_keys = map(SolutionKey,CurrentNeighborhood)
+
+        return np.fromiter((key in TabuList for key in tabu_keys),dtype=bool,count=len(CurrentNeighborhood))
     
     def UpdateTabuList(
             self,
-            TabuList: list,
+            TabuList: TabuMemory,
             TabuTime: int,
             PreviousSolution: np.ndarray,
             CurrentSolution: np.ndarray,
+            Move: np.ndarray | None = None,
         ) -> None:
         """
-        Method to update the times of each tabu solution and 
-        to add a new tabu solution.
+        Method to add a new tabu move to the tabu list. 
+        Expired tabu moves are removed by `TabuMemory.Step`.
 
         Parameters
         ----------
-        TabuList: list
-            A list with the tabu solutions and their representations and times
+        TabuList: TabuMemory
+            Memory with the tabu keys and their expiry
         
         TabuTime: int
             Max time to mark a solution as tabu
@@ -164,10 +778,71 @@ class TabuSearchOptimizer(MetaheuristicOptimizer,MetaheuristicSimulations):
         
         CurrentSolution: np.ndarray
             New solution to mark it as tabu and generated by the previous solution
+
+        Move: np.ndarray | None
+            Move of a `MoveNeighborhood` applied to the previous solution. If given, 
+            it is marked as tabu instead of the solution
         """
 
-        for index , tabu in enumerate(TabuList):
-            tabu[-1] -= 1
-            if tabu[-1] == 0:
-                del TabuList[index]
-        TabuList.append([self.TabuRepresentation(PreviousSolution,CurrentSolution),CurrentSolution,TabuTime])
\ No newline at end of file
+        TabuRepresentation = self.TabuRepresentation(PreviousSolution,CurrentSolution)
+        if Move is not None:
+            Key = SolutionKey(Move)
+        elif self.TabuKey == 'Representation':
+            Key = TabuRepresentation
+        else:
+            Key = SolutionKey(CurrentSolution)
+        TabuList.Add(Key,TabuRepresentation,CurrentSolution)
+
+
+def SelectNeighbors(
+        Neighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood,
+        Mask: np.ndarray,
+    ) -> list[np.ndarray] | np.ndarray | MoveNeighborhood:
+    """
+    Function for selecting the neighbors of a 
+    neighborhood given by a boolean mask, keeping 
+    the type of the neighborhood.
+
+    Parameters
+    ----------
+    Neighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood
+        Neighborhood to select from
+
+    Mask: np.ndarray
+        Boolean mask of shape `(Size,)`
+
+    Return
+    ------
+    SelectedNeighborhood: list[np.ndarray] | np.ndarray | MoveNeighborhood
+        Selected neighbors
+    """
+
+    if isinstance(Neighborhood,MoveNeighborhood):
+        return Neighborhood.Select(Mask)
+    elif isinstance(Neighborhood,np.ndarray):
+        return Neighborhood[Mask]
+
+    return [neighbor for neighbor , selected in zip(Neighborhood,Mask) if selected]
+
+def JoinNeighborhoods(
+        Neighborhoods: list[list[np.ndarray] | MoveNeighborhood],
+    ) -> list[np.ndarray] | MoveNeighborhood:
+    """
+    Function to join the neighborhoods evaluated 
+    one at a time into a single neighborhood.
+
+    Parameters
+    ----------
+    Neighborhoods: list[list[np.ndarray] | MoveNeighborhood]
+        Neighborhoods to join, of the same type
+
+    Return
+    ------
+    JoinedNeighborhood: list[np.ndarray] | MoveNeighborhood
+        Neighborhood with the neighbors of all the neighborhoods
+    """
+
+    if Neighborhoods and isinstance(Neighborhoods[0],MoveNeighborhood):
+        return MoveNeighborhood(Neighborhoods[0].Solution,np.concatenate([neighborhood.Moves for neighborhood in Neighborhoods]),Neighborhoods[0].ApplyMove)
+
+    return [neighbor for neighborhood in Neighborhoods for neighbor in neighborhood]
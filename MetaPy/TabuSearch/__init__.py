@@ -1 +1,3 @@
-from .TabuSearch import TabuSearchOptimizer
\ No newline at end of file
+from .TabuSearch import TabuSearchOptimizer
+from .TabuMemory import TabuMemory
+from .Neighborhoods import MoveNeighborhood
\ No newline at end of file
@@ -24,11 +24,12 @@ def RealValueIndividuals(
     Return
     ------
     InitPopulation: Callable[[int],np.ndarray]
-        Population initializer functions that takes a `PopulationSize` parameter and returns a `Population` of that size
+        Population initializer functions that takes a `PopulationSize` parameter (and optionally a `RandomGenerator`) and returns a `Population` of that size
     """
     
     def InitPopulation(
             PopulationSize: int,
+            RandomGenerator: np.random.Generator | None = None,
         ) -> np.ndarray:
         """
         Function for generating a `Population` of 
@@ -40,12 +41,18 @@ def RealValueIndividuals(
         PopulationSize: int
             Size of the `Population` to generate
 
+        RandomGenerator: np.random.Generator | None
+            Random generator used to sample the `Population`. If None, a new unseeded one is used
+
         Return
         ------
         Population: np.ndarray
             Generated `Population` of shape `(PopulationSize,Dim)`
         """
 
-        return np.random.uniform(LowerBound,UpperBound,size=(PopulationSize,Dimension))
+        if RandomGenerator is None:
+            RandomGenerator = np.random.default_rng()
+
+        return RandomGenerator.uniform(LowerBound,UpperBound,size=(PopulationSize,Dimension))
 
     return InitPopulation
\ No newline at end of file
@@ -2,5 +2,6 @@ from .Base import *
 from .DifferentialEvolution import *
 from .TabuSearch import * 
 from .SimulatedAnnealing import *
+from .Benchmarks import *
 
 from .Utils import *
\ No newline at end of file
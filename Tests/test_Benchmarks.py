@@ -0,0 +1,92 @@
+from MetaPy import Sphere , Rosenbrock , Rastrigin , Ackley , Griewank , Schwefel , ShiftedRotated , Bounded
+from MetaPy import RandomTSP , TourLength , RandomQAP , AssignmentCost , AssignmentSwapGain , SwapMoves , SwapNeighborhood , ApplySwap , RandomSwap , RandomPermutation
+from MetaPy import DifferentialEvolutionOptimizer , RealValueIndividuals , BenchmarkOptimizer , DefaultCases , RunBenchmarks , CompareBenchmarks
+import numpy as np
+
+# Defining instance for testing and auxiliar variables
+
+Dim = 5
+RandomGenerator = np.random.default_rng(0)
+Population = RandomGenerator.uniform(-5,5,(20,Dim))
+
+# Test cases
+
+def test_Functions():
+    """
+    Function for testing the optimum of the benchmark functions and that batch and single evaluations match
+    """
+
+    Optima = {Sphere: 0.0,Rosenbrock: 1.0,Rastrigin: 0.0,Ackley: 0.0,Griewank: 0.0,Schwefel: 420.9687}
+    for function , optimum in Optima.items():
+        assert np.isclose(function(np.full(Dim,optimum)),0,atol=1e-3)
+        assert np.allclose(function(Population),[function(solution) for solution in Population])
+        assert np.all(function(Population) >= function(np.full(Dim,optimum)))
+
+    Shifted = ShiftedRotated(Rastrigin,Dim,RandomGenerator=0)
+    assert np.isclose(Shifted(Shifted.Shift),0)
+    assert np.allclose(Shifted.Rotation@Shifted.Rotation.T,np.eye(Dim))
+    assert np.allclose(Shifted(Population),[Shifted(solution) for solution in Population])
+
+    BoundedSchwefel = Bounded(Schwefel,-500,500)
+    assert BoundedSchwefel.__name__ == 'Schwefel'
+    assert np.all(BoundedSchwefel(1e6*Population) >= 0) and np.allclose(BoundedSchwefel(Population),Schwefel(Population))
+
+def test_Instances():
+    """
+    Function for testing the objective functions and moves of the TSP and QAP instances
+    """
+
+    Distances = RandomTSP(10,0)
+    Tour = RandomPermutation(10)(RandomGenerator)
+    assert np.isclose(TourLength(Distances)(Tour),sum(Distances[Tour[index],Tour[(index+1)%10]] for index in range(10)))
+
+    Neighbors = RandomSwap(np.stack([Tour,Tour]),RandomGenerator)
+    assert np.all(np.sum(Neighbors != Tour,axis=1) == 2)
+
+    Flows , Distances = RandomQAP(9,0)
+    Cost , Gain = AssignmentCost(Flows,Distances) , AssignmentSwapGain(Flows,Distances)
+    Assignment , Moves = RandomPermutation(9)(RandomGenerator) , SwapMoves(9)
+    assert np.allclose(Gain(Assignment,Moves),[Cost(ApplySwap(Assignment,move))-Cost(Assignment) for move in Moves])
+    assert np.allclose(Cost(np.stack([Assignment,Assignment])),Cost(Assignment))
+
+    Neighborhood = SwapNeighborhood(9,MaxMoves=10)(Assignment,None,RandomGenerator)
+    assert len(Neighborhood) == 10 and len({tuple(move) for move in Neighborhood.Moves}) == 10
+    assert len(SwapNeighborhood(9)(Assignment,None,RandomGenerator)) == len(Moves)
+
+def test_Harness():
+    """
+    Function for testing the measures of the benchmark harness and the comparison of results
+    """
+
+    Optimizer = DifferentialEvolutionOptimizer(Sphere,RealValueIndividuals(-5,5,Dim),BatchObjective=True,RandomGenerator=0)
+    Results = BenchmarkOptimizer(Optimizer,50,{'PopulationSize': 20,'ScalingFactor': 0.5,'CrossoverRate': 0.9},Target=10.0,Repeats=2)
+    assert np.isclose(Results['EvaluationsPerSecond'],21*Results['IterationsPerSecond'],rtol=0.5)
+    assert Results['SuccessRate'] == 1.0
+    assert 0 <= Results['TimeToTarget'] <= Results['Time']
+    assert Results['PeakMemory'] > 0
+
+    Cases = DefaultCases(Dimensions=(2,),Iterations=5)
+    TableResults = RunBenchmarks(Cases,Label='Test',Repeats=1,MeasureMemory=False)
+    assert TableResults.num_rows == len(Cases)
+    assert {case['Name'].split('/')[0] for case in DefaultCases(Dimensions=(2,10),Iterations=1) if case['Dimension'] == 10} == {'DifferentialEvolution','TabuSearch','SimulatedAnnealing'}
+    assert TableResults.schema.metadata[b'Label'] == b'Test'
+
+    TableComparison = CompareBenchmarks(TableResults,TableResults)
+    assert np.allclose(TableComparison['SpeedRatio'].to_numpy(),1)
+    assert not any(TableComparison['Regression'].to_pylist())
+
+def test_HarnessOptimum():
+    """
+    Function for testing that the Schwefel case stays at or above its optimum and that values below it are not successes
+    """
+
+    Hyperparameters = {'PopulationSize': 100,'ScalingFactor': 0.5,'CrossoverRate': 0.9}
+    for case in DefaultCases(Dimensions=(2,100)):
+        if case['Name'].startswith('DifferentialEvolution/Schwefel'):
+            Results = BenchmarkOptimizer(case['Optimizer'],case['Iterations'],case['Hyperparameters'],case['Target'],3,False,case['Optimum'])
+            assert Results['OptimalValue'] >= 0
+
+    Unbounded = DifferentialEvolutionOptimizer(Schwefel,RealValueIndividuals(-500,500,100),BatchObjective=True,RandomGenerator=0)
+    Results = BenchmarkOptimizer(Unbounded,100,Hyperparameters,Target=1e-2,Repeats=3,MeasureMemory=False,Optimum=0.0)
+    assert Results['OptimalValue'] < 0
+    assert Results['SuccessRate'] == 0 and np.isnan(Results['TimeToTarget'])
@@ -0,0 +1,75 @@
+from MetaPy import DifferentialEvolutionOptimizer , RealValueIndividuals , ConvergenceStatistics
+from scipy.optimize import rosen
+import numpy as np
+import os
+
+# Defining instance for testing and auxiliar variables
+
+Dim = 2
+ObjFunc = rosen
+PopFunc = RealValueIndividuals(-100,100,Dim)
+
+iters = 20
+params = {
+        'PopulationSize': 20,
+        'ScalingFactor': 0.5,
+        'CrossoverRate': 0.5,
+    }
+
+Snapshots = np.minimum.accumulate(np.random.default_rng(0).exponential(10,(40,iters+1)),axis=1)
+
+# Test cases
+
+def test_Statistics():
+    """
+    Function for testing that the streaming statistics match the statistics of all the snapshots
+    """
+
+    Statistics = ConvergenceStatistics(iters,Targets=(1.0,),RandomGenerator=0)
+    for snapshots in Snapshots:
+        Statistics.Update(snapshots)
+
+    Summary = Statistics.Summary()
+    assert np.allclose(Summary['Mean'],Snapshots.mean(axis=0))
+    assert np.allclose(Summary['Std'],Snapshots.std(axis=0,ddof=1))
+    assert np.allclose(Summary['Min'],Snapshots.min(axis=0))
+    assert np.allclose(Summary['Q0.5'],np.median(Snapshots,axis=0))
+    assert np.allclose(Summary['SuccessRate1.0'],np.mean(Snapshots <= 1.0,axis=0))
+
+def test_Reservoir():
+    """
+    Function for testing that the reservoir of the quantiles keeps a bounded number of simulations
+    """
+
+    Statistics = ConvergenceStatistics(iters,ReservoirSize=10,RandomGenerator=0)
+    for snapshots in Snapshots:
+        Statistics.Update(snapshots)
+
+    assert len(Statistics.Reservoir) == 10
+    assert Statistics.Count == len(Snapshots)
+    assert np.all(Statistics.Summary()['Q0.05'] >= Snapshots.min(axis=0))
+
+def test_SimulationsSummary():
+    """
+    Function for testing the summary of the simulations of Differential Evolution
+    """
+
+    file_name = '__TestSummary'
+    try:
+        Statistics = ConvergenceStatistics(iters,Targets=(1e3,))
+        DatasetResults = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).GenerateSimulations(iters,Simulations=4,FileName=file_name,Statistics=Statistics,**params)
+        Raw = np.column_stack([DatasetResults.to_table()[f'{iteration}'].to_numpy() for iteration in range(iters+1)])
+        assert np.allclose(Statistics.Mean,Raw.mean(axis=0))
+
+        DatasetSummary = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).GenerateSimulations(iters,Simulations=4,FileName=file_name,Statistics=True,SaveRaw=False,**params)
+        assert np.allclose(DatasetSummary.to_table()['Mean'].to_numpy(),Statistics.Mean)
+
+        try:
+            DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).GenerateSimulations(iters,Simulations=4,FileName='__TestNothing',SaveRaw=False,**params)
+        except Exception as excpt:
+            assert 'Statistics' in str(excpt)
+        else:
+            assert False
+    finally:
+        os.remove(f'{file_name}.parquet')
+        os.remove(f'{file_name}_summary.parquet')
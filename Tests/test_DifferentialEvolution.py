@@ -1,6 +1,12 @@
-from MetaPy import DifferentialEvolutionOptimizer , RealValueIndividuals
+from MetaPy import DifferentialEvolutionOptimizer , RealValueIndividuals , StoppingCriteria , CheckpointWriter , Profiler , AcceptsRandomGenerator , CannotImprove , SpawnRandomGenerator , SpawnKeys
 from scipy.optimize import rosen
 
+import numpy as np
+import optuna
+import shutil
+import weakref
+import time
+import gc
 import os
 
 # Defining instance for testing and auxiliar variables
@@ -31,6 +37,204 @@ def test_Functionality():
     BestSolution , Snapshots = DiffEvol(iters,**params)
     assert Snapshots[0] >= Snapshots[-1]
 
+def test_BatchObjective():
+    """
+    Function for testing Differential Evolution with a batch (vectorized) objective function
+    """
+
+    BatchDiffEvol = DifferentialEvolutionOptimizer(
+            lambda Population: rosen(Population.T),
+            PopFunc,
+            BatchObjective=True,
+        )
+
+    BestSolution , Snapshots = BatchDiffEvol(iters,**params)
+    assert Snapshots[0] >= Snapshots[-1]
+    assert BestSolution.shape == (Dim,)
+
+def test_Reproducibility():
+    """
+    Function for testing that Differential Evolution is reproducible given a seed
+    """
+
+    Results = [DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0)(iters,**params) for _ in range(2)]
+    assert np.array_equal(Results[0][0],Results[1][0])
+    assert Results[0][1] == Results[1][1]
+
+    file_names = ['__TestSerial','__TestParallel']
+    try:
+        Datasets = [
+                DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).GenerateSimulations(iters,Simulations=3,NumJobs=num_jobs,FileName=file_name,**params).to_table()
+                for num_jobs , file_name in zip((1,2),file_names)
+            ]
+        assert Datasets[0].equals(Datasets[1])
+    finally:
+        for file_name in file_names:
+            os.remove(f'{file_name}.parquet')
+
+def test_RandomGeneratorParameter():
+    """
+    Function for testing which user functions receive the random generator, without keeping them alive
+    """
+
+    class Initializer:
+        def __call__(
+                self,
+                PopulationSize,
+                RandomGenerator,
+            ) -> np.ndarray:
+            return RandomGenerator.uniform(-100,100,(PopulationSize,Dim))
+
+        def __eq__(
+                self,
+                Other,
+            ) -> bool:
+            return self is Other
+
+    def WrappedInitializer(
+            *Args,
+            **Kwargs,
+        ) -> np.ndarray:
+        assert 'RandomGenerator' not in Kwargs
+        return PopFunc(*Args)
+
+    Initialize = Initializer()
+    assert AcceptsRandomGenerator(Initialize) and not AcceptsRandomGenerator(WrappedInitializer)
+    Results = [DifferentialEvolutionOptimizer(ObjFunc,initializer,RandomGenerator=0)(5,**params) for initializer in (Initialize,Initialize,WrappedInitializer)]
+    assert Results[0][1] == Results[1][1]
+
+    Reference = weakref.ref(WrappedInitializer)
+    del WrappedInitializer , Results
+    gc.collect()
+    assert Reference() is None
+
+def test_StoppingCriteria():
+    """
+    Function for testing the stopping criteria of Differential Evolution
+    """
+
+    Criteria = {
+            'MaxEvaluations': StoppingCriteria(MaxEvaluations=500),
+            'TargetFitness': StoppingCriteria(TargetFitness=1e6),
+            'Stagnation': StoppingCriteria(StagnationIterations=1,StagnationTolerance=1e12),
+            'Diversity': StoppingCriteria(MinDiversity=1e6),
+        }
+
+    for stop_reason , criteria in Criteria.items():
+        StoppedDiffEvol = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,Stopping=criteria)
+        BestSolution , Snapshots = StoppedDiffEvol(iters,**params)
+        assert StoppedDiffEvol.StopReason == stop_reason
+        assert len(Snapshots) < iters+1
+
+    InitialDiffEvol = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,Stopping=StoppingCriteria(TargetFitness=np.inf))
+    BestSolution , Snapshots = InitialDiffEvol(iters,**params)
+    assert InitialDiffEvol.StopReason == 'TargetFitness'
+    assert len(Snapshots) == 1 and InitialDiffEvol.SearchStopping.Evaluations == params['PopulationSize']
+
+    BestSolution , Snapshots = DiffEvol(iters,**params)
+    assert DiffEvol.StopReason == 'Iterations'
+    assert len(Snapshots) == iters+1
+
+def test_Checkpoints(tmp_path):
+    """
+    Function for testing that a search of Differential Evolution resumed from a checkpoint continues the same trajectory
+    """
+
+    file_name = str(tmp_path/'Checkpoint.npz')
+    BestSolution , Snapshots = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0,Checkpoints=CheckpointWriter(file_name,Interval=30))(iters,**params)
+
+    ResumedBestSolution , ResumedSnapshots = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=1).Resume(file_name)
+    assert np.array_equal(BestSolution,ResumedBestSolution)
+    assert Snapshots == ResumedSnapshots
+
+def test_CheckpointsSimulations(tmp_path):
+    """
+    Function for testing that each simulation of Differential Evolution writes its own checkpoint
+    """
+
+    file_name = str(tmp_path/'Checkpoint.npz')
+    CheckpointDiffEvol = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0,Checkpoints=CheckpointWriter(file_name,Interval=30))
+    Table = CheckpointDiffEvol.GenerateSimulations(iters,Simulations=2,NumJobs=2,FileName=str(tmp_path/'Results'),**params).to_table()
+
+    assert not os.path.exists(file_name)
+    for simulation in range(2):
+        checkpoint_name = str(tmp_path/f'Checkpoint_0_{simulation}.npz')
+        ResumedBestSolution , ResumedSnapshots = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=1).Resume(checkpoint_name)
+        assert ResumedSnapshots[-1] == Table[f'{iters}'][simulation].as_py()
+
+    try:
+        CheckpointWriter(file_name,Interval=0)
+    except Exception as excpt:
+        assert 'Interval' in str(excpt)
+    else:
+        assert False
+
+def test_Profiling():
+    """
+    Function for testing the profile and callbacks of a search of Differential Evolution
+    """
+
+    Iterations = []
+    ProfiledDiffEvol = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0,Profiler=Profiler(Diversity=True),Callbacks=[lambda Optimizer , Iteration: Iterations.append(Iteration),lambda Optimizer , Iteration: time.sleep(0.002) or Iteration == 20])
+    BestSolution , Snapshots = ProfiledDiffEvol(iters,**params)
+    assert ProfiledDiffEvol.StopReason == 'Callback'
+    assert Iterations == list(range(1,21))
+
+    Profile = ProfiledDiffEvol.Profile.ToDict()
+    assert set(Profile['Phases']) == {'Initialization','Mutation','Crossover','Evaluation','Selection','Bookkeeping','Callbacks'}
+    assert Profile['Phases']['Callbacks'] >= 20*0.002
+    assert sum(Profile['Phases'].values()) <= Profile['Time']
+    assert Profile['Evaluations'] == 21*params['PopulationSize']
+    assert 0 < Profile['AcceptanceRate'] < 1
+    assert Profile['History']['OptimalValue'] == Snapshots[1:]
+
+    TableProfile = ProfiledDiffEvol.Profile.ToTable()
+    assert TableProfile.num_rows == 20
+    assert np.all(TableProfile['Diversity'].to_numpy() > 0)
+
+    BestSolution , Snapshots = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0)(iters,**params)
+    assert Snapshots[:21] == ProfiledDiffEvol.Snapshots
+
+def test_AskTell():
+    """
+    Function for testing that a search of Differential Evolution driven by Ask and Tell with external evaluations follows the trajectory of the call
+    """
+
+    BestSolution , Snapshots = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0)(iters,**params)
+
+    AskTellDiffEvol = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0)
+    AskTellDiffEvol.Start(iters,**params)
+    while not AskTellDiffEvol.Finished:
+        Candidates = AskTellDiffEvol.Ask()
+        assert Candidates.shape == (params['PopulationSize'],Dim)
+        AskTellDiffEvol.Tell(Candidates,[rosen(candidate) for candidate in Candidates])
+    AskTellBestSolution , AskTellSnapshots = AskTellDiffEvol.Finish()
+
+    assert np.array_equal(BestSolution,AskTellBestSolution)
+    assert Snapshots == AskTellSnapshots
+    assert AskTellDiffEvol.SearchStopping.Evaluations == (iters+1)*params['PopulationSize']
+
+    StepsDiffEvol = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0)
+    StepsDiffEvol.Start(iters,**params)
+    StepsDiffEvol.InitializeOptimization()
+    assert StepsDiffEvol.FitnessValuesPopulation.shape == (params['PopulationSize'],)
+    StepsDiffEvol.FindOptimal(iters)
+    StepsBestSolution , StepsSnapshots = StepsDiffEvol.Finish()
+    assert np.array_equal(BestSolution,StepsBestSolution)
+    assert Snapshots == StepsSnapshots
+
+    class EvaluatingCrossover(DifferentialEvolutionOptimizer):
+        def CrossoverOperation(self):
+            super().CrossoverOperation()
+            self.FitnessCrossoverPopulation = self.EvaluatePopulation(self.CrossoverPopulation)
+
+    try:
+        EvaluatingCrossover(ObjFunc,PopFunc,RandomGenerator=0)(iters,**params)
+    except Exception as excpt:
+        assert 'CrossoverOperation' in str(excpt)
+    else:
+        assert False
+
 def test_FineTuning():
     """
     Function for testing fine-tuning of Differential Evolution
@@ -41,6 +245,85 @@ def test_FineTuning():
     BestSolution , Snapshots = DiffEvol(iters,**best_params)
     assert Snapshots[0] >= Snapshots[-1]
 
+def test_Pruning():
+    """
+    Function for testing pruning of the trials of fine-tuning of Differential Evolution
+    """
+
+    class AlwaysPruner(optuna.pruners.BasePruner):
+        def prune(self,study,trial):
+            return True
+
+    Hyperparameters = {'PopulationSize': ('int',(10,20)),'ScalingFactor': ('float',(0.1,1)),'CrossoverRate': ('float',(0.1,1))}
+    OptunaObjective = DiffEvol.GetOptunaObjective(iters,DiffEvol.GetHyperparameterSuggestFunctions(Hyperparameters),ReportInterval=5)
+
+    study = optuna.create_study(pruner=AlwaysPruner())
+    study.optimize(OptunaObjective,n_trials=3)
+    for trial in study.trials:
+        assert trial.state == optuna.trial.TrialState.PRUNED
+        assert list(trial.intermediate_values) == [5]
+    assert DiffEvol.Trial is None
+
+    for pruner in ('median','successive_halving','hyperband'):
+        best_params = DiffEvol.FineTuningHyperparameters(iters,Hyperparameters,NumTrials=6,Pruner=pruner)
+        assert set(best_params) == set(Hyperparameters)
+
+def test_PersistentFineTuning(tmp_path):
+    """
+    Function for testing resumable and multi-process fine-tuning of Differential Evolution
+    """
+
+    Storage = f'sqlite:///{tmp_path/"Study.db"}'
+    DiffEvol.FineTuningHyperparameters(iters,NumTrials=3,Storage=Storage)
+    DiffEvol.FineTuningHyperparameters(iters,NumTrials=5,Storage=Storage)
+    assert len(optuna.load_study(study_name='OptimizeHyperparameters',storage=Storage).trials) == 5
+
+    Storage = str(tmp_path/'Study.log')
+    best_params = DiffEvol.FineTuningHyperparameters(iters,NumTrials=6,Storage=Storage,NumProcesses=2)
+    study = optuna.load_study(study_name='OptimizeHyperparameters',storage=optuna.storages.JournalStorage(optuna.storages.journal.JournalFileBackend(Storage)))
+    assert len(study.get_trials(states=(optuna.trial.TrialState.COMPLETE,optuna.trial.TrialState.PRUNED))) == len(study.trials) == 6
+    assert best_params == study.best_params
+
+    try:
+        DiffEvol.FineTuningHyperparameters(iters,NumTrials=2,Storage=optuna.storages.InMemoryStorage(),NumProcesses=2)
+    except Exception as excpt:
+        assert 'in-memory' in str(excpt)
+    else:
+        assert False
+
+def test_RepeatedFineTuning(tmp_path):
+    """
+    Function for testing fine-tuning of Differential Evolution with repeated runs per trial
+    """
+
+    Storage = f'sqlite:///{tmp_path/"Study.db"}'
+    for aggregation in ('mean','median',0.75,'auc'):
+        best_params = DiffEvol.FineTuningHyperparameters(iters,NumTrials=4,Repeats=3,RepeatJobs=2,Aggregation=aggregation,Storage=Storage,StudyName=str(aggregation))
+        study = optuna.load_study(study_name=str(aggregation),storage=Storage)
+        assert best_params == study.best_params
+
+        for trial in study.trials:
+            OptimalValues = trial.user_attrs['RepeatOptimalValues']
+            if trial.user_attrs['EarlyStopped']:
+                assert aggregation in ('mean','auc') and len(OptimalValues) < 3
+                assert trial.state == optuna.trial.TrialState.PRUNED
+                continue
+
+            assert len(OptimalValues) == 3
+            if aggregation == 'mean':
+                assert np.isclose(trial.value,np.mean(OptimalValues))
+            elif aggregation == 'auc':
+                assert np.isclose(trial.value,np.mean(trial.user_attrs['RepeatAreasUnderCurve']))
+
+def test_CannotImprove():
+    """
+    Function for testing the early stopping of the repeats of a trial with the t confidence interval
+    """
+
+    assert not CannotImprove([1.0,2.0],0.0,0.95)
+    assert CannotImprove([1.0,1.1,1.2],0.0,0.95)
+    assert not CannotImprove([1.0],0.0,0.95)
+
 def test_Simulations():
     """
     Function for testing simulations of Differential Evolution
@@ -54,5 +337,112 @@ def test_Simulations():
         assert False
     else:
         assert True
+    finally:
+        os.remove(f'{file_name}.parquet')
+
+def test_EmptySimulations():
+    """
+    Function for testing the file of zero simulations of Differential Evolution
+    """
+
+    file_names = ['__TestEmptyWide','__TestEmptyList','__TestEmptyLong']
+    try:
+        Tables = [
+                DiffEvol.GenerateSimulations(iters,Simulations=0,FileName=file_name,Format=file_format,SaveOptimal=file_format != 'long',**params).to_table()
+                for file_format , file_name in zip(('wide','list','long'),file_names)
+            ]
+
+        assert all(table.num_rows == 0 for table in Tables)
+        assert Tables[0].column_names == [f'{iteration}' for iteration in range(iters+1)]
+        assert Tables[1].column_names == ['Simulation','Snapshots']
+        assert Tables[2].column_names == ['Simulation','Iteration','OptimalValue']
+        assert b'Hyperparameters' in Tables[0].schema.metadata
+    finally:
+        for file_name in file_names:
+            os.remove(f'{file_name}.parquet')
+
+def test_SimulationsFormats():
+    """
+    Function for testing the formats of the file of simulations of Differential Evolution
+    """
+
+    simulations = 5
+    file_names = ['__TestWide','__TestList','__TestLong']
+    try:
+        Tables = [
+                DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).GenerateSimulations(
+                        iters,
+                        Simulations=simulations,
+                        FileName=file_name,
+                        Format=file_format,
+                        Compression='zstd',
+                        BatchSize=2,
+                        SaveOptimal=file_format != 'long',
+                        **params,
+                    ).to_table()
+                for file_format , file_name in zip(('wide','list','long'),file_names)
+            ]
+
+        Wide = np.column_stack([Tables[0][f'{iteration}'].to_numpy() for iteration in range(iters+1)])
+        List = np.array(Tables[1]['Snapshots'].to_pylist())
+        Long = Tables[2]['OptimalValue'].to_numpy().reshape(simulations,iters+1)
+        assert Wide.shape == (simulations,iters+1)
+        assert np.array_equal(Wide,List) and np.array_equal(Wide,Long)
+        assert Tables[1]['Simulation'].to_pylist() == list(range(simulations))
+
+        Individuals = np.array(Tables[1]['OptimalIndividual'].to_pylist())
+        assert np.allclose(np.apply_along_axis(ObjFunc,1,Individuals),List[:,-1])
+        assert b'Hyperparameters' in Tables[0].schema.metadata
+    finally:
+        for file_name in file_names:
+            os.remove(f'{file_name}.parquet')
+
+def test_Campaign():
+    """
+    Function for testing a resumable campaign of simulations of Differential Evolution
+    """
+
+    directory = '__TestCampaign'
+    Configurations = {'PopulationSize': [10,20],'ScalingFactor': [0.5],'CrossoverRate': [0.3,0.7]}
+    try:
+        DatasetResults = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).GenerateCampaign(iters,Configurations,Simulations=3,NumJobs=2,Directory=directory)
+        TableResults = DatasetResults.to_table()
+        assert TableResults.num_rows == 12
+        assert len(set(TableResults['Configuration'].to_pylist())) == 4
+
+        Partitions = sorted(os.listdir(directory))
+        shutil.rmtree(os.path.join(directory,Partitions[0]))
+        ModifiedTimes = [os.path.getmtime(os.path.join(directory,partition,'Results.parquet')) for partition in Partitions[1:]]
+
+        TableResumed = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).GenerateCampaign(iters,Configurations,Simulations=3,Directory=directory).to_table()
+        assert ModifiedTimes == [os.path.getmtime(os.path.join(directory,partition,'Results.parquet')) for partition in Partitions[1:]]
+        assert TableResumed.sort_by([('Configuration','ascending'),('Simulation','ascending')]).equals(TableResults.sort_by([('Configuration','ascending'),('Simulation','ascending')]))
+    finally:
+        shutil.rmtree(directory,ignore_errors=True)
+
+def test_BatchedReplicates():
+    """
+    Function for testing batched replicates of Differential Evolution
+    """
+
+    replicates = 4
+    BestSolutions , Snapshots = DiffEvol.CallReplicates(iters,replicates,**params)
+    assert BestSolutions.shape == (replicates,Dim)
+    assert Snapshots.shape == (replicates,iters+1)
+    assert np.all(Snapshots[:,0] >= Snapshots[:,-1])
+    assert np.all(np.diff(Snapshots,axis=1) <= 0)
+    assert np.allclose(np.apply_along_axis(ObjFunc,1,BestSolutions),Snapshots[:,-1])
+
+    Simulations = [DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).WrapCallMethod(iters,**params)(random_generator) for random_generator in (SpawnRandomGenerator(np.random.default_rng(0),SpawnKeys['Simulations'],replicate) for replicate in range(replicates))]
+    BestSolutions , Snapshots = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0).CallReplicates(iters,replicates,**params)
+    for replicate , (best_solution , snapshots) in enumerate(Simulations):
+        assert np.array_equal(BestSolutions[replicate],best_solution)
+        assert np.array_equal(Snapshots[replicate],snapshots)
+    assert len({SpawnRandomGenerator(np.random.default_rng(0),spawn_key,0).integers(2**63) for spawn_key in SpawnKeys.values()}) == len(SpawnKeys)
+
+    file_name = '__TestBatched'
+    try:
+        DatasetResults = DiffEvol.GenerateSimulations(iters,Simulations=replicates,FileName=file_name,BatchedReplicates=True,**params)
+        assert DatasetResults.count_rows() == replicates
     finally:
         os.remove(f'{file_name}.parquet')
\ No newline at end of file
@@ -0,0 +1,227 @@
+from MetaPy import DifferentialEvolutionOptimizer , SimulatedAnnealingOptimizer , TabuSearchOptimizer , GeometricSchedule , RealValueIndividuals , SerialEvaluator , ThreadPoolEvaluator , ProcessPoolEvaluator , AsyncEvaluator , StoppingCriteria
+from scipy.optimize import rosen
+from time import perf_counter
+import numpy as np
+import asyncio
+
+# Defining instance for testing and auxiliar variables
+
+Dim = 2
+ObjFunc = rosen
+PopFunc = RealValueIndividuals(-100,100,Dim)
+
+Population = PopFunc(50)
+FitnessValues = np.apply_along_axis(ObjFunc,1,Population)
+
+iters = 10
+params = {
+        'PopulationSize': 50,
+        'ScalingFactor': 0.5,
+        'CrossoverRate': 0.5,
+    }
+
+class ScoringServer:
+    """
+    Local stub of a scoring server: takes a solution per connection (a line 
+    of floats) and answers its fitness value after `Delay` seconds, unless the 
+    client disconnects before. Calling it is the (coroutine) objective function
+    """
+
+    def __init__(
+            self,
+            Delay,
+        ):
+        self.Delay = Delay
+        self.Active , self.MaxActive = 0 , 0
+
+    async def __aenter__(
+            self,
+        ) -> 'ScoringServer':
+        self.Server = await asyncio.start_server(self.Handle,'127.0.0.1',0)
+        self.Port = self.Server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(
+            self,
+            *ExceptionInfo,
+        ) -> None:
+        self.Server.close()
+        await self.Server.wait_closed()
+
+    async def Handle(
+            self,
+            Reader,
+            Writer,
+        ) -> None:
+        try:
+            Solution = np.array((await Reader.readline()).split(),dtype=float)
+            try:
+                await asyncio.wait_for(Reader.read(),self.Delay(Solution))
+                return
+            except asyncio.TimeoutError:
+                Writer.write(f'{float(ObjFunc(Solution))!r}\n'.encode())
+                await Writer.drain()
+        finally:
+            Writer.close()
+
+    async def __call__(
+            self,
+            Solution: np.ndarray,
+        ) -> float:
+        self.Active += 1
+        self.MaxActive = max(self.MaxActive,self.Active)
+        Reader , Writer = await asyncio.open_connection('127.0.0.1',self.Port)
+        try:
+            Writer.write((' '.join(map(repr,Solution.tolist()))+'\n').encode())
+            await Writer.drain()
+            return float(await Reader.readline())
+        finally:
+            self.Active -= 1
+            Writer.close()
+
+# Test cases
+
+def test_PoolEvaluators():
+    """
+    Function for testing that pool evaluators compute the same fitness values as the serial evaluator
+    """
+
+    assert np.allclose(SerialEvaluator()(ObjFunc,Population),FitnessValues)
+
+    with ThreadPoolEvaluator(NumWorkers=4,ChunkSize=8) as Evaluator:
+        assert np.allclose(Evaluator(ObjFunc,Population),FitnessValues)
+        assert np.allclose(Evaluator(ObjFunc,list(Population)),FitnessValues)
+        assert np.allclose(Evaluator(lambda Solutions: rosen(Solutions.T),Population,True),FitnessValues)
+
+    with ProcessPoolEvaluator(NumWorkers=2) as Evaluator:
+        assert np.allclose(Evaluator(ObjFunc,Population),FitnessValues)
+
+def test_PersistentPool():
+    """
+    Function for testing that the pool of an evaluator persists across calls of a Metaheuristic
+    """
+
+    with ThreadPoolEvaluator(NumWorkers=2,ChunkSize=10) as Evaluator:
+        DiffEvol = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,Evaluator=Evaluator)
+
+        BestSolution , Snapshots = DiffEvol(iters,**params)
+        Pool = Evaluator.Pool
+        BestSolution , Snapshots = DiffEvol(iters,**params)
+
+        assert Pool is not None and Evaluator.Pool is Pool
+        assert Snapshots[0] >= Snapshots[-1]
+
+    assert Evaluator.Pool is None
+
+def test_SimulatedAnnealingEvaluator():
+    """
+    Function for testing that single chain Simulated Annealing scores its solutions through its evaluator
+    """
+
+    class CountingEvaluator(SerialEvaluator):
+        Calls = 0
+
+        def __call__(
+                self,
+                ObjectiveFunction,
+                Solutions,
+                BatchObjective = False,
+            ) -> np.ndarray:
+            self.Calls += 1
+            return super().__call__(ObjectiveFunction,Solutions,BatchObjective)
+
+    Evaluator = CountingEvaluator()
+    SimAnnealing = SimulatedAnnealingOptimizer(ObjFunc,lambda: np.full(Dim,2.0),lambda Solution: [Solution+0.1,Solution-0.1],GeometricSchedule(),RandomGenerator=0,Evaluator=Evaluator)
+    BestSolution , Snapshots = SimAnnealing(iters,1.0,0.01)
+    assert Evaluator.Calls == iters+1
+    assert np.isclose(ObjFunc(BestSolution),Snapshots[-1])
+
+def test_AsyncEvaluator():
+    """
+    Function for testing the concurrency limit and the timeout penalty of the async evaluator against a local scoring server
+    """
+
+    async def Evaluate():
+        async with ScoringServer(lambda Solution: 10.0 if Solution[0] > 0 else 0.0) as Server:
+            Evaluator = AsyncEvaluator(MaxConcurrency=5,Timeout=0.5,Penalty=-1.0)
+            return await Evaluator(Server,Population[:20]) , Evaluator , Server
+
+    ( AsyncFitnessValues , Completed ) , Evaluator , Server = asyncio.run(Evaluate())
+    Slow = Population[:20,0] > 0
+    assert np.allclose(AsyncFitnessValues[~Slow],FitnessValues[:20][~Slow])
+    assert np.all(AsyncFitnessValues[Slow] == -1.0) and np.array_equal(Completed,~Slow)
+    assert Evaluator.TimedOut == np.count_nonzero(Slow) and Evaluator.Cancelled == 0
+    assert Server.MaxActive == 5
+
+def test_AsyncSearch():
+    """
+    Function for testing that an async search follows the trajectory of the call and that its evaluations are cancelled when a stopping criterion fires
+    """
+
+    async def Search(
+            Optimizer,
+            Evaluator,
+            Delay,
+        ):
+        async with ScoringServer(Delay) as Server:
+            Optimizer.ObjectiveFunction = Server
+            Optimizer.Start(iters,**params)
+            return await Optimizer.AsyncSearch(Evaluator)
+
+    BestSolution , Snapshots = DifferentialEvolutionOptimizer(ObjFunc,PopFunc,RandomGenerator=0)(iters,**params)
+    AsyncBestSolution , AsyncSnapshots = asyncio.run(Search(DifferentialEvolutionOptimizer(None,PopFunc,RandomGenerator=0),AsyncEvaluator(MaxConcurrency=10),lambda Solution: 0.0))
+    assert np.array_equal(BestSolution,AsyncBestSolution)
+    assert np.allclose(Snapshots,AsyncSnapshots)
+
+    TargetDiffEvol = DifferentialEvolutionOptimizer(None,PopFunc,RandomGenerator=0,Stopping=StoppingCriteria(TargetFitness=np.inf))
+    Evaluator = AsyncEvaluator()
+    asyncio.run(Search(TargetDiffEvol,Evaluator,lambda Solution: 10.0*(Solution[0] > 0)))
+    assert TargetDiffEvol.StopReason == 'TargetFitness'
+    assert 0 < Evaluator.Cancelled < params['PopulationSize']
+    assert TargetDiffEvol.SearchStopping.Evaluations == params['PopulationSize']-Evaluator.Cancelled
+
+    TimedDiffEvol = DifferentialEvolutionOptimizer(None,PopFunc,RandomGenerator=0,Stopping=StoppingCriteria(TimeLimit=0.2))
+    Evaluator = AsyncEvaluator()
+    StartTime = perf_counter()
+    asyncio.run(Search(TimedDiffEvol,Evaluator,lambda Solution: 10.0))
+    assert perf_counter()-StartTime < 2
+    assert TimedDiffEvol.StopReason == 'TimeLimit'
+    assert Evaluator.Cancelled == params['PopulationSize']
+    assert TimedDiffEvol.SearchStopping.Evaluations == 0
+
+def test_AsyncTimeouts():
+    """
+    Function for testing that the candidates of an async search whose evaluations always time out are never selected
+    """
+
+    InitialSolution = np.full(Dim,2.0)
+
+    async def TimeOut(
+            Solution: np.ndarray,
+        ) -> float:
+        if np.array_equal(Solution,InitialSolution):
+            return float(ObjFunc(Solution))
+        await asyncio.sleep(10)
+
+    async def Search(
+            Optimizer,
+            *Hyperparameters,
+        ):
+        Optimizer.Start(iters,*Hyperparameters)
+        return await Optimizer.AsyncSearch(AsyncEvaluator(Timeout=0.01,Penalty=-1.0))
+
+    Neighborhood = lambda Solution , TabuList: np.stack([Solution+0.1,Solution-0.1])
+    TabuSearch = TabuSearchOptimizer(TimeOut,lambda: InitialSolution.copy(),Neighborhood,lambda PreviousSolution , CurrentSolution: CurrentSolution,RandomGenerator=0)
+    BestSolution , Snapshots = asyncio.run(Search(TabuSearch,3))
+    assert np.array_equal(BestSolution,InitialSolution) and np.array_equal(TabuSearch.CurrentSolution,InitialSolution)
+    assert Snapshots == [ObjFunc(InitialSolution)]*(iters+1)
+    assert len(TabuSearch.TabuList) == 0 and TabuSearch.SearchStopping.Evaluations == 1
+
+    SimAnnealing = SimulatedAnnealingOptimizer(TimeOut,lambda: InitialSolution.copy(),lambda Solution: [Solution+0.1,Solution-0.1],GeometricSchedule(),RandomGenerator=0)
+    BestSolution , Snapshots = asyncio.run(Search(SimAnnealing,1.0,0.01))
+    assert np.array_equal(BestSolution,InitialSolution) and np.array_equal(SimAnnealing.CurrentSolution,InitialSolution)
+    assert Snapshots == [ObjFunc(InitialSolution)]*(iters+1)
+
+    DiffEvol = DifferentialEvolutionOptimizer(TimeOut,PopFunc,RandomGenerator=0)
+    BestSolution , Snapshots = asyncio.run(Search(DiffEvol,*params.values()))
+    assert Snapshots == [np.inf]*(iters+1) and DiffEvol.SearchStopping.Evaluations == 0
@@ -0,0 +1,44 @@
+import subprocess
+import json
+import sys
+import os
+
+# Defining instance for testing and auxiliar variables
+
+ImportTimeBudget = 0.5
+HeavyModules = ('optuna','pyarrow','joblib','multiprocessing')
+
+ImportScript = f'''
+import json , sys , time
+import numpy
+StartTime = time.perf_counter()
+import MetaPy
+ImportTime = time.perf_counter()-StartTime
+print(json.dumps({{'ImportTime': ImportTime,'Loaded': [module for module in {HeavyModules} if module in sys.modules]}}))
+'''
+
+RootDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def ImportMetaPy() -> dict:
+    """
+    Function for importing MetaPy in a new interpreter
+    """
+
+    Output = subprocess.run([sys.executable,'-c',ImportScript],cwd=RootDirectory,capture_output=True,text=True,check=True)
+    return json.loads(Output.stdout)
+
+# Test cases
+
+def test_LazyImports():
+    """
+    Function for testing that importing MetaPy does not load the heavy dependencies
+    """
+
+    assert ImportMetaPy()['Loaded'] == []
+
+def test_ImportTime():
+    """
+    Function for testing the import time of MetaPy (after NumPy) against its budget
+    """
+
+    assert min(ImportMetaPy()['ImportTime'] for _ in range(3)) < ImportTimeBudget
@@ -0,0 +1,248 @@
+from MetaPy import SimulatedAnnealingOptimizer , GeometricSchedule , LinearSchedule , LogarithmicSchedule , LundyMeesSchedule , AdaptiveSchedule , StoppingCriteria , CheckpointWriter , Profiler
+import numpy as np
+
+# Defining instance for testing and auxiliar variables
+
+Dim = 3
+
+def ObjFunc(
+        Solution: np.ndarray,
+    ) -> float:
+    return float(np.sum(Solution**2))
+
+def InitSolution(
+        RandomGenerator: np.random.Generator,
+    ) -> np.ndarray:
+    return RandomGenerator.uniform(-10,10,Dim)
+
+def Neighborhood(
+        Solution: np.ndarray,
+    ) -> list[np.ndarray]:
+    return [Solution+step for step in np.concatenate((np.eye(Dim),-np.eye(Dim)))*0.5]
+
+def RandomNeighbor(
+        Solution: np.ndarray,
+        RandomGenerator: np.random.Generator,
+    ) -> np.ndarray:
+    return Solution+RandomGenerator.normal(0,0.5,Dim)
+
+def Schedule(
+        InitialTemperature: float,
+        FinalTemperature: float,
+    ) -> list[float]:
+    return list(np.geomspace(InitialTemperature,FinalTemperature,500))
+
+SimAnnealing = SimulatedAnnealingOptimizer(
+        ObjFunc,
+        InitSolution,
+        Neighborhood,
+        Schedule,
+    )
+
+iters = 500
+params = {
+        'InitialTemperature': 10,
+        'FinalTemperature': 0.001,
+    }
+
+# Test cases
+
+def test_Functionality():
+    """
+    Function for evaluate functionality of Simulated Annealing and check its optimization
+    """
+
+    BestSolution , Snapshots = SimAnnealing(iters,**params)
+    assert Snapshots[0] >= Snapshots[-1]
+    assert np.isclose(ObjFunc(BestSolution),Snapshots[-1])
+
+def test_StoppingCriteria():
+    """
+    Function for testing the stopping criteria of single and multi-chain Simulated Annealing, also checked after the initialization
+    """
+
+    Criteria = {
+            'MaxEvaluations': (StoppingCriteria(MaxEvaluations=100),100),
+            'TargetFitness': (StoppingCriteria(TargetFitness=np.inf),1),
+            'TimeLimit': (StoppingCriteria(TimeLimit=0),1),
+        }
+
+    for stop_reason , (criteria , snapshots_length) in Criteria.items():
+        StoppedSimAnnealing = SimulatedAnnealingOptimizer(ObjFunc,InitSolution,Neighborhood,Schedule,RandomGenerator=0,Stopping=criteria)
+        BestSolution , Snapshots = StoppedSimAnnealing(iters,**params)
+        assert StoppedSimAnnealing.StopReason == stop_reason
+        assert len(Snapshots) == snapshots_length
+        assert StoppedSimAnnealing.SearchStopping.Evaluations == snapshots_length
+
+    StoppedSimAnnealing = SimulatedAnnealingOptimizer(ObjFunc,InitSolution,Neighborhood,Schedule,RandomGenerator=0,Stopping=StoppingCriteria(TargetFitness=np.inf))
+    BestSolution , Snapshots = StoppedSimAnnealing.CallChains(iters,4,**params)
+    assert StoppedSimAnnealing.StopReason == 'TargetFitness'
+    assert len(Snapshots) == 1
+
+def test_RandomNeighbor():
+    """
+    Function for testing Simulated Annealing with a single random neighbor generator and small blocks of draws
+    """
+
+    for block_size in (1,7,1024):
+        NeighborSimAnnealing = SimulatedAnnealingOptimizer(
+                ObjFunc,
+                InitSolution,
+                None,
+                Schedule,
+                RandomGenerator=0,
+                GenerateRandomNeighbor=RandomNeighbor,
+                BlockSize=block_size,
+            )
+
+        BestSolution , Snapshots = NeighborSimAnnealing(iters,**params)
+        assert len(Snapshots) == 501
+        assert Snapshots[-1] < 1
+
+def test_MultiChain():
+    """
+    Function for testing multi-chain Simulated Annealing and parallel tempering with a batch objective
+    """
+
+    ChainsSimAnnealing = SimulatedAnnealingOptimizer(
+            lambda Solutions: np.sum(Solutions**2,axis=1),
+            InitSolution,
+            None,
+            Schedule,
+            RandomGenerator=0,
+            GenerateRandomNeighbor=lambda Solutions , RandomGenerator: Solutions+RandomGenerator.normal(0,0.5,Solutions.shape),
+            BatchObjective=True,
+        )
+
+    for parallel_tempering in (False,True):
+        BestSolution , Snapshots = ChainsSimAnnealing.CallChains(iters,8,**params,ParallelTempering=parallel_tempering)
+        assert len(Snapshots) == 501
+        assert np.all(np.diff(Snapshots) <= 0)
+        assert np.isclose(ObjFunc(BestSolution),Snapshots[-1])
+        assert Snapshots[-1] < 1
+
+    assert 0 < ChainsSimAnnealing.ExchangeAcceptanceRate <= 1
+
+    BestSolution , Snapshots = ChainsSimAnnealing(iters,**params)
+    assert Snapshots[0] >= Snapshots[-1]
+
+def test_TemperatureSchedules():
+    """
+    Function for testing the lazy temperature schedules and that Simulated Annealing honors the iterations
+    """
+
+    for schedule in (GeometricSchedule(),LinearSchedule(),LogarithmicSchedule(),LundyMeesSchedule()):
+        temperatures = list(schedule(10,0.01,100))
+        assert len(temperatures) == 100
+        assert np.isclose(temperatures[0],10) and np.isclose(temperatures[-1],0.01)
+        assert np.all(np.diff(temperatures) < 0)
+
+        ScheduleSimAnnealing = SimulatedAnnealingOptimizer(ObjFunc,InitSolution,None,schedule,GenerateRandomNeighbor=RandomNeighbor)
+        BestSolution , Snapshots = ScheduleSimAnnealing(100,**params)
+        assert len(Snapshots) == 101
+
+    BestSolution , Snapshots = SimAnnealing(100,**params)
+    assert len(Snapshots) == 101
+
+def test_AdaptiveSchedule():
+    """
+    Function for testing the adaptive temperature schedule with reheating
+    """
+
+    AdaptiveSimAnnealing = SimulatedAnnealingOptimizer(
+            ObjFunc,
+            InitSolution,
+            None,
+            AdaptiveSchedule(Window=20,ReheatAfter=50),
+            GenerateRandomNeighbor=RandomNeighbor,
+        )
+
+    BestSolution , Snapshots = AdaptiveSimAnnealing(iters,**params)
+    assert len(Snapshots) == iters+1
+    assert Snapshots[-1] < 1
+
+    BestSolution , Snapshots = AdaptiveSimAnnealing.CallChains(iters,4,**params)
+    assert len(Snapshots) == iters+1
+
+def test_AskTell():
+    """
+    Function for testing that a search of Simulated Annealing driven by Ask and Tell follows the trajectory of the call
+    """
+
+    BestSolution , Snapshots = SimulatedAnnealingOptimizer(ObjFunc,InitSolution,None,GeometricSchedule(),RandomGenerator=0,GenerateRandomNeighbor=RandomNeighbor)(iters,**params)
+
+    AskTellSimAnnealing = SimulatedAnnealingOptimizer(ObjFunc,InitSolution,None,GeometricSchedule(),RandomGenerator=0,GenerateRandomNeighbor=RandomNeighbor)
+    AskTellSimAnnealing.Start(iters,**params)
+    while not AskTellSimAnnealing.Finished:
+        Candidates = AskTellSimAnnealing.Ask()
+        assert len(Candidates) == 1
+        AskTellSimAnnealing.Tell(Candidates,[ObjFunc(Candidates[0])])
+    AskTellBestSolution , AskTellSnapshots = AskTellSimAnnealing.Finish()
+
+    assert np.array_equal(BestSolution,AskTellBestSolution)
+    assert Snapshots == AskTellSnapshots
+    assert len(Snapshots) == iters+1
+
+def test_Checkpoints(tmp_path):
+    """
+    Function for testing that a search of Simulated Annealing resumed from a checkpoint continues the same trajectory
+    """
+
+    file_name = str(tmp_path/'Checkpoint.npz')
+    for schedule in (GeometricSchedule(),AdaptiveSchedule(Window=20,ReheatAfter=50)):
+        BestSolution , Snapshots = SimulatedAnnealingOptimizer(
+                ObjFunc,
+                InitSolution,
+                None,
+                schedule,
+                RandomGenerator=0,
+                GenerateRandomNeighbor=RandomNeighbor,
+                BlockSize=64,
+                Checkpoints=CheckpointWriter(file_name,Interval=150),
+            )(iters,**params)
+
+        ResumedBestSolution , ResumedSnapshots = SimulatedAnnealingOptimizer(ObjFunc,InitSolution,None,schedule,RandomGenerator=1,GenerateRandomNeighbor=RandomNeighbor,BlockSize=64).Resume(file_name)
+        assert np.array_equal(BestSolution,ResumedBestSolution)
+        assert Snapshots == ResumedSnapshots
+
+def test_Profiling():
+    """
+    Function for testing the profile and callbacks of single and multi-chain Simulated Annealing
+    """
+
+    ProfiledSimAnnealing = SimulatedAnnealingOptimizer(
+            ObjFunc,
+            InitSolution,
+            None,
+            Schedule,
+            RandomGenerator=0,
+            GenerateRandomNeighbor=RandomNeighbor,
+            Profiler=Profiler(Diversity=True),
+            Callbacks=[lambda Optimizer , Iteration: Optimizer.OptimalFitnessValue < 1],
+        )
+
+    BestSolution , Snapshots = ProfiledSimAnnealing(iters,**params)
+    assert ProfiledSimAnnealing.StopReason == 'Callback'
+    assert Snapshots[-1] < 1 <= Snapshots[-2]
+
+    Profile = ProfiledSimAnnealing.Profile.ToDict()
+    assert {'Schedule','Neighbor','Evaluation','Acceptance'} <= set(Profile['Phases'])
+    assert Profile['Counters']['Proposed'] == len(Snapshots)-1
+    assert np.all(np.isnan(Profile['History']['Diversity']))
+
+    ProfiledSimAnnealing.Callbacks = None
+    BestSolution , Snapshots = ProfiledSimAnnealing.CallChains(iters,4,**params)
+    TableProfile = ProfiledSimAnnealing.Profile.ToTable()
+    assert TableProfile.num_rows == len(Snapshots)-1
+    assert TableProfile['Evaluations'].to_pylist()[-1] == 4*len(Snapshots)
+    assert np.all(TableProfile['Diversity'].to_numpy() >= 0)
+
+def test_FineTuning():
+    """
+    Function for testing fine-tuning of Simulated Annealing
+    """
+
+    best_params = SimAnnealing.FineTuningHyperparameters(100,NumTrials=3)
+
+    BestSolution , Snapshots = SimAnnealing(100,**best_params)
+    assert len(Snapshots) == 101
\ No newline at end of file
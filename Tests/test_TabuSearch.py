@@ -0,0 +1,291 @@
+from MetaPy import TabuSearchOptimizer , TabuMemory , MoveNeighborhood , FitnessCache , StoppingCriteria , CheckpointWriter , Profiler
+import numpy as np
+
+# Defining instance for testing and auxiliar variables
+
+Dim = 5
+Target = np.arange(Dim)
+
+def ObjFunc(
+        Solution: np.ndarray,
+    ) -> float:
+    return float(np.sum((Solution-Target)**2))
+
+def InitSolution() -> np.ndarray:
+    return np.full(Dim,9)
+
+def Neighborhood(
+        Solution: np.ndarray,
+        TabuList: list,
+    ) -> list[np.ndarray]:
+    neighborhood = []
+    for index in range(Dim):
+        for step in (-1,1):
+            neighbor = Solution.copy()
+            neighbor[index] += step
+            neighborhood.append(neighbor)
+    return neighborhood
+
+def TabuRepr(
+        PreviousSolution: np.ndarray,
+        CurrentSolution: np.ndarray,
+    ) -> int:
+    return int(np.argmax(PreviousSolution != CurrentSolution))
+
+TabuSearch = TabuSearchOptimizer(
+        ObjFunc,
+        InitSolution,
+        Neighborhood,
+        TabuRepr,
+    )
+
+iters = 50
+params = {
+        'TabuTime': 3,
+    }
+
+# Test cases
+
+def test_Functionality():
+    """
+    Function for evaluate functionality of Tabu Search and check its optimization
+    """
+
+    BestSolution , Snapshots = TabuSearch(iters,**params)
+    assert Snapshots[0] >= Snapshots[-1]
+    assert Snapshots[-1] == 0
+
+def test_StoppingCriteria():
+    """
+    Function for testing the stopping criteria of Tabu Search, also checked after the initialization
+    """
+
+    Criteria = {
+            'TargetFitness': (StoppingCriteria(TargetFitness=0),36),
+            'MaxEvaluations': (StoppingCriteria(MaxEvaluations=100),12),
+            'Stagnation': (StoppingCriteria(StagnationIterations=1,StagnationTolerance=1e6),3),
+            'TimeLimit': (StoppingCriteria(TimeLimit=0),1),
+        }
+
+    for stop_reason , (criteria , snapshots_length) in Criteria.items():
+        StoppedTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,Neighborhood,TabuRepr,Stopping=criteria)
+        BestSolution , Snapshots = StoppedTabuSearch(iters,**params)
+        assert StoppedTabuSearch.StopReason == stop_reason
+        assert len(Snapshots) == snapshots_length
+
+    InitialTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,Neighborhood,TabuRepr,Stopping=StoppingCriteria(TargetFitness=ObjFunc(InitSolution())))
+    BestSolution , Snapshots = InitialTabuSearch(iters,**params)
+    assert InitialTabuSearch.StopReason == 'TargetFitness'
+    assert InitialTabuSearch.SearchStopping.Evaluations == 1
+
+def test_ReduceNeighborhoodOverride():
+    """
+    Function for testing that overrides of ReduceNeighborhoodOperation with the original signature keep working
+    """
+
+    Reductions = []
+
+    class ReducedTabuSearch(TabuSearchOptimizer):
+        def ReduceNeighborhoodOperation(
+                self,
+                TabuList,
+                CurrentNeighborhood,
+            ):
+            Reductions.append(len(CurrentNeighborhood))
+            return super().ReduceNeighborhoodOperation(TabuList,CurrentNeighborhood)
+
+    BestSolution , Snapshots = ReducedTabuSearch(ObjFunc,InitSolution,Neighborhood,TabuRepr)(iters,**params)
+    assert Snapshots[-1] == 0
+    assert len(Reductions) == len(Snapshots)-1
+
+def test_TabuMemory():
+    """
+    Function for testing the tabu time of the keys of the tabu memory
+    """
+
+    Memory = TabuMemory(2)
+    Memory.Add('a')
+    Memory.Step()
+    Memory.Add('b')
+    assert 'a' in Memory and 'b' in Memory
+    Memory.Step()
+    assert 'a' in Memory and 'b' in Memory
+    Memory.Step()
+    assert 'a' not in Memory and 'b' in Memory
+    assert len(Memory) == 1 and [tabu[-1] for tabu in Memory] == [1]
+    Memory.Step()
+    assert len(Memory) == 0
+
+def test_TabuKeyAspiration():
+    """
+    Function for testing Tabu Search with tabu representations as keys and aspiration criterion
+    """
+
+    for tabu_key , aspiration in (('Representation',False),('Representation',True),('Solution',True)):
+        KeyTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,Neighborhood,TabuRepr,TabuKey=tabu_key,Aspiration=aspiration)
+        BestSolution , Snapshots = KeyTabuSearch(iters,TabuTime=2)
+        assert Snapshots[-1] == 0
+
+def test_ArrayNeighborhood():
+    """
+    Function for testing Tabu Search with neighborhoods as arrays of shape (Size,Dim)
+    """
+
+    Steps = np.concatenate((np.eye(Dim,dtype=int),-np.eye(Dim,dtype=int)))
+    ArrayTabuSearch = TabuSearchOptimizer(
+            ObjFunc,
+            InitSolution,
+            lambda Solution , TabuList: Solution+Steps,
+            TabuRepr,
+        )
+
+    BestSolution , Snapshots = ArrayTabuSearch(iters,**params)
+    assert Snapshots[-1] == 0
+    assert np.array_equal(BestSolution,Target)
+
+def test_MoveNeighborhood():
+    """
+    Function for testing Tabu Search with move neighborhoods and delta evaluation on an assignment problem
+    """
+
+    Size = 8
+    Costs = np.random.default_rng(0).random((Size,Size))
+    Swaps = np.array([(i,j) for i in range(Size) for j in range(i+1,Size)])
+
+    def AssignmentCost(
+            Permutation: np.ndarray,
+        ) -> float:
+        return float(Costs[np.arange(Size),Permutation].sum())
+
+    def ApplySwap(
+            Permutation: np.ndarray,
+            Swap: np.ndarray,
+        ) -> np.ndarray:
+        neighbor = Permutation.copy()
+        neighbor[Swap] = neighbor[Swap[::-1]]
+        return neighbor
+
+    def SwapGain(
+            Permutation: np.ndarray,
+            Moves: np.ndarray,
+        ) -> np.ndarray:
+        i , j = Moves[:,0] , Moves[:,1]
+        return Costs[i,Permutation[j]] + Costs[j,Permutation[i]] - Costs[i,Permutation[i]] - Costs[j,Permutation[j]]
+
+    for move_gain , first_improvement in ((None,False),(SwapGain,False),(SwapGain,True)):
+        MoveTabuSearch = TabuSearchOptimizer(
+                AssignmentCost,
+                lambda: np.arange(Size),
+                lambda Solution , TabuList: MoveNeighborhood(Solution,Swaps,ApplySwap),
+                TabuRepr,
+                MoveGain=move_gain,
+            )
+
+        BestSolution , Snapshots = MoveTabuSearch(iters,**params,FirstImprovement=first_improvement)
+        assert Snapshots[0] > Snapshots[-1]
+        assert np.isclose(AssignmentCost(BestSolution),Snapshots[-1])
+        assert np.array_equal(np.sort(BestSolution),np.arange(Size))
+
+def test_CandidateList():
+    """
+    Function for testing the candidate list strategy of Tabu Search with lazy and sampled neighborhoods
+    """
+
+    def LazyNeighborhood(
+            Solution: np.ndarray,
+            TabuList: list,
+        ):
+        for index in range(Dim):
+            for step in (-1,1):
+                neighbor = Solution.copy()
+                neighbor[index] += step
+                yield neighbor
+
+    for neighborhood , first_improvement in ((LazyNeighborhood,True),(LazyNeighborhood,False),(Neighborhood,True),(Neighborhood,False)):
+        CandidateTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,neighborhood,TabuRepr)
+        BestSolution , Snapshots = CandidateTabuSearch(4*iters,TabuTime=3,CandidateListSize=3,MaxCandidateListSize=2*Dim,FirstImprovement=first_improvement)
+        assert Snapshots[-1] == 0
+
+    FullTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,LazyNeighborhood,TabuRepr,Stopping=StoppingCriteria(TargetFitness=0))
+    FirstTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,LazyNeighborhood,TabuRepr,Stopping=StoppingCriteria(TargetFitness=0))
+    FullTabuSearch(iters,**params)
+    FirstTabuSearch(iters,**params,CandidateListSize=2*Dim,FirstImprovement=True)
+    assert FirstTabuSearch.SearchStopping.Evaluations < FullTabuSearch.SearchStopping.Evaluations
+
+    FirstListTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,Neighborhood,TabuRepr,Stopping=StoppingCriteria(TargetFitness=0))
+    FirstListTabuSearch(iters,**params,FirstImprovement=True)
+    assert FirstListTabuSearch.StopReason == 'TargetFitness'
+    assert FirstListTabuSearch.SearchStopping.Evaluations < FullTabuSearch.SearchStopping.Evaluations
+
+def test_AskTell():
+    """
+    Function for testing that a search of Tabu Search driven by Ask and Tell follows the trajectory of the call
+    """
+
+    def LazyNeighborhood(
+            Solution: np.ndarray,
+            TabuList: list,
+        ):
+        yield from Neighborhood(Solution,TabuList)
+
+    for neighborhood , call_params in ((Neighborhood,{}),(LazyNeighborhood,{'CandidateListSize': 3,'FirstImprovement': True})):
+        BestSolution , Snapshots = TabuSearchOptimizer(ObjFunc,InitSolution,neighborhood,TabuRepr,Aspiration=True)(iters,**params,**call_params)
+
+        AskTellTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,neighborhood,TabuRepr,Aspiration=True)
+        AskTellTabuSearch.Start(iters,**params,**call_params)
+        while not AskTellTabuSearch.Finished:
+            Candidates = AskTellTabuSearch.Ask()
+            AskTellTabuSearch.Tell(Candidates,[ObjFunc(candidate) for candidate in Candidates])
+        AskTellBestSolution , AskTellSnapshots = AskTellTabuSearch.Finish()
+
+        assert np.array_equal(BestSolution,AskTellBestSolution)
+        assert Snapshots == AskTellSnapshots
+
+def test_Checkpoints(tmp_path):
+    """
+    Function for testing that a search of Tabu Search resumed from a checkpoint continues the same trajectory
+    """
+
+    file_name = str(tmp_path/'Checkpoint.npz')
+    CheckpointTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,Neighborhood,TabuRepr,RandomGenerator=0,Checkpoints=CheckpointWriter(file_name,Interval=7))
+    BestSolution , Snapshots = CheckpointTabuSearch(20,TabuTime=3,CandidateListSize=3,MaxCandidateListSize=2*Dim)
+
+    ResumedTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,Neighborhood,TabuRepr,RandomGenerator=1)
+    ResumedBestSolution , ResumedSnapshots = ResumedTabuSearch.Resume(file_name)
+    assert np.array_equal(BestSolution,ResumedBestSolution)
+    assert Snapshots == ResumedSnapshots
+    assert np.array_equal(CheckpointTabuSearch.CurrentSolution,ResumedTabuSearch.CurrentSolution)
+    assert CheckpointTabuSearch.TabuList.Index == ResumedTabuSearch.TabuList.Index
+
+def test_Profiling():
+    """
+    Function for testing the profile of a search of Tabu Search
+    """
+
+    ProfiledTabuSearch = TabuSearchOptimizer(ObjFunc,InitSolution,Neighborhood,TabuRepr,Profiler=Profiler())
+    BestSolution , Snapshots = ProfiledTabuSearch(iters,**params)
+
+    Profile = ProfiledTabuSearch.Profile.ToDict()
+    assert {'Neighborhood','TabuFilter','Evaluation','Update'} <= set(Profile['Phases'])
+    assert Profile['Counters']['Proposed'] == iters*2*Dim
+    assert 0 < Profile['AcceptanceRate'] < 1
+    assert Profile['Evaluations'] == ProfiledTabuSearch.SearchStopping.Evaluations
+
+def test_FitnessCache():
+    """
+    Function for testing the memoization of fitness values in Tabu Search
+    """
+
+    CachedObjFunc = FitnessCache(ObjFunc,MaxSize=1_000)
+    CachedTabuSearch = TabuSearchOptimizer(CachedObjFunc,InitSolution,Neighborhood,TabuRepr)
+
+    BestSolution , Snapshots = CachedTabuSearch(iters,**params)
+    assert Snapshots[-1] == 0
+    assert CachedObjFunc.Hits > 0 and 0 < CachedObjFunc.HitRate < 1
+    assert len(CachedObjFunc) <= 1_000
+
+    SmallCache = FitnessCache(ObjFunc,MaxSize=2,Tolerance=0.5)
+    for solution in (np.zeros(Dim),np.ones(Dim),np.zeros(Dim)+0.1,np.full(Dim,2.0)):
+        SmallCache(solution)
+    assert (SmallCache.Hits , SmallCache.Misses) == (1,3)
+    assert len(SmallCache) == 2